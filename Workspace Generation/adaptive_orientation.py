@@ -0,0 +1,163 @@
+import itertools
+import numpy as np
+from workspace_utils import monomial_basis
+
+def pose_valid_masks(basis, coeff_stack, memory_budget_mb=16):
+    """
+    Sign test of every coefficient set separately.
+
+    Args:
+        basis: Monomial basis of the points (L, 10)
+        coeff_stack: Coefficient matrices of shape (M, 10, 7)
+        memory_budget_mb: Approximate memory limit for one block of polynomial values
+
+    Returns:
+        valid: Boolean array of shape (M, L)
+    """
+    coeff_stack = np.asarray(coeff_stack, dtype=float).reshape(-1, 10, 7)
+    valid = np.empty((len(coeff_stack), len(basis)), dtype=bool)
+    sets_per_chunk = max(1, int(memory_budget_mb * 2**20) // (8 * 7 * max(1, len(basis))))
+    for s0 in range(0, len(coeff_stack), sets_per_chunk):
+        chunk = coeff_stack[s0:s0 + sets_per_chunk]
+        values = (basis @ chunk.transpose(1, 0, 2).reshape(10, -1)).reshape(len(basis), len(chunk), 7)
+        valid[s0:s0 + len(chunk)] = (np.sign(values[:, :, 6:]) * values[:, :, :6] < 0).all(axis=2).T
+    return valid
+
+def lattice_indices(n, stride):
+    """Indices of every stride-th value of an axis of length n, always including the last one."""
+    return np.unique(np.append(np.arange(0, n, stride), n - 1))
+
+def cell_corners(lo, hi):
+    """Distinct index corners of the orientation cell [lo, hi]."""
+    return sorted(set(itertools.product(*zip(lo, hi))))
+
+def split_cell(lo, hi):
+    """Bisect a cell along every axis that spans more than one grid step."""
+    halves = []
+    for a, b in zip(lo, hi):
+        mid = (a + b) // 2
+        halves.append([(a, mid), (mid, b)] if b - a > 1 else [(a, b)])
+    return [tuple(zip(*parts)) for parts in itertools.product(*halves)]
+
+def compute_valid_region_adaptive_orientation(coefficients, pose_axes, x, y, z, validRegion=None, levels=3,
+                                              memory_budget_mb=16, on_level=None):
+    """
+    Intersect the valid regions of an adaptively refined subset of the orientation grid.
+
+    For every position the orientation grid is first sampled every
+    2**levels-th value of each angle axis (the last value included). The
+    cells of this lattice are then bisected, in index space, only where
+    their corner poses eliminate different voxels (the boundary moves
+    across the cell); the poses added by a subdivision are evaluated and
+    ANDed into the running intersection. Refinement of a position stops when a
+    subdivision no longer changes the intersection, when no cell has
+    differing corners or at the grid resolution. Skipped poses are assumed
+    to eliminate nothing their cell corners do not, so the result can
+    contain voxels that a skipped pose would remove.
+
+    Args:
+        coefficients: Callable poses (N, 6) -> coefficient matrices (N, 10, 7)
+        pose_axes: Pose grid axes from create_pose_axes()
+        x, y, z: Grid coordinates (any shape, the same for all three)
+        validRegion: Running mask updated in place (default: all True)
+        levels: Number of bisection levels below the coarse lattice
+        memory_budget_mb: Approximate memory limit for one block of polynomial values
+        on_level: Optional callback(position_index, level, num_poses, num_removed)
+
+    Returns:
+        validRegion: Boolean mask with the shape of x
+        stats: Dict with the evaluated and total pose counts and the evaluated
+               poses per level (summed over positions)
+    """
+    positions, alphas, betas, gammas = pose_axes
+    angles = (np.asarray(alphas, dtype=float), np.asarray(betas, dtype=float), np.asarray(gammas, dtype=float))
+    sizes = tuple(len(a) for a in angles)
+    xf, yf, zf = (np.ravel(a) for a in (x, y, z))
+    if validRegion is None:
+        validRegion = np.ones(np.shape(x), dtype=bool)
+    valid = validRegion.reshape(-1)
+    stats = {'evaluated_poses': 0, 'total_poses': len(positions) * int(np.prod(sizes)),
+             'poses_per_level': [0] * (levels + 1)}
+    if stats['total_poses'] == 0:
+        validRegion[...] = False
+        return validRegion, stats
+
+    stride = 2 ** max(0, levels)
+    for p, position in enumerate(np.asarray(positions, dtype=float).reshape(-1, 3)):
+        if not valid.any():
+            break
+        # Pose masks are stored packed over the voxels that were live when they
+        # were evaluated: masks[t] = (evaluation, packed mask), lives[evaluation]
+        # is the packed live set of that evaluation. Only the masks of corners
+        # of cells that are still refined are kept.
+        masks = {}
+        lives = []
+        evaluated = set()
+
+        def evaluate(indices):
+            """AND the poses of new orientation indices into the mask; returns the number of removed voxels."""
+            new = [t for t in dict.fromkeys(indices) if t not in evaluated]
+            if not new:
+                return 0
+            lives.append(np.packbits(valid))
+            index = np.array(new)
+            poses = np.column_stack((np.tile(position, (len(new), 1)),
+                                     angles[0][index[:, 0]], angles[1][index[:, 1]], angles[2][index[:, 2]]))
+            live = np.flatnonzero(valid)
+            ok = pose_valid_masks(monomial_basis(xf[live], yf[live], zf[live]), coefficients(poses),
+                                  memory_budget_mb)
+            for t, row in zip(new, ok):
+                masks[t] = (len(lives) - 1, np.packbits(row), len(row))
+            evaluated.update(new)
+            keep = ok.all(axis=0)
+            valid[live] = keep
+            return int(len(live) - keep.sum())
+
+        def restrict(t, known, selectors):
+            """Mask of pose t on the voxels that were live at evaluation known."""
+            e, bits, n = masks[t]
+            row = np.unpackbits(bits, count=n).astype(bool)
+            if e == known:
+                return row
+            if (e, known) not in selectors:
+                live = np.unpackbits(lives[e], count=valid.size).astype(bool)
+                selectors[(e, known)] = np.unpackbits(lives[known], count=valid.size).astype(bool)[live]
+            return row[selectors[(e, known)]]
+
+        lattice = [lattice_indices(n, stride) for n in sizes]
+        cells = [tuple(zip(*bounds)) for bounds in itertools.product(
+            *[list(zip(l[:-1], l[1:])) if len(l) > 1 else [(l[0], l[0])] for l in lattice])]
+        count = len(evaluated)
+        removed = evaluate(list(itertools.product(*lattice)))
+        stats['poses_per_level'][0] += len(evaluated) - count
+        if on_level is not None:
+            on_level(p, 0, len(evaluated) - count, removed)
+
+        for level in range(1, levels + 1):
+            if not valid.any():
+                break
+            refine = []
+            selectors = {}
+            for lo, hi in cells:
+                # Compare the corners on the voxels all of them were evaluated on
+                corners = cell_corners(lo, hi)
+                known = max(masks[c][0] for c in corners)
+                first = restrict(corners[0], known, selectors)
+                if any((restrict(c, known, selectors) != first).any() for c in corners[1:]):
+                    refine.append((lo, hi))
+            cells = [child for lo, hi in refine for child in split_cell(lo, hi) if child != (lo, hi)]
+            # Drop the masks of finished cells
+            needed = {c for lo, hi in cells for c in cell_corners(lo, hi)}
+            for t in [t for t in masks if t not in needed]:
+                del masks[t]
+            if not cells:
+                break
+            count = len(evaluated)
+            removed = evaluate(sorted(needed))
+            stats['poses_per_level'][level] += len(evaluated) - count
+            if on_level is not None:
+                on_level(p, level, len(evaluated) - count, removed)
+            if removed == 0:
+                break
+        stats['evaluated_poses'] += len(evaluated)
+    return validRegion, stats
@@ -0,0 +1,237 @@
+import hashlib
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+import numpy as np
+
+# Pose components are rounded to this quantum (rad / m) to form cache keys
+POSE_QUANTUM = 1e-9
+
+# Maximum number of SQL parameters per lookup query
+_QUERY_CHUNK = 500
+
+def config_digest(base_points, ee_points, coefficient_mode):
+    """
+    Content hash of the robot geometry and coefficient method.
+
+    The spatial grid step is not part of the key: coefficients only depend
+    on the robot configuration, the cable and the pose.
+
+    Args:
+        base_points: Base attachment points (3, num_cables)
+        ee_points: End-effector attachment points (3, num_cables)
+        coefficient_mode: Coefficient mode of the analyzer
+
+    Returns:
+        Hex digest string
+    """
+    h = hashlib.sha1()
+    for arr in (base_points, ee_points):
+        arr = np.ascontiguousarray(arr, dtype=float)
+        h.update(str(arr.shape).encode())
+        h.update(arr.tobytes())
+    # 'validate' returns the regression coefficients, and 'surrogate' computes them at its nodes
+    h.update(('regression' if coefficient_mode in ('validate', 'surrogate') else coefficient_mode).encode())
+    return h.hexdigest()
+
+def pose_keys(poses, quantum=POSE_QUANTUM):
+    """
+    Quantized byte keys of a stack of poses.
+
+    Args:
+        poses: Array of shape (N, 6)
+
+    Returns:
+        List of N bytes objects
+    """
+    quantized = np.round(np.asarray(poses, dtype=float) / quantum).astype(np.int64)
+    return [row.tobytes() for row in quantized]
+
+class CoefficientCache:
+    """
+    Two-level cache of (10, 7) coefficient matrices.
+
+    Level 1 is an in-process LRU dictionary, level 2 an optional SQLite file
+    shared between runs and processes. Entries are addressed by the robot
+    configuration digest, the cable index and the quantized pose; both levels
+    are bounded and evict the least recently used entries.
+    """
+
+    def __init__(self, max_entries=100000, cache_dir=None, max_disk_entries=10000000):
+        """
+        Args:
+            max_entries: Capacity of the in-process LRU (0 disables it)
+            cache_dir: Directory of the on-disk store (None disables it)
+            max_disk_entries: Capacity of the on-disk store
+        """
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_entries = max_disk_entries
+        self.memory = OrderedDict()
+        self.hits_memory = 0
+        self.hits_disk = 0
+        self.misses = 0
+        self.evictions_memory = 0
+        self.evictions_disk = 0
+        self._connection = None
+        self._disk_count = None
+
+    def _db(self):
+        """Open the on-disk store on first use (connections are per process)."""
+        if self._connection is None and self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._connection = sqlite3.connect(os.path.join(self.cache_dir, 'coefficients.sqlite'), timeout=60)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS coefficients ("
+                "namespace TEXT, pose BLOB, value BLOB, used INTEGER, "
+                "PRIMARY KEY (namespace, pose)) WITHOUT ROWID"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS coefficients_used ON coefficients (used)")
+            self._connection.commit()
+        return self._connection
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_connection'] = None
+        state['memory'] = OrderedDict()
+        return state
+
+    def lookup(self, namespace, poses):
+        """
+        Look up the coefficient matrices of a batch of poses.
+
+        Args:
+            namespace: Key prefix (configuration digest and cable index)
+            poses: Array of shape (N, 6)
+
+        Returns:
+            coeffs: Array of shape (N, 10, 7); rows of misses are undefined
+            found: Boolean array of shape (N,)
+            keys: Pose keys of the batch (to pass to store())
+        """
+        keys = pose_keys(poses)
+        coeffs = np.empty((len(keys), 10, 7))
+        found = np.zeros(len(keys), dtype=bool)
+
+        for i, key in enumerate(keys):
+            value = self.memory.get((namespace, key))
+            if value is not None:
+                self.memory.move_to_end((namespace, key))
+                coeffs[i] = value
+                found[i] = True
+        self.hits_memory += int(found.sum())
+
+        db = self._db()
+        if db is not None and not found.all():
+            index = {keys[i]: i for i in np.flatnonzero(~found)}
+            pending = list(index)
+            hit_keys = []
+            for c0 in range(0, len(pending), _QUERY_CHUNK):
+                chunk = pending[c0:c0 + _QUERY_CHUNK]
+                rows = db.execute(
+                    f"SELECT pose, value FROM coefficients WHERE namespace = ? AND pose IN ({','.join('?' * len(chunk))})",
+                    [namespace] + chunk
+                ).fetchall()
+                for key, value in rows:
+                    i = index[key]
+                    coeffs[i] = np.frombuffer(value, dtype=float).reshape(10, 7)
+                    found[i] = True
+                    hit_keys.append(key)
+                    self._remember(namespace, key, coeffs[i])
+            if hit_keys:
+                now = time.time_ns()
+                db.executemany("UPDATE coefficients SET used = ? WHERE namespace = ? AND pose = ?",
+                               [(now, namespace, key) for key in hit_keys])
+                db.commit()
+            self.hits_disk += len(hit_keys)
+
+        self.misses += int((~found).sum())
+        return coeffs, found, keys
+
+    def store(self, namespace, keys, coeffs):
+        """
+        Insert computed coefficient matrices.
+
+        Args:
+            namespace: Key prefix (configuration digest and cable index)
+            keys: Pose keys from lookup()
+            coeffs: Array of shape (len(keys), 10, 7)
+        """
+        for key, value in zip(keys, coeffs):
+            self._remember(namespace, key, value)
+
+        db = self._db()
+        if db is not None and len(keys):
+            now = time.time_ns()
+            rows = [(namespace, key, np.ascontiguousarray(value, dtype=float).tobytes(), now)
+                    for key, value in zip(keys, coeffs)]
+            # Only inserted rows add to the count; rows already on disk are overwritten
+            inserted = db.executemany("INSERT OR IGNORE INTO coefficients VALUES (?, ?, ?, ?)", rows).rowcount
+            if inserted < len(rows):
+                db.executemany("UPDATE coefficients SET value = ?, used = ? WHERE namespace = ? AND pose = ?",
+                               [(value, used, ns, key) for ns, key, value, used in rows])
+            if self._disk_count is None:
+                self._disk_count = db.execute("SELECT COUNT(*) FROM coefficients").fetchone()[0]
+            else:
+                self._disk_count += inserted
+            if self._disk_count > self.max_disk_entries:
+                self._disk_count = db.execute("SELECT COUNT(*) FROM coefficients").fetchone()[0]
+                excess = self._disk_count - self.max_disk_entries
+                if excess > 0:
+                    db.execute(
+                        "DELETE FROM coefficients WHERE (namespace, pose) IN "
+                        "(SELECT namespace, pose FROM coefficients ORDER BY used LIMIT ?)", (excess,)
+                    )
+                    self.evictions_disk += excess
+                    self._disk_count -= excess
+            db.commit()
+
+    def _remember(self, namespace, key, value):
+        """Insert into the in-process LRU, evicting the oldest entries."""
+        if self.max_entries <= 0:
+            return
+        self.memory[(namespace, key)] = np.array(value)
+        self.memory.move_to_end((namespace, key))
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+            self.evictions_memory += 1
+
+    def stats(self):
+        """
+        Hit/miss statistics.
+
+        Returns:
+            Dict with memory/disk hits, misses, evictions, hit rate and entry counts
+        """
+        lookups = self.hits_memory + self.hits_disk + self.misses
+        db = self._db()
+        if db is not None and self._disk_count is None:
+            self._disk_count = db.execute("SELECT COUNT(*) FROM coefficients").fetchone()[0]
+        return {
+            'hits_memory': self.hits_memory,
+            'hits_disk': self.hits_disk,
+            'misses': self.misses,
+            'hit_rate': (self.hits_memory + self.hits_disk) / lookups if lookups else 0.0,
+            'evictions_memory': self.evictions_memory,
+            'evictions_disk': self.evictions_disk,
+            'memory_entries': len(self.memory),
+            'disk_entries': self._disk_count,
+        }
+
+    def clear(self):
+        """Drop all entries of both levels and reset the statistics."""
+        self.memory.clear()
+        db = self._db()
+        if db is not None:
+            db.execute("DELETE FROM coefficients")
+            db.commit()
+            self._disk_count = 0
+        self.hits_memory = self.hits_disk = self.misses = 0
+        self.evictions_memory = self.evictions_disk = 0
+
+    def close(self):
+        """Close the on-disk store."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
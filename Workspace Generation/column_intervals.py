@@ -0,0 +1,191 @@
+import numpy as np
+
+class ColumnIntervals:
+    """
+    Run-length representation of a workspace: open z-intervals per (x, y) column.
+
+    Run r covers the open interval (z_start[r], z_end[r]) of column
+    column[r] = i * len(y) + j, i.e. the line (x[i], y[j], z).
+    """
+
+    def __init__(self, x, y, z, column, z_start, z_end):
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        self.z = np.asarray(z)
+        self.column = np.asarray(column, dtype=np.int64)
+        self.z_start = np.asarray(z_start, dtype=float)
+        self.z_end = np.asarray(z_end, dtype=float)
+
+    @property
+    def num_runs(self):
+        return len(self.column)
+
+    def rasterize(self):
+        """
+        Sample the intervals at the grid z values.
+
+        Returns:
+            validRegion: Boolean mask of shape (len(x), len(y), len(z))
+        """
+        num_columns = len(self.x) * len(self.y)
+        k_start = np.searchsorted(self.z, self.z_start, side='right')
+        k_end = np.searchsorted(self.z, self.z_end, side='left')
+        diff = np.zeros((num_columns, len(self.z) + 1), dtype=np.int32)
+        np.add.at(diff, (self.column, k_start), 1)
+        np.add.at(diff, (self.column, k_end), -1)
+        inside = np.cumsum(diff[:, :-1], axis=1) > 0
+        return inside.reshape(len(self.x), len(self.y), len(self.z))
+
+    def intersect(self, other):
+        """
+        Intersection with the intervals of another solve on the same grid.
+
+        Both run lists are disjoint within each column, so an event sweep that
+        counts overlapping runs finds the intersection where the count is 2.
+
+        Returns:
+            ColumnIntervals with the common intervals
+        """
+        n = self.num_runs + other.num_runs
+        column = np.concatenate((self.column, other.column, self.column, other.column))
+        position = np.concatenate((self.z_start, other.z_start, self.z_end, other.z_end))
+        weight = np.concatenate((np.ones(n, dtype=np.int64), -np.ones(n, dtype=np.int64)))
+        order = np.lexsort((weight, position, column))
+        column, position = column[order], position[order]
+        count = np.cumsum(weight[order])
+        k = np.nonzero((count[:-1] == 2) & (position[1:] > position[:-1]))[0]
+        return ColumnIntervals(self.x, self.y, self.z, column[k], position[k], position[k + 1])
+
+    def boundary_points(self):
+        """
+        Exact boundary points of the intervals, clipped to the grid's z range.
+
+        Returns:
+            points: Array of shape (2 * num_runs, 3)
+        """
+        i, j = np.divmod(self.column, len(self.y))
+        z_lo = np.clip(self.z_start, self.z[0], self.z[-1])
+        z_hi = np.clip(self.z_end, self.z[0], self.z[-1])
+        xs = np.concatenate((self.x[i], self.x[i]))
+        ys = np.concatenate((self.y[j], self.y[j]))
+        return np.column_stack((xs, ys, np.concatenate((z_lo, z_hi))))
+
+def column_quadratics(coeff_stack, x, y):
+    """
+    Restrict every polynomial to the z-lines of the (x, y) columns.
+
+    Args:
+        coeff_stack: Coefficient matrices of shape (M, 10, 7)
+        x, y: Column coordinates of shape (C,)
+
+    Returns:
+        a, b, c: Arrays of shape (C, M, 7) with p(x, y, z) = a z^2 + b z + c
+    """
+    x = x[:, None, None]
+    y = y[:, None, None]
+    k = coeff_stack[None]
+    a = np.broadcast_to(k[:, :, 6, :], (x.shape[0],) + k.shape[1:2] + k.shape[3:])
+    b = k[:, :, 3, :] + k[:, :, 8, :]*y + k[:, :, 9, :]*x
+    c = (k[:, :, 0, :] + k[:, :, 1, :]*x + k[:, :, 2, :]*y
+         + k[:, :, 4, :]*x**2 + k[:, :, 5, :]*y**2 + k[:, :, 7, :]*x*y)
+    return a, b, c
+
+def real_roots(a, b, c, z_lo, z_hi):
+    """
+    Real roots of a z^2 + b z + c inside (z_lo, z_hi), computed stably.
+
+    Degenerate (linear) quadratics yield a single root; missing roots are
+    reported as z_hi.
+
+    Returns:
+        roots: Array of shape a.shape + (2,)
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        disc = b*b - 4*a*c
+        sqrt_disc = np.sqrt(np.where(disc >= 0, disc, np.nan))
+        q = -0.5 * (b + np.where(b >= 0, sqrt_disc, -sqrt_disc))
+        r1 = q / a
+        r2 = c / q
+        # Linear case: a == 0 gives r1 = inf and r2 = c / -b, the correct root
+    roots = np.stack((r1, r2), axis=-1)
+    outside = ~((roots > z_lo) & (roots < z_hi))
+    roots[outside] = z_hi
+    return roots
+
+def solve_column_intervals(coeff_stack, x, y, z, memory_budget_mb=16):
+    """
+    Exact allowed z-intervals of every (x, y) column for all coefficient sets.
+
+    Along a column each constraint is a quadratic in z, so its sign changes
+    at no more than two roots. For every pose the roots of det and the six
+    constraints split the column into pieces of constant sign; the allowed
+    pieces are found by testing one point per piece. The allowed intervals of
+    all poses are then intersected with an event sweep (a point is valid when
+    it lies in an allowed interval of every pose).
+
+    Args:
+        coeff_stack: Coefficient matrices of shape (M, 10, 7)
+        x, y, z: Increasing grid axes; z only bounds the search range
+        memory_budget_mb: Approximate memory limit for one block of columns
+
+    Returns:
+        ColumnIntervals with the intersected intervals
+    """
+    coeff_stack = np.asarray(coeff_stack, dtype=float).reshape(-1, 10, 7)
+    x, y, z = np.asarray(x), np.asarray(y), np.asarray(z)
+    num_sets = coeff_stack.shape[0]
+    pad = (z[-1] - z[0]) / (len(z) - 1) if len(z) > 1 else 1.0
+    z_lo, z_hi = z[0] - pad, z[-1] + pad
+
+    xc = np.repeat(x, len(y))
+    yc = np.tile(y, len(x))
+    num_columns = len(xc)
+    if num_sets == 0:
+        return ColumnIntervals(x, y, z, np.empty(0), np.empty(0), np.empty(0))
+
+    # Per column: up to 15 pieces x 7 polynomials per pose, a few arrays of each
+    columns_per_chunk = max(1, int(memory_budget_mb * 2**20) // (8 * 4 * 15 * 7 * num_sets))
+    runs_column, runs_start, runs_end = [], [], []
+
+    for c0 in range(0, num_columns, columns_per_chunk):
+        c1 = min(c0 + columns_per_chunk, num_columns)
+        a, b, c = column_quadratics(coeff_stack, xc[c0:c1], yc[c0:c1])
+
+        # Piece edges of each pose: z_lo, sorted in-range roots of all 7 polynomials, z_hi
+        roots = np.sort(real_roots(a, b, c, z_lo, z_hi).reshape(c1 - c0, num_sets, 14), axis=2)
+        max_roots = int((roots < z_hi).sum(axis=2).max())
+        edges = np.concatenate((np.full((c1 - c0, num_sets, 1), z_lo), roots[:, :, :max_roots],
+                                np.full((c1 - c0, num_sets, 1), z_hi)), axis=2)
+        starts, ends = edges[:, :, :-1], edges[:, :, 1:]
+
+        # Sign test at the midpoint of every piece
+        mid = 0.5 * (starts + ends)[..., None]
+        values = (a[:, :, None, :]*mid + b[:, :, None, :])*mid + c[:, :, None, :]
+        allowed = (np.sign(values[..., 6:]) * values[..., :6] < 0).all(axis=3) & (ends > starts)
+
+        # Keep only the allowed pieces (moved to the front of each pose's list)
+        max_allowed = int(allowed.sum(axis=2).max())
+        if max_allowed == 0:
+            continue
+        front = np.argsort(~allowed, axis=2, kind='stable')[:, :, :max_allowed]
+        allowed = np.take_along_axis(allowed, front, axis=2)
+        starts = np.take_along_axis(starts, front, axis=2)
+        ends = np.take_along_axis(ends, front, axis=2)
+
+        # Event sweep over all poses: +1 entering an allowed piece, -1 leaving it
+        positions = np.concatenate((starts, ends), axis=2).reshape(c1 - c0, -1)
+        weights = np.concatenate((allowed, -allowed.astype(np.int64)), axis=2).astype(np.int64)
+        weights = weights.reshape(c1 - c0, -1)
+        order = np.lexsort((weights, positions), axis=-1)
+        positions = np.take_along_axis(positions, order, axis=1)
+        count = np.cumsum(np.take_along_axis(weights, order, axis=1), axis=1)
+
+        col, k = np.nonzero(count[:, :-1] == num_sets)
+        runs_column.append(col + c0)
+        runs_start.append(positions[col, k])
+        runs_end.append(positions[col, k + 1])
+
+    if not runs_column:
+        return ColumnIntervals(x, y, z, np.empty(0), np.empty(0), np.empty(0))
+    return ColumnIntervals(x, y, z, np.concatenate(runs_column), np.concatenate(runs_start),
+                           np.concatenate(runs_end))
@@ -1,46 +1,166 @@
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from spatial_model_sampling_rref_last_column_3_variables import spatial_model_sampling_rref_last_column_3_variables
-
-def compute_h_i_u_coefficients(Base_Points_, End_Effector_Attachment_Points_, q, col, debug_info=None):
-    delta = np.array([-0.05, 0, 0.05])
-    data = []
-    OA_0 = Base_Points_.copy()
-    for dx in delta:
-        for dy in delta:
-            for dz in delta:
-                Base_Points_ = OA_0.copy()
-                Base_Points_[:, col] += np.array([dx, dy, dz])
-                # Use the RREF-based function for constraints
-                if debug_info is not None:
-                    _, _, _, last_col, determinant = spatial_model_sampling_rref_last_column_3_variables(
-                    Base_Points_, End_Effector_Attachment_Points_, q, debug_info)
-                else:
-                    _, _, _, last_col, determinant = spatial_model_sampling_rref_last_column_3_variables(
-                    Base_Points_, End_Effector_Attachment_Points_, q)
-                # last_col: shape (6,), determinant: scalar
-                constraint_values = np.concatenate((last_col, [determinant]))
-                data.append(np.concatenate((Base_Points_[:, col], constraint_values)))
-    
-    data = np.array(data)
-    # print(f"[DEBUG] Data (shape {data.shape}):\n{np.round(data, 9)}")
-    # input("Press Enter to continue to the next pose...")
-    
-    X = data[:, :3]
-    Y = data[:, 3:]
-
-    X_poly = np.column_stack([
+from spatial_model_sampling_rref_last_column_3_variables import spatial_model_sampling_rref_last_column_3_variables_batched
+
+# Perturbations of the analyzed base point (same dx, dy, dz loop order as the original sampling)
+delta = np.array([-0.05, 0, 0.05])
+DELTA_GRID = np.array([[dx, dy, dz] for dx in delta for dy in delta for dz in delta])
+
+def quadratic_design_matrix(X):
+    """
+    Quadratic monomial basis [1, x, y, z, x^2, y^2, z^2, xy, yz, zx] of points X (n, 3).
+    """
+    return np.column_stack([
         np.ones(X.shape[0]),
         X,
         X[:, 0]**2, X[:, 1]**2, X[:, 2]**2,
         X[:, 0]*X[:, 1], X[:, 1]*X[:, 2], X[:, 2]*X[:, 0]
     ])
 
-    coefficients = []
-    for i in range(Y.shape[1]):
-        reg = LinearRegression(fit_intercept=False)
-        reg.fit(X_poly, Y[:, i])
-        coefficients.append(reg.coef_)
-    coefficients = np.array(coefficients).T  # (10,7)
-   
-    return coefficients 
\ No newline at end of file
+# Minimal stencil for the analytic mode: the anchor plus one step along each axis
+ANALYTIC_STEP = 0.05
+ANALYTIC_OFFSETS = np.vstack((np.zeros(3), ANALYTIC_STEP * np.eye(3)))
+
+# The design grid is the same for every pose, so its pseudo-inverse (in
+# coordinates centered on the analyzed base point) is computed once.
+CENTERED_PINV = np.linalg.pinv(quadratic_design_matrix(DELTA_GRID))  # (10, 27)
+
+def centered_to_absolute(coefficients, origin):
+    """
+    Re-expand quadratic coefficients fitted in u = X - origin as coefficients in X.
+
+    Args:
+        coefficients: Array of shape (..., 10, k) in the centered basis
+        origin: Center point (3,)
+
+    Returns:
+        Array of shape (..., 10, k) in the absolute basis
+    """
+    k0, kx, ky, kz, kxx, kyy, kzz, kxy, kyz, kzx = np.moveaxis(coefficients, -2, 0)
+    x0, y0, z0 = origin
+    out = np.array(coefficients, dtype=float, copy=True)
+    out[..., 0, :] = (k0 - kx*x0 - ky*y0 - kz*z0 + kxx*x0**2 + kyy*y0**2 + kzz*z0**2
+                      + kxy*x0*y0 + kyz*y0*z0 + kzx*z0*x0)
+    out[..., 1, :] = kx - 2*kxx*x0 - kxy*y0 - kzx*z0
+    out[..., 2, :] = ky - 2*kyy*y0 - kxy*x0 - kyz*z0
+    out[..., 3, :] = kz - 2*kzz*z0 - kyz*y0 - kzx*x0
+    return out
+
+def sample_h_i_u_constraints(Base_Points_, End_Effector_Attachment_Points_, q, col, offsets=DELTA_GRID):
+    """
+    Evaluate the constraint model on a perturbation grid for a stack of poses.
+
+    Args:
+        Base_Points_: Base points (3, 7)
+        End_Effector_Attachment_Points_: End-effector points (3, 7)
+        q: Poses of shape (N, 6) or a single pose (6,)
+        col: Index of the perturbed base point (cable)
+        offsets: Perturbations of the base point (S, 3), the 27-point grid by default
+
+    Returns:
+        X: Perturbed base point coordinates (S, 3)
+        Y: Constraint values [last_col (6), determinant] of shape (N, S, 7)
+    """
+    q = np.atleast_2d(q)
+    n = q.shape[0]
+    num_samples = offsets.shape[0]
+
+    X = Base_Points_[:, col] + offsets
+    perturbed = np.repeat(np.asarray(Base_Points_, dtype=float)[None], num_samples, axis=0)
+    perturbed[:, :, col] = X
+    perturbed = np.broadcast_to(perturbed, (n,) + perturbed.shape).reshape(-1, *perturbed.shape[1:])
+    q_rep = np.repeat(q, num_samples, axis=0)
+
+    _, _, _, last_col, determinant = spatial_model_sampling_rref_last_column_3_variables_batched(
+        perturbed, End_Effector_Attachment_Points_, q_rep)
+    Y = np.concatenate((last_col, determinant[:, None]), axis=1).reshape(n, num_samples, 7)
+    return X, Y
+
+def fit_h_i_u_coefficients(X, Y):
+    """
+    Least-squares quadratic fit of sampled constraint values on the design grid.
+
+    All seven outputs (and any number of poses) are fitted with one matrix
+    multiply against the precomputed pseudo-inverse.
+
+    Args:
+        X: Perturbed base point coordinates (27, 3), i.e. origin + DELTA_GRID
+        Y: Constraint values of shape (27, 7) or (N, 27, 7)
+
+    Returns:
+        coefficients: Array of shape (10, 7) or (N, 10, 7) in absolute coordinates
+    """
+    origin = X[DELTA_GRID.shape[0] // 2]
+    return centered_to_absolute(CENTERED_PINV @ Y, origin)
+
+def compute_h_i_u_coefficients(Base_Points_, End_Effector_Attachment_Points_, q, col):
+    """
+    Compute the (10, 7) coefficient matrix of a single pose.
+
+    Args:
+        Base_Points_: Base points (3, 7)
+        End_Effector_Attachment_Points_: End-effector points (3, 7)
+        q: Pose (6,)
+        col: Index of the perturbed base point (cable)
+
+    Returns:
+        coefficients: Array of shape (10, 7)
+    """
+    X, Y = sample_h_i_u_constraints(Base_Points_, End_Effector_Attachment_Points_, q, col)
+    # print(f"[DEBUG] Data (shape {Y.shape}):\n{np.round(Y[0], 9)}")
+    return fit_h_i_u_coefficients(X, Y[0])
+
+def compute_h_i_u_coefficients_batched(Base_Points_, End_Effector_Attachment_Points_, q_batch, col, kernels=None):
+    """
+    Compute the (10, 7) coefficient matrices for a stack of poses.
+
+    Args:
+        Base_Points_: Base points (3, 7)
+        End_Effector_Attachment_Points_: End-effector points (3, 7)
+        q_batch: Poses of shape (N, 6)
+        col: Index of the perturbed base point (cable)
+        kernels: Optional PoseKernels of q_batch; the samples are then
+                 column-replacement updates instead of full model evaluations
+
+    Returns:
+        coefficients: Array of shape (N, 10, 7)
+    """
+    if kernels is not None:
+        X, Y = kernels.sample(col, DELTA_GRID)
+    else:
+        X, Y = sample_h_i_u_constraints(Base_Points_, End_Effector_Attachment_Points_, q_batch, col)
+    return fit_h_i_u_coefficients(X, Y)
+
+def compute_h_i_u_coefficients_analytic_batched(Base_Points_, End_Effector_Attachment_Points_, q_batch, col,
+                                                kernels=None):
+    """
+    Exact coefficient matrices from the minimum number of model evaluations.
+
+    Every column of L_wo_norm is linear in its base anchor, so det(A6) and
+    each entry of adj(A6) @ b6 are affine in Base_Points_[:, col]. Four
+    evaluations (the anchor and one step along each axis) therefore
+    determine the coefficients exactly; the quadratic terms are zero.
+
+    Args:
+        Base_Points_: Base points (3, 7)
+        End_Effector_Attachment_Points_: End-effector points (3, 7)
+        q_batch: Poses of shape (N, 6)
+        col: Index of the perturbed base point (cable)
+        kernels: Optional PoseKernels of q_batch (see compute_h_i_u_coefficients_batched)
+
+    Returns:
+        coefficients: Array of shape (N, 10, 7), same layout as compute_h_i_u_coefficients
+    """
+    if kernels is not None:
+        X, Y = kernels.sample(col, ANALYTIC_OFFSETS)
+    else:
+        X, Y = sample_h_i_u_constraints(Base_Points_, End_Effector_Attachment_Points_, q_batch, col,
+                                        offsets=ANALYTIC_OFFSETS)
+    gradient = (Y[:, 1:, :] - Y[:, :1, :]) / ANALYTIC_STEP  # (N, 3, 7)
+    coefficients = np.zeros((Y.shape[0], 10, 7))
+    coefficients[:, 0, :] = Y[:, 0, :] - np.einsum('k,nkj->nj', X[0], gradient)
+    coefficients[:, 1:4, :] = gradient
+    return coefficients
+
+def compute_h_i_u_coefficients_analytic(Base_Points_, End_Effector_Attachment_Points_, q, col):
+    return compute_h_i_u_coefficients_analytic_batched(
+        Base_Points_, End_Effector_Attachment_Points_, np.atleast_2d(q), col)[0]
@@ -93,6 +93,32 @@ def example_parameter_variation():
         data_manager = WorkspaceDataManager()
         data_manager.save_workspace_data(intersection_points_sets, f"workspace_step_{step}.npz")
 
+def example_kernel_verification():
+    """Example of checking the fast adjugate/solve and pose kernels against their references."""
+    print("\n=== Kernel Verification Example ===")
+    
+    from spatial_model_sampling_rref_last_column_3_variables import verify_adjugate_solve
+    
+    max_error = verify_adjugate_solve(num_samples=200)
+    print(f"  adjugate_solve matches adjugate() within {max_error:.3e}")
+    
+    from pose_kernels import verify_pose_kernels
+    
+    max_error = verify_pose_kernels(num_poses=200)
+    print(f"  Pose kernel updates match the full model within {max_error:.3e}")
+
+def example_sign_kernel_benchmark():
+    """Example of benchmarking the fused sign-test kernels against the eval_poly loop."""
+    print("\n=== Sign-Test Kernel Benchmark Example ===")
+    
+    from sign_kernel import benchmark_sign_kernels
+    
+    results = benchmark_sign_kernels(num_points=51**3, num_sets=64)
+    reference = results['reference']
+    for name, result in results.items():
+        print(f"  {name}: {reference['time'] / result['time']:.1f}x faster, "
+              f"{reference['traffic_mb'] / result['traffic_mb']:.0f}x less modeled memory traffic")
+
 def main():
     """Main example function."""
     print("Cable Robot Workspace Analysis - Modular Example")
@@ -105,6 +131,12 @@ def main():
         # Load and visualize saved data
         example_load_and_visualize()
         
+        # Check the fast adjugate/solve kernel against the reference implementation
+        example_kernel_verification()
+        
+        # Compare the fused sign-test kernels with the unfused loop
+        example_sign_kernel_benchmark()
+        
         # Parameter variation example (commented out to avoid long execution)
         # example_parameter_variation()
         
@@ -4,9 +4,36 @@ from tkinter import messagebox, filedialog
 import numpy as np
 import matplotlib.pyplot as plt
 from workspace_analyzer import WorkspaceAnalyzer
+from position_sampling import POSITION_SAMPLERS
 from workspace_visualizer import WorkspaceVisualizer
 from workspace_data_manager import WorkspaceDataManager
 
+# Input fields and their defaults; x/y/z bound the sampled end-effector positions
+FIELD_LABELS = ['x_min', 'x_max', 'y_min', 'y_max', 'z_min', 'z_max', 'alpha_min', 'alpha_max', 'beta_min', 'beta_max', 'gamma_min', 'gamma_max']
+FIELD_DEFAULTS = ['0.4', '0.6', '0.4', '0.6', '0.4', '0.6', '0', '0', '0', '0', '0', '0']
+POSITION_LABELS = FIELD_LABELS[:6]
+
+# Optional bounds of one anchor grid shared by all cables; empty fields keep the
+# +-0.5 cube around each cable's base point
+SPATIAL_LABELS = ['grid_x_min', 'grid_x_max', 'grid_y_min', 'grid_y_max', 'grid_z_min', 'grid_z_max']
+
+def parse_spatial_bounds(values):
+    """
+    Spatial grid bounds from the six anchor grid fields.
+    
+    Args:
+        values: Strings of the SPATIAL_LABELS fields
+        
+    Returns:
+        (x_min, x_max, y_min, y_max, z_min, z_max), or None when every field is empty
+    """
+    values = [v.strip() for v in values]
+    if not any(values):
+        return None
+    if not all(values):
+        raise ValueError('Fill in all anchor grid bounds or none of them.')
+    return tuple(float(v) for v in values)
+
 class WorkspaceGUI:
     def __init__(self, root):
         self.root = root
@@ -22,9 +49,9 @@ class WorkspaceGUI:
     def create_widgets(self):
         frame = ttk.Frame(self.root, padding=10)
         frame.grid(row=0, column=0, sticky='nsew')
-        labels = ['x_min', 'x_max', 'y_min', 'y_max', 'z_min', 'z_max', 'alpha_min', 'alpha_max', 'beta_min', 'beta_max', 'gamma_min', 'gamma_max']
+        labels = FIELD_LABELS + SPATIAL_LABELS
         self.entries = {}
-        default_vals = ['0.4', '0.6', '0.4', '0.6', '0.4', '0.6', '0', '0', '0', '0', '0', '0']
+        default_vals = FIELD_DEFAULTS + [''] * len(SPATIAL_LABELS)
         for i, label in enumerate(labels):
             ttk.Label(frame, text=label).grid(row=i, column=0, sticky='e')
             entry = ttk.Entry(frame)
@@ -36,15 +63,30 @@ class WorkspaceGUI:
         self.density_entry = ttk.Entry(frame)
         self.density_entry.insert(0, '0.02')  # Default to 0.02 to match MATLAB
         self.density_entry.grid(row=len(labels), column=1)
+        # Angular step of the orientation grid; empty uses the grid step
+        ttk.Label(frame, text='Orientation Step').grid(row=len(labels)+1, column=0, sticky='e')
+        self.orientation_step_entry = ttk.Entry(frame)
+        self.orientation_step_entry.grid(row=len(labels)+1, column=1)
+        # End-effector position sampler and its number of positions
+        ttk.Label(frame, text='Position Sampling').grid(row=len(labels)+2, column=0, sticky='e')
+        self.position_sampling_box = ttk.Combobox(frame, values=POSITION_SAMPLERS, state='readonly')
+        self.position_sampling_box.set('fixed')
+        self.position_sampling_box.grid(row=len(labels)+2, column=1)
+        ttk.Label(frame, text='Position Samples').grid(row=len(labels)+3, column=0, sticky='e')
+        self.position_samples_entry = ttk.Entry(frame)
+        self.position_samples_entry.insert(0, '8')
+        self.position_samples_entry.grid(row=len(labels)+3, column=1)
         run_btn = ttk.Button(frame, text='Run Analysis', command=self.run_analysis)
-        run_btn.grid(row=len(labels)+1, column=0, columnspan=2, pady=10)
+        run_btn.grid(row=len(labels)+4, column=0, columnspan=2, pady=10)
         compare_btn = ttk.Button(frame, text='Compare with MATLAB', command=self.compare_with_matlab)
-        compare_btn.grid(row=len(labels)+2, column=0, columnspan=2, pady=10)
+        compare_btn.grid(row=len(labels)+5, column=0, columnspan=2, pady=10)
 
     def run_analysis(self):
         """Run workspace analysis using the modular structure."""
         try:
             # Extract parameters from GUI
+            spatial_bounds = parse_spatial_bounds([self.entries[label].get() for label in SPATIAL_LABELS])
+            position_bounds = tuple(float(self.entries[label].get()) for label in POSITION_LABELS)
             alpha_min = float(self.entries['alpha_min'].get())
             alpha_max = float(self.entries['alpha_max'].get())
             beta_min = float(self.entries['beta_min'].get())
@@ -52,13 +94,21 @@ class WorkspaceGUI:
             gamma_min = float(self.entries['gamma_min'].get())
             gamma_max = float(self.entries['gamma_max'].get())
             step = float(self.density_entry.get())
+            orientation_step = self.orientation_step_entry.get().strip()
+            self.analyzer.orientation_step = float(orientation_step) if orientation_step else None
+            self.analyzer.position_sampling = self.position_sampling_box.get()
+            self.analyzer.position_samples = int(self.position_samples_entry.get())
         except ValueError:
             messagebox.showerror('Input Error', 'Please enter valid numbers for all fields.')
             return
         
-        # Run analysis using the analyzer module (optimized version)
+        # Run analysis using the analyzer module (optimized version), on the anchor
+        # grid bounds when given; widening a range only applies the added poses to
+        # the masks of the previous run
+        self.analyzer.spatial_bounds = spatial_bounds
         self.intersection_points_sets, total_time = self.analyzer.run_full_analysis(
-            alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max, step, use_optimized=True
+            alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max, step, use_optimized=True,
+            incremental=True, position_bounds=position_bounds
         )
         
         # Visualize results using the visualizer module
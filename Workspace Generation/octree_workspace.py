@@ -0,0 +1,162 @@
+import numpy as np
+from workspace_utils import compute_valid_points
+
+# Margin (relative to sum |c_k| |m_k|) that covers the rounding of eval_poly and
+# of the interval bounds themselves, so proven signs hold for the evaluated values
+ROUNDING_MARGIN = 64 * np.finfo(float).eps
+
+def monomial_bounds(lo, hi):
+    """
+    Bounds of the quadratic monomials over axis-aligned boxes.
+
+    Args:
+        lo, hi: Box corners of shape (C, 3) with lo <= hi
+
+    Returns:
+        lower, upper: Arrays of shape (C, 10) bounding
+                      [1, x, y, z, x^2, y^2, z^2, xy, yz, zx] over each box
+    """
+    lower = np.empty((lo.shape[0], 10))
+    upper = np.empty((lo.shape[0], 10))
+    lower[:, 0] = upper[:, 0] = 1.0
+    lower[:, 1:4] = lo
+    upper[:, 1:4] = hi
+
+    # Squares: zero is the minimum when the interval straddles it
+    sq_lo, sq_hi = lo**2, hi**2
+    upper[:, 4:7] = np.maximum(sq_lo, sq_hi)
+    lower[:, 4:7] = np.where((lo <= 0) & (hi >= 0), 0.0, np.minimum(sq_lo, sq_hi))
+
+    # Products: extremes are attained at the corners
+    for col, (a, b) in zip(range(7, 10), ((0, 1), (1, 2), (2, 0))):
+        corners = np.stack((lo[:, a]*lo[:, b], lo[:, a]*hi[:, b], hi[:, a]*lo[:, b], hi[:, a]*hi[:, b]))
+        lower[:, col] = corners.min(axis=0)
+        upper[:, col] = corners.max(axis=0)
+    return lower, upper
+
+def classify_cells(coeff_stack, lo, hi):
+    """
+    Prove the sign test over boxes for every coefficient set with interval bounds.
+
+    Args:
+        coeff_stack: Coefficient matrices of shape (M, 10, 7)
+        lo, hi: Box corners of shape (C, 3)
+
+    Returns:
+        inside: Boolean (C,), every point of the box is valid for every set
+        outside: Boolean (C,), every point of the box is invalid for some set
+    """
+    num_sets = coeff_stack.shape[0]
+    C = coeff_stack.transpose(1, 0, 2).reshape(10, 7 * num_sets)
+    C_pos, C_neg = np.maximum(C, 0), np.minimum(C, 0)
+    m_lo, m_hi = monomial_bounds(lo, hi)
+
+    shape = (lo.shape[0], num_sets, 7)
+    lower = (m_lo @ C_pos + m_hi @ C_neg).reshape(shape)
+    upper = (m_hi @ C_pos + m_lo @ C_neg).reshape(shape)
+    margin = (ROUNDING_MARGIN * (np.maximum(np.abs(m_lo), np.abs(m_hi)) @ np.abs(C))).reshape(shape)
+
+    positive = lower > margin
+    negative = upper < -margin
+    det_pos, det_neg = positive[:, :, 6], negative[:, :, 6]
+    h_pos, h_neg = positive[:, :, :6], negative[:, :, :6]
+
+    inside_set = (det_pos & h_neg.all(axis=2)) | (det_neg & h_pos.all(axis=2))
+    outside_set = (det_pos & h_pos.any(axis=2)) | (det_neg & h_neg.any(axis=2))
+    return inside_set.all(axis=1), outside_set.any(axis=1)
+
+def subdivide(lo_idx, hi_idx):
+    """
+    Split index boxes [lo, hi) into up to 8 children along every axis longer than one.
+
+    Args:
+        lo_idx, hi_idx: Integer box bounds of shape (C, 3)
+
+    Returns:
+        lo_idx, hi_idx: Bounds of the non-empty children
+    """
+    mid = lo_idx + (hi_idx - lo_idx + 1) // 2
+    children_lo, children_hi = [], []
+    for octant in np.ndindex(2, 2, 2):
+        upper_half = np.array(octant, dtype=bool)
+        children_lo.append(np.where(upper_half, mid, lo_idx))
+        children_hi.append(np.where(upper_half, hi_idx, mid))
+    lo_idx, hi_idx = np.concatenate(children_lo), np.concatenate(children_hi)
+    keep = (hi_idx > lo_idx).all(axis=1)
+    return lo_idx[keep], hi_idx[keep]
+
+def cell_voxels(lo_idx, hi_idx, max_size):
+    """
+    Multi-indices of all voxels in a set of index boxes no larger than max_size.
+
+    Returns:
+        Array of shape (P, 3)
+    """
+    offsets = np.indices(max_size).reshape(3, -1).T
+    idx = lo_idx[:, None, :] + offsets[None, :, :]
+    return idx[(idx < hi_idx[:, None, :]).all(axis=2)]
+
+def compute_valid_region_octree(coeff_stack, x, y, z, leaf_size=4, memory_budget_mb=16):
+    """
+    Compute the valid region with adaptive octree refinement.
+
+    Cells of the index grid are classified with interval bounds of every
+    constraint quadric. Fully inside cells are filled and fully outside cells
+    are dropped without sampling; only cells whose sign is uncertain are
+    subdivided. Uncertain cells of at most leaf_size voxels per axis are
+    evaluated point by point with the same arithmetic as the dense loop, so
+    the result equals the dense-grid valid region.
+
+    Args:
+        coeff_stack: Coefficient matrices of shape (M, 10, 7)
+        x, y, z: Increasing grid axes
+        leaf_size: Largest cell edge (in voxels) that is evaluated directly
+        memory_budget_mb: Approximate memory limit for one block of interval bounds
+
+    Returns:
+        validRegion: Boolean mask of shape (len(x), len(y), len(z))
+        stats: Dict with the number of inside/outside cells and sampled voxels
+    """
+    coeff_stack = np.asarray(coeff_stack, dtype=float).reshape(-1, 10, 7)
+    axes = (np.asarray(x), np.asarray(y), np.asarray(z))
+    shape = tuple(len(a) for a in axes)
+    validRegion = np.zeros(shape, dtype=bool)
+    stats = {'inside_cells': 0, 'outside_cells': 0, 'sampled_voxels': 0, 'levels': 0}
+    if coeff_stack.shape[0] == 0 or 0 in shape:
+        return validRegion, stats
+
+    lo_idx = np.zeros((1, 3), dtype=np.int64)
+    hi_idx = np.array([shape], dtype=np.int64)
+    cells_per_chunk = max(1, int(memory_budget_mb * 2**20) // (8 * 8 * 7 * coeff_stack.shape[0]))
+    leaves_lo, leaves_hi = [], []
+
+    while len(lo_idx):
+        stats['levels'] += 1
+        inside = np.zeros(len(lo_idx), dtype=bool)
+        outside = np.zeros(len(lo_idx), dtype=bool)
+        for c0 in range(0, len(lo_idx), cells_per_chunk):
+            c1 = min(c0 + cells_per_chunk, len(lo_idx))
+            lo = np.column_stack([a[lo_idx[c0:c1, d]] for d, a in enumerate(axes)])
+            hi = np.column_stack([a[hi_idx[c0:c1, d] - 1] for d, a in enumerate(axes)])
+            inside[c0:c1], outside[c0:c1] = classify_cells(coeff_stack, lo, hi)
+
+        for (i0, j0, k0), (i1, j1, k1) in zip(lo_idx[inside], hi_idx[inside]):
+            validRegion[i0:i1, j0:j1, k0:k1] = True
+        stats['inside_cells'] += int(inside.sum())
+        stats['outside_cells'] += int(outside.sum())
+
+        uncertain = ~(inside | outside)
+        lo_idx, hi_idx = lo_idx[uncertain], hi_idx[uncertain]
+        is_leaf = (hi_idx - lo_idx).max(axis=1) <= leaf_size
+        leaves_lo.append(lo_idx[is_leaf])
+        leaves_hi.append(hi_idx[is_leaf])
+        lo_idx, hi_idx = subdivide(lo_idx[~is_leaf], hi_idx[~is_leaf])
+
+    # Sample the voxels of the uncertain leaf cells exactly
+    leaf_voxels = cell_voxels(np.concatenate(leaves_lo), np.concatenate(leaves_hi), (leaf_size,) * 3)
+    stats['sampled_voxels'] = len(leaf_voxels)
+    xs, ys, zs = (a[leaf_voxels[:, d]] for d, a in enumerate(axes))
+    valid = compute_valid_points(coeff_stack, xs, ys, zs, memory_budget_mb)
+    validRegion[tuple(leaf_voxels[valid].T)] = True
+
+    return validRegion, stats
@@ -0,0 +1,238 @@
+import numpy as np
+from coefficient_cache import pose_keys
+
+def lobatto_nodes(lo, hi, n):
+    """
+    Chebyshev-Lobatto points on [lo, hi].
+
+    The points of n nodes are the even points of 2n - 1 nodes (bit for bit),
+    so refining an axis reuses every exact evaluation.
+    """
+    if n == 1:
+        return np.array([0.5 * (lo + hi)])
+    return 0.5 * (lo + hi) - 0.5 * (hi - lo) * np.cos(np.pi * np.arange(n) / (n - 1))
+
+def lagrange_matrix(nodes, t):
+    """
+    Values of the Lagrange basis polynomials of nodes at the points t (barycentric form).
+
+    Args:
+        nodes: Distinct interpolation nodes (n,)
+        t: Evaluation points (m,)
+
+    Returns:
+        L: Array of shape (m, n); rows of points equal to a node are unit vectors
+    """
+    nodes = np.asarray(nodes, dtype=float)
+    t = np.asarray(t, dtype=float)
+    if len(nodes) == 1:
+        return np.ones((len(t), 1))
+    gaps = nodes[:, None] - nodes[None, :]
+    np.fill_diagonal(gaps, 1.0)
+    weights = 1.0 / np.prod(gaps, axis=1)
+    diff = t[:, None] - nodes[None, :]
+    on_node = diff == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = weights / diff
+        L = terms / terms.sum(axis=1, keepdims=True)
+    rows = on_node.any(axis=1)
+    L[rows] = on_node[rows]
+    return L
+
+class OrientationSurrogate:
+    """
+    Tensor-product interpolant of the coefficient matrices over the orientation box.
+
+    For every position of the pose grid, the (10, 7) coefficients are
+    interpolated in (alpha, beta, gamma) from exact values at Chebyshev-
+    Lobatto nodes. An axis whose grid has no more values than nodes uses the
+    grid values themselves as nodes and is reproduced exactly. Positions are
+    fitted on first use and the fit is kept for every later batch, so a
+    streamed analysis that stops early only pays for the positions it
+    reached, and no position is fitted twice.
+
+    The node counts of a position are chosen adaptively. The error of an
+    axis is estimated on random node lines along that axis, at the points
+    that a refinement of the axis would add (the midpoints, in angle, of the
+    current nodes). Axes whose error exceeds tol are refined, and the exact
+    values computed for the estimate become nodes. A final check at random
+    grid orientations, off the nodes on every axis, refines all interpolated
+    axes while it fails. Errors are relative to the largest coefficient of
+    each polynomial at the position.
+    """
+
+    def __init__(self, exact_coefficients, pose_axes, tol=1e-9, initial_nodes=3, max_nodes=33,
+                 lines=8, check_points=16, seed=0):
+        """
+        Args:
+            exact_coefficients: Callable poses (N, 6) -> coefficients (N, 10, 7)
+            pose_axes: Pose grid axes from create_pose_axes(); the orientation axes define
+                the interpolation box, positions are fitted as they are reached
+            tol: Target relative interpolation error
+            initial_nodes: Initial number of nodes per axis
+            max_nodes: Largest number of nodes per axis
+            lines: Number of random node lines of the error estimate of an axis
+            check_points: Number of random grid orientations of the final check
+            seed: Random seed of the error estimates
+        """
+        self.exact_coefficients = exact_coefficients
+        self.axes = tuple(np.asarray(a, dtype=float) for a in pose_axes[1:])
+        self.tol = tol
+        self.initial_nodes = initial_nodes
+        self.max_nodes = max_nodes
+        self.lines = lines
+        self.check_points = check_points
+        self.rng = np.random.default_rng(seed)
+        self.num_exact = 0
+        self.fits = {}
+
+    @property
+    def max_error(self):
+        """Largest estimated error of the fitted positions."""
+        return max((fit['max_error'] for fit in self.fits.values()), default=0.0)
+
+    @property
+    def node_counts(self):
+        """Node counts per axis of every fitted position (keyed by position)."""
+        return {fit['position']: fit['node_counts'] for fit in self.fits.values()}
+
+    def _exact_axis(self, d, n):
+        """Whether n nodes on axis d are the grid values themselves."""
+        return n >= len(self.axes[d])
+
+    def _nodes(self, d, n):
+        """Nodes of axis d for n nodes."""
+        axis = self.axes[d]
+        if self._exact_axis(d, n):
+            return axis
+        return lobatto_nodes(axis[0], axis[-1], n)
+
+    def _exact_orientations(self, position, orientations):
+        """Exact coefficients of a position (3,) at orientations (N, 3)."""
+        poses = np.hstack((np.tile(position, (len(orientations), 1)), orientations))
+        self.num_exact += len(poses)
+        return self.exact_coefficients(poses)
+
+    def _fit(self, key, position):
+        """Adaptively choose the nodes of a position and store its node values under key."""
+        exact = {}
+
+        def exact_points(orientations):
+            # All missing orientations of a request go to the exact model in one call
+            keys = pose_keys(orientations)
+            first = {}
+            for i, k in enumerate(keys):
+                if k not in exact and k not in first:
+                    first[k] = i
+            missing = list(first.values())
+            if missing:
+                for i, value in zip(missing, self._exact_orientations(position, orientations[missing])):
+                    exact[keys[i]] = value
+            return np.array([exact[k] for k in keys])
+
+        def exact_grid(alphas, betas, gammas):
+            orientations = np.stack(np.meshgrid(alphas, betas, gammas, indexing='ij'), axis=-1).reshape(-1, 3)
+            return exact_points(orientations).reshape(len(alphas), len(betas), len(gammas), 10, 7)
+
+        counts = [min(len(a), self.initial_nodes) for a in self.axes]
+        while True:
+            nodes = [self._nodes(d, counts[d]) for d in range(3)]
+            values = exact_grid(*nodes)
+            scale = np.abs(values).max(axis=(0, 1, 2, 3))
+            scale[scale == 0] = 1.0
+            fit = {'nodes': nodes, 'values': values.reshape(-1), 'scale': scale,
+                   'node_counts': tuple(counts), 'max_error': 0.0}
+
+            refine = [self._axis_error(d, nodes, values, scale, exact_points) > self.tol for d in range(3)]
+            if not any(refine):
+                fit['max_error'] = self._check(position, fit)
+                if fit['max_error'] <= self.tol:
+                    break
+                refine = [True] * 3
+            grown = [min(2 * n - 1, self.max_nodes, len(a)) if r and not self._exact_axis(d, n) else n
+                     for d, (n, r, a) in enumerate(zip(counts, refine, self.axes))]
+            if grown == counts:
+                fit['max_error'] = self._check(position, fit)
+                print(f"[WARNING] Orientation surrogate reached {self.max_nodes} nodes per axis "
+                      f"with estimated error {fit['max_error']:.3e} (tol {self.tol:.0e})")
+                break
+            counts = grown
+        fit['position'] = tuple(position)
+        self.fits[key] = fit
+        return fit
+
+    def _axis_error(self, d, nodes, values, scale, exact_points):
+        """Estimated relative error of interpolating along axis d with the current nodes."""
+        n = len(nodes[d])
+        if self._exact_axis(d, n):
+            return 0.0
+        midpoints = lobatto_nodes(self.axes[d][0], self.axes[d][-1], 2 * n - 1)[1::2]
+        L = lagrange_matrix(nodes[d], midpoints)
+
+        # Random lines along axis d through the node grid, evaluated exactly in one call
+        indices = []
+        for _ in range(self.lines):
+            index = [self.rng.integers(len(nodes[k])) for k in range(3)]
+            index[d] = slice(None)
+            indices.append(tuple(index))
+        orientations = np.empty((self.lines, len(midpoints), 3))
+        for i, index in enumerate(indices):
+            for k in range(3):
+                orientations[i, :, k] = midpoints if k == d else nodes[k][index[k]]
+        exact = exact_points(orientations.reshape(-1, 3)).reshape(self.lines, len(midpoints), 10, 7)
+        lines = np.stack([values[index].reshape(n, 70) for index in indices])
+        return (np.abs((L @ lines).reshape(exact.shape) - exact) / scale).max()
+
+    def _check(self, position, fit):
+        """Relative error of a fit at random grid orientations against exact coefficients."""
+        if self.check_points <= 0:
+            return 0.0
+        orientations = np.column_stack([a[self.rng.integers(len(a), size=self.check_points)] for a in self.axes])
+        exact = self._exact_orientations(position, orientations)
+        return (np.abs(self._interpolate(fit, orientations) - exact) / fit['scale']).max()
+
+    def _interpolate(self, fit, orientations):
+        """
+        Interpolated coefficients of one position at orientations (N, 3).
+
+        The interpolation is contracted one axis at a time: once per distinct
+        alpha, once per distinct (alpha, beta) and once per orientation, which
+        exploits the grid order of streamed pose batches.
+        """
+        nodes = fit['nodes']
+        na, nb, ng = (len(n) for n in nodes)
+        alphas, inverse_a = np.unique(orientations[:, 0], return_inverse=True)
+        A = lagrange_matrix(nodes[0], alphas) @ fit['values'].reshape(na, -1)
+
+        ab, first_b, inverse_b = np.unique(orientations[:, :2], axis=0, return_index=True, return_inverse=True)
+        Lb = lagrange_matrix(nodes[1], ab[:, 1])
+        B = np.einsum('uj,ujm->um', Lb, A[inverse_a.ravel()[first_b]].reshape(len(ab), nb, -1))
+
+        Lg = lagrange_matrix(nodes[2], orientations[:, 2])
+        coeffs = np.einsum('nk,nkm->nm', Lg, B[inverse_b.ravel()].reshape(len(orientations), ng, 70))
+        return coeffs.reshape(-1, 10, 7)
+
+    def evaluate(self, poses, chunk=4096):
+        """
+        Interpolated coefficient matrices of poses of the grid.
+
+        Args:
+            poses: Array of shape (N, 6); orientations must lie in the box of the axes
+            chunk: Number of poses interpolated at once
+
+        Returns:
+            coeffs: Array of shape (N, 10, 7)
+        """
+        poses = np.atleast_2d(poses)
+        rows, inverse = np.unique(poses[:, :3], axis=0, return_inverse=True)
+        keys = pose_keys(np.column_stack((rows, np.zeros((len(rows), 3)))))
+        inverse = inverse.ravel()
+
+        coeffs = np.empty((len(poses), 10, 7))
+        for r, key in enumerate(keys):
+            fit = self.fits.get(key) or self._fit(key, rows[r])
+            index = np.flatnonzero(inverse == r)
+            for c0 in range(0, len(index), chunk):
+                sel = index[c0:c0 + chunk]
+                coeffs[sel] = self._interpolate(fit, poses[sel, 3:])
+        return coeffs
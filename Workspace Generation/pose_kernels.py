@@ -0,0 +1,194 @@
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from compute_h_i_u_coefficients import sample_h_i_u_constraints
+from spatial_model_sampling_rref_last_column_3_variables import (adjugate_solve, rotation_and_s_matrices,
+                                                                 wrench_matrices)
+
+# Poses with |det(A6)| below this fraction of its Hadamard bound are sampled
+# with the full model: the update divides by det(A6)
+SINGULAR_RTOL = 1e-6
+
+class PoseKernels:
+    """
+    Per-pose quantities shared by every cable and every anchor perturbation.
+
+    For a stack of poses this holds R and S and, from the wrench matrix
+    L_wo_norm = [A6 | b6] of the unperturbed anchors, adj(A6), det(A6) and
+    adj(A6) @ b6 from one factorization per pose. Column c of L_wo_norm is
+    -S^T [u; b_c x u] with u = R^T (a_c - p - R b_c) (the cable length
+    cancels), so moving anchor c by delta adds M_c @ delta with
+    M_c = -S^T [I; [b_c]x] R^T and leaves the other six columns unchanged.
+    The samples of a perturbation are then column-replacement updates:
+
+    - c = 6 (b6 replaced): det(A6) is unchanged and adj(A6) @ b6 gains
+      adj(A6) @ M_6 @ delta
+    - c < 6 (column c of A6 replaced, t = adj(A6) @ M_c @ delta):
+      det' = det + t_c, and by Sylvester's determinant identity
+      (adj' b6)_k = X_k + (t_c X_k - X_c t_k) / det for k != c, (adj' b6)_c = X_c
+
+    Poses whose A6 is close to singular (relative to its Hadamard bound) are
+    sampled with the full model instead.
+    """
+
+    def __init__(self, Base_Points_, End_Effector_Attachment_Points_, q):
+        """
+        Args:
+            Base_Points_: Base points (3, 7)
+            End_Effector_Attachment_Points_: End-effector points (3, 7)
+            q: Poses of shape (N, 6)
+        """
+        self.base_points = np.asarray(Base_Points_, dtype=float)
+        self.ee_points = np.asarray(End_Effector_Attachment_Points_, dtype=float)
+        self.q = np.atleast_2d(np.asarray(q, dtype=float))
+        self.R, self.S = rotation_and_s_matrices(self.q)
+        _, L_wo_norm, _ = wrench_matrices(self.base_points, self.ee_points, self.q, self.R, self.S)
+
+        # One factorization per pose: adj(A6) and adj(A6) @ b6 side by side
+        n = len(self.q)
+        rhs = np.concatenate((np.broadcast_to(np.eye(6), (n, 6, 6)), L_wo_norm[:, :, 6:]), axis=2)
+        adj_rhs, self.determinant = adjugate_solve(L_wo_norm[:, :6, :6], rhs)
+        self.adjugate = adj_rhs[:, :, :6]
+        self.adj_b = adj_rhs[:, :, 6]
+        scale = np.prod(np.linalg.norm(L_wo_norm[:, :6, :6], axis=1), axis=1)
+        self.singular = ~(np.abs(self.determinant) > SINGULAR_RTOL * scale)
+
+    def __len__(self):
+        return len(self.q)
+
+    def anchor_jacobian(self, col):
+        """
+        Derivative of column col of L_wo_norm with respect to its base anchor.
+
+        Returns:
+            M: Array of shape (N, 6, 3)
+        """
+        RT = np.swapaxes(self.R, 1, 2)
+        bottom = np.cross(self.ee_points[:, col][None, :, None], RT, axis=1)
+        return -np.swapaxes(self.S, 1, 2) @ np.concatenate((RT, bottom), axis=1)
+
+    def sample(self, col, offsets):
+        """
+        Constraint values for perturbations of the anchor of cable col.
+
+        Args:
+            col: Index of the perturbed base point (cable)
+            offsets: Perturbations of the base point (S, 3)
+
+        Returns:
+            X: Perturbed base point coordinates (S, 3)
+            Y: Constraint values [last_col (6), determinant] of shape (N, S, 7)
+        """
+        X = self.base_points[:, col] + offsets
+        t = np.einsum('nkj,sj->nsk', self.adjugate @ self.anchor_jacobian(col), offsets)  # (N, S, 6)
+        Y = np.empty((len(self), len(offsets), 7))
+        if col == 6:
+            Y[:, :, :6] = self.adj_b[:, None, :] + t
+            Y[:, :, 6] = self.determinant[:, None]
+        else:
+            adj_b = self.adj_b[:, None, :]
+            det = np.where(self.singular, 1.0, self.determinant)[:, None, None]
+            Y[:, :, :6] = adj_b + (t[:, :, col, None] * adj_b - adj_b[:, :, col, None] * t) / det
+            Y[:, :, col] = self.adj_b[:, None, col]
+            Y[:, :, 6] = self.determinant[:, None] + t[:, :, col]
+
+        if self.singular.any():
+            _, Y[self.singular] = sample_h_i_u_constraints(
+                self.base_points, self.ee_points, self.q[self.singular], col, offsets
+            )
+        return X, Y
+
+class PoseKernelCache:
+    """
+    LRU cache of PoseKernels by pose batch, shared by all cables.
+
+    The analyzer streams the same pose batches for every cable, so a batch
+    is keyed by a hash of its poses and the robot configuration. The cache
+    is bounded by the total number of poses it holds (~0.8 KB each); cables
+    share kernels when all poses of a run fit.
+    """
+
+    def __init__(self, max_poses=50000):
+        """
+        Args:
+            max_poses: Total number of poses kept (0 disables caching)
+        """
+        self.max_poses = max_poses
+        self.entries = OrderedDict()
+        self.num_poses = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, Base_Points_, End_Effector_Attachment_Points_, q):
+        """
+        Kernels of a pose batch, computed on a miss.
+
+        Args:
+            Base_Points_: Base points (3, 7)
+            End_Effector_Attachment_Points_: End-effector points (3, 7)
+            q: Poses of shape (N, 6)
+
+        Returns:
+            PoseKernels of the batch
+        """
+        h = hashlib.sha1()
+        for arr in (Base_Points_, End_Effector_Attachment_Points_, q):
+            arr = np.ascontiguousarray(arr, dtype=float)
+            h.update(str(arr.shape).encode())
+            h.update(arr.tobytes())
+        key = h.digest()
+
+        kernels = self.entries.get(key)
+        if kernels is not None:
+            self.entries.move_to_end(key)
+            self.hits += len(kernels)
+            return kernels
+
+        kernels = PoseKernels(Base_Points_, End_Effector_Attachment_Points_, q)
+        self.misses += len(kernels)
+        if len(kernels) <= self.max_poses:
+            self.entries[key] = kernels
+            self.num_poses += len(kernels)
+            while self.num_poses > self.max_poses:
+                _, evicted = self.entries.popitem(last=False)
+                self.num_poses -= len(evicted)
+        return kernels
+
+    def clear(self):
+        """Drop all kernels and reset the statistics."""
+        self.entries.clear()
+        self.num_poses = self.hits = self.misses = 0
+
+def verify_pose_kernels(num_poses=200, rtol=1e-9, seed=0):
+    """
+    Check the kernel samples against full model evaluations.
+
+    Random poses of the configured robot are sampled on the 27-point
+    perturbation grid of every cable, with the kernels and with
+    sample_h_i_u_constraints.
+
+    Args:
+        num_poses: Number of random poses
+        rtol: Allowed error relative to the largest sample magnitude of a pose
+        seed: Random seed
+
+    Returns:
+        max_error: Largest relative deviation found
+    """
+    from cable_robot_config import get_cable_robot_config
+    from compute_h_i_u_coefficients import DELTA_GRID
+
+    base_points, ee_points = get_cable_robot_config()
+    rng = np.random.default_rng(seed)
+    q = np.column_stack((rng.uniform(-0.1, 0.1, (num_poses, 3)), rng.uniform(-0.5, 0.5, (num_poses, 3))))
+    kernels = PoseKernels(base_points, ee_points, q)
+    max_error = 0.0
+    for col in range(base_points.shape[1]):
+        _, reference = sample_h_i_u_constraints(base_points, ee_points, q, col)
+        _, Y = kernels.sample(col, DELTA_GRID)
+        scale = np.abs(reference).max(axis=(1, 2))
+        max_error = max(max_error, (np.abs(Y - reference).max(axis=(1, 2)) / scale).max())
+    print(f"[VERIFY] pose kernels max relative deviation: {max_error:.3e} (rtol={rtol:.0e})")
+    if max_error > rtol:
+        raise AssertionError(f"pose kernels deviate from the full model by {max_error:.3e}")
+    return max_error
@@ -0,0 +1,91 @@
+import numpy as np
+from workspace_utils import create_position_grid
+
+POSITION_SAMPLERS = ('fixed', 'lattice', 'sobol', 'halton')
+
+# Bounds of create_position_grid() (x_min, x_max, y_min, y_max, z_min, z_max)
+DEFAULT_POSITION_BOUNDS = (0.4, 0.6, 0.4, 0.6, 0.4, 0.6)
+
+def sample_positions(method='fixed', bounds=None, count=8, seed=None):
+    """
+    End-effector positions of the pose grid.
+
+    Args:
+        method: 'fixed' (the 8 corners of the bounds; create_position_grid() for
+            the default bounds), 'lattice'
+            (n**3 positions with n = round(count**(1/3)) per axis, bounds
+            included), 'sobol' or 'halton' (first count points of the
+            low-discrepancy sequence, so a longer sequence extends a shorter one)
+        bounds: (x_min, x_max, y_min, y_max, z_min, z_max); None uses 0.4...0.6 on every axis
+        count: Number of positions ('lattice', 'sobol', 'halton')
+        seed: Scrambling seed of 'sobol' and 'halton' (None: unscrambled, starting at the lower corner)
+
+    Returns:
+        positions: Array of shape (P, 3)
+    """
+    if method not in POSITION_SAMPLERS:
+        raise ValueError(f"method must be one of {POSITION_SAMPLERS}, got {method!r}")
+    if method == 'fixed' and (bounds is None or tuple(bounds) == DEFAULT_POSITION_BOUNDS):
+        # The reference grid, whose upper values are 0.4 + 0.2 rounded as in the original code
+        return np.asarray(create_position_grid(), dtype=float).reshape(-1, 3)
+
+    lo, hi = np.asarray(DEFAULT_POSITION_BOUNDS if bounds is None else bounds, dtype=float).reshape(3, 2).T
+    if method == 'fixed':
+        return np.stack(np.meshgrid(*zip(lo, hi), indexing='ij'), axis=-1).reshape(-1, 3)
+    if method == 'lattice':
+        n = max(1, int(round(count ** (1 / 3))))
+        axes = [np.linspace(a, b, n) if n > 1 else np.array([0.5 * (a + b)]) for a, b in zip(lo, hi)]
+        return np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, 3)
+
+    # Imported here: scipy.stats takes about a second to import and is only needed by these samplers
+    from scipy.stats import qmc
+    scramble = seed is not None
+    if method == 'sobol':
+        # Powers of two keep the balance properties of the sequence; take its prefix
+        unit = qmc.Sobol(3, scramble=scramble, seed=seed).random_base2(max(0, int(np.ceil(np.log2(max(count, 1))))))
+    else:
+        unit = qmc.Halton(3, scramble=scramble, seed=seed).random(count)
+    return lo + unit[:count] * (hi - lo)
+
+class VolumeConvergenceMonitor:
+    """
+    Stop criterion for adding position samples.
+
+    The workspace volume (valid voxels times voxel volume) is recorded after
+    every round of positions. Sampling has converged when the volume changed
+    by at most tol (relative) in each of the last `patience` rounds; an
+    empty workspace has converged as well.
+    """
+
+    def __init__(self, tol=0.001, patience=2, voxel_volume=1.0):
+        """
+        Args:
+            tol: Largest relative volume change of a converged round
+            patience: Number of consecutive converged rounds required
+            voxel_volume: Volume of one voxel (step**3)
+        """
+        self.tol = tol
+        self.patience = patience
+        self.voxel_volume = voxel_volume
+        self.volumes = []
+        self.samples = []
+
+    def update(self, validRegion, num_samples):
+        """
+        Record the volume after a round.
+
+        Args:
+            validRegion: Running valid region
+            num_samples: Number of positions applied so far
+
+        Returns:
+            True when sampling has converged
+        """
+        self.volumes.append(int(np.count_nonzero(validRegion)) * self.voxel_volume)
+        self.samples.append(num_samples)
+        if self.volumes[-1] == 0:
+            return True
+        if len(self.volumes) <= self.patience:
+            return False
+        recent = np.asarray(self.volumes[-self.patience - 1:])
+        return bool((np.abs(np.diff(recent)) <= self.tol * recent[1:]).all())
@@ -0,0 +1,118 @@
+import numpy as np
+from scipy.ndimage import binary_dilation
+from workspace_utils import compute_valid_points
+
+def boundary_voxels(labels):
+    """
+    Voxels with at least one 6-neighbor of the other label.
+
+    Args:
+        labels: Boolean grid
+
+    Returns:
+        Boolean grid of the same shape
+    """
+    boundary = np.zeros(labels.shape, dtype=bool)
+    for d in range(labels.ndim):
+        lo = [slice(None)] * labels.ndim
+        hi = [slice(None)] * labels.ndim
+        lo[d] = slice(None, -1)
+        hi[d] = slice(1, None)
+        change = labels[tuple(lo)] != labels[tuple(hi)]
+        boundary[tuple(lo)] |= change
+        boundary[tuple(hi)] |= change
+    return boundary
+
+def compute_valid_region_progressive(coeff_stack, x, y, z, levels=3, band=1, verify=False,
+                                     on_level=None, memory_budget_mb=16, valid=None, point_test=None):
+    """
+    Compute the valid region coarse-to-fine, refining only near the boundary.
+
+    The coarsest level samples every 2**levels-th voxel of each axis. Each
+    finer level halves the stride: voxels inherit the label of their coarse
+    parent, except in a band of `band` coarse voxels around the coarse
+    boundary, where they are evaluated exactly. Features thinner than the
+    coarse stride can be missed; verify=True evaluates every inherited voxel
+    at the end and corrects its label. Voxels outside a given running mask
+    are invalid at every level and never evaluated.
+
+    Args:
+        coeff_stack: Coefficient matrices of shape (M, 10, 7)
+        x, y, z: Increasing grid axes of the requested (finest) resolution
+        levels: Number of refinement levels below the coarse level
+        band: Dilation of the coarse boundary, in coarse voxels (at least 1)
+        verify: Evaluate all inherited voxels after the last level
+        on_level: Optional callback(stride, labels, level_axes) receiving the
+                  mask of every level, ANDed with valid, as a preview
+        memory_budget_mb: Approximate memory limit for one block of points
+        valid: Running mask on the finest grid (default: all True)
+        point_test: Optional callable (xs, ys, zs) -> boolean array replacing the
+                    sign test of coeff_stack (e.g. streaming the poses)
+
+    Returns:
+        validRegion: Boolean mask of shape (len(x), len(y), len(z))
+        stats: Dict with the evaluated voxels per level and the corrections of the verification
+    """
+    if point_test is None:
+        coeff_stack = np.asarray(coeff_stack, dtype=float).reshape(-1, 10, 7)
+
+        def point_test(xs, ys, zs):
+            return compute_valid_points(coeff_stack, xs, ys, zs, memory_budget_mb)
+    axes = (np.asarray(x), np.asarray(y), np.asarray(z))
+    shape = tuple(len(a) for a in axes)
+    if valid is None:
+        valid = np.ones(shape, dtype=bool)
+    band = max(1, band)
+    stats = {'evaluated_voxels': [], 'strides': [], 'corrected_voxels': 0}
+
+    def evaluate(index, where):
+        """Exact labels of the lattice voxels selected by where (False outside the running mask)."""
+        points = np.argwhere(where)
+        grid_index = tuple(index[d][points[:, d]] for d in range(3))
+        alive = valid[grid_index]
+        result = np.zeros(len(points), dtype=bool)
+        if alive.any():
+            result[alive] = point_test(*[axes[d][grid_index[d][alive]] for d in range(3)])
+        return result
+
+    def preview(stride, index, labels):
+        if on_level is not None:
+            on_level(stride, labels & valid[np.ix_(*index)], tuple(axes[d][index[d]] for d in range(3)))
+
+    stride = 2 ** max(0, levels)
+    index = [np.arange(0, n, stride) for n in shape]
+    exact = np.ones(tuple(len(i) for i in index), dtype=bool)
+    labels = np.zeros(exact.shape, dtype=bool)
+    labels[exact] = evaluate(index, exact)
+    stats['strides'].append(stride)
+    stats['evaluated_voxels'].append(int(exact.sum()))
+    preview(stride, index, labels)
+
+    while stride > 1:
+        stride //= 2
+        new_index = [np.arange(0, n, stride) for n in shape]
+        parent = np.ix_(*[np.arange(len(i)) // 2 for i in new_index])
+
+        # Refine a dilated band around the coarse boundary; the full 3x3x3
+        # structure makes the band cover every coarse cell touching the boundary
+        near = binary_dilation(boundary_voxels(labels), structure=np.ones((3, 3, 3), dtype=bool),
+                               iterations=band)
+        new_labels = labels[parent]
+        new_exact = np.zeros(new_labels.shape, dtype=bool)
+        new_exact[::2, ::2, ::2] = exact
+        refine = near[parent] & ~new_exact
+        new_labels[refine] = evaluate(new_index, refine)
+        new_exact |= refine
+
+        index, labels, exact = new_index, new_labels, new_exact
+        stats['strides'].append(stride)
+        stats['evaluated_voxels'].append(int(refine.sum()))
+        preview(stride, index, labels)
+
+    if verify and not exact.all():
+        inherited = ~exact & valid[np.ix_(*index)]
+        checked = evaluate(index, inherited)
+        stats['corrected_voxels'] = int((checked != labels[inherited]).sum())
+        labels[inherited] = checked
+
+    return labels & valid, stats
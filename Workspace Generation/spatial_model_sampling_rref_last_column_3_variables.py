@@ -10,6 +10,146 @@ def adjugate(A):
             cof[i, j] = ((-1) ** (i + j)) * det(minor)
     return cof.T
 
+def adjugate_solve(A, b, rcond=1e-12):
+    """
+    Compute adj(A) @ b and det(A) for a stack of square matrices.
+
+    Each matrix is factorized once with partial-pivoting LU (vectorized over
+    the stack); det(A) is the signed product of the pivots and
+    adj(A) @ b = det(A) * solve(A, b). Matrices whose smallest pivot is below
+    ``rcond`` times the largest one fall back to Cramer's rule,
+    (adj(A) @ b)[k] = det(A with column k replaced by b), which stays exact
+    for singular A. Several right-hand sides share the factorization.
+
+    Args:
+        A: Array of shape (N, n, n)
+        b: Array of shape (N, n), or (N, n, k) for k right-hand sides
+        rcond: Relative pivot threshold for the singular fallback
+
+    Returns:
+        adj_b: Array with the shape of b, adj_b[m] == adjugate(A[m]) @ b[m]
+        determinant: Array of shape (N,)
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    single = b.ndim == 2
+    if single:
+        b = b[:, :, None]
+    N, n = A.shape[0], A.shape[-1]
+    LU = A.copy()
+    x = b.copy()
+    sign = np.ones(N)
+    rows = np.arange(N)
+
+    # Forward elimination with row pivoting, applied to b on the fly
+    for k in range(n):
+        p = k + np.argmax(np.abs(LU[:, k:, k]), axis=1)
+        swap = p != k
+        if swap.any():
+            r, pk = rows[swap], p[swap]
+            LU[r, k], LU[r, pk] = LU[r, pk], LU[r, k]
+            x[r, k], x[r, pk] = x[r, pk], x[r, k]
+            sign[swap] = -sign[swap]
+        pivot = LU[:, k, k]
+        factors = LU[:, k+1:, k] / np.where(pivot == 0, 1.0, pivot)[:, None]
+        LU[:, k+1:, k:] -= factors[:, :, None] * LU[:, None, k, k:]
+        x[:, k+1:] -= factors[:, :, None] * x[:, k, None]
+
+    diag = LU[:, np.arange(n), np.arange(n)]
+    determinant = sign * np.prod(diag, axis=1)
+    abs_diag = np.abs(diag)
+    singular = abs_diag.min(axis=1) <= rcond * abs_diag.max(axis=1)
+
+    # Back substitution
+    safe_diag = np.where(singular[:, None], 1.0, diag)
+    for k in range(n - 1, -1, -1):
+        x[:, k] = (x[:, k] - np.sum(LU[:, k, k+1:, None] * x[:, k+1:], axis=1)) / safe_diag[:, k, None]
+    adj_b = determinant[:, None, None] * x
+
+    if singular.any():
+        A_s, b_s = A[singular], b[singular]
+        for j in range(b.shape[2]):
+            replaced = np.repeat(A_s[:, None], n, axis=1)
+            replaced[:, np.arange(n), :, np.arange(n)] = b_s[:, :, j]
+            adj_b[singular, :, j] = det(replaced)
+        determinant[singular] = det(A_s)
+    return (adj_b[:, :, 0] if single else adj_b), determinant
+
+def verify_adjugate_solve(num_samples=1000, rtol=1e-9, seed=0):
+    """
+    Check adjugate_solve against the reference cofactor implementation.
+
+    Random well-conditioned, rank-deficient and near-singular 6x6 matrices are
+    compared with adjugate(A) @ b and det(A).
+
+    Args:
+        num_samples: Number of matrices of each kind
+        rtol: Allowed error relative to the largest reference magnitude
+        seed: Random seed
+
+    Returns:
+        max_error: Largest relative deviation found
+    """
+    rng = np.random.default_rng(seed)
+    A = rng.normal(size=(3 * num_samples, 6, 6))
+    b = rng.normal(size=(3 * num_samples, 6))
+    # Rank-deficient: duplicate a column; near-singular: perturb the duplicate slightly
+    A[num_samples:, :, 5] = A[num_samples:, :, 0]
+    A[2 * num_samples:, :, 5] += 1e-14 * rng.normal(size=(num_samples, 6))
+
+    adj_b, determinant = adjugate_solve(A, b)
+    max_error = 0.0
+    for m in range(A.shape[0]):
+        ref_adj_b = adjugate(A[m]) @ b[m]
+        ref_det = det(A[m])
+        # Hadamard-type bound on the magnitude of every determinant involved
+        scale = np.prod(np.linalg.norm(A[m], axis=0)) * max(1.0, np.linalg.norm(b[m]))
+        max_error = max(max_error,
+                        np.abs(adj_b[m] - ref_adj_b).max() / scale,
+                        abs(determinant[m] - ref_det) / scale)
+    print(f"[VERIFY] adjugate_solve max relative deviation: {max_error:.3e} (rtol={rtol:.0e})")
+    if max_error > rtol:
+        raise AssertionError(f"adjugate_solve deviates from adjugate() by {max_error:.3e}")
+    return max_error
+
+def rotation_and_s_matrices(q):
+    """
+    Rotation matrices R and angular-velocity transforms S for stacked poses.
+
+    Args:
+        q: Poses of shape (N, 6) as [q1, q2, q3, alpha, beta, gamma]
+
+    Returns:
+        R: Array of shape (N, 3, 3)
+        S: Array of shape (N, 6, 6)
+    """
+    q = np.atleast_2d(q)
+    cA, sA = np.cos(q[:, 3]), np.sin(q[:, 3])
+    cB, sB = np.cos(q[:, 4]), np.sin(q[:, 4])
+    cG, sG = np.cos(q[:, 5]), np.sin(q[:, 5])
+    n = q.shape[0]
+
+    R = np.empty((n, 3, 3))
+    R[:, 0, 0] = cB*cG
+    R[:, 0, 1] = -cB*sG
+    R[:, 0, 2] = sB
+    R[:, 1, 0] = cA*sG + sA*sB*cG
+    R[:, 1, 1] = cA*cG - sA*sB*sG
+    R[:, 1, 2] = -sA*cB
+    R[:, 2, 0] = sA*sG - cA*sB*cG
+    R[:, 2, 1] = sA*cG + cA*sB*sG
+    R[:, 2, 2] = cA*cB
+
+    S = np.zeros((n, 6, 6))
+    S[:, :3, :3] = np.swapaxes(R, 1, 2)
+    S[:, 3, 3] = cB*cG
+    S[:, 3, 4] = sG
+    S[:, 4, 3] = -cB*sG
+    S[:, 4, 4] = cG
+    S[:, 5, 3] = sB
+    S[:, 5, 5] = 1
+    return R, S
+
 def spatial_model_sampling_rref_last_column_3_variables(Base_Points_, End_Effector_Attachment_Points_, q, debug_info=None):
     a = Base_Points_
     b = End_Effector_Attachment_Points_
@@ -44,12 +184,68 @@ def spatial_model_sampling_rref_last_column_3_variables(Base_Points_, End_Effect
     # RREF last column: adjugate(L_wo_norm[0:6,0:6]) @ L_wo_norm[:,6]
     A6 = L_wo_norm[:6, :6]
     b6 = L_wo_norm[:, 6]
-    adjA6 = adjugate(A6)
-    last_column_with_norm_remove_determinant = adjA6 @ b6
-    determinant = det(A6)
+    last_column_with_norm_remove_determinant, determinant = adjugate_solve(A6[None], b6[None])
+    last_column_with_norm_remove_determinant, determinant = last_column_with_norm_remove_determinant[0], determinant[0]
     # if debug_info is not None:
         
     #     print(f"[DEBUG] last_column_with_norm_remove_determinant (shape {last_column_with_norm_remove_determinant.shape}):\n{np.round(last_column_with_norm_remove_determinant, 9)}")
     #     print(f"[DEBUG] determinant (shape {determinant.shape}):\n{np.round(determinant, 4)}")
     # input("Press Enter to continue to the next pose...")
-    return L_with_norm, L_wo_norm, cable_length, last_column_with_norm_remove_determinant, determinant 
\ No newline at end of file
+    return L_with_norm, L_wo_norm, cable_length, last_column_with_norm_remove_determinant, determinant
+
+def wrench_matrices(a, b, q, R, S):
+    """
+    Wrench matrices of stacked poses (the part of the model before the adjugate solve).
+
+    Args:
+        a: Base points of shape (N, 3, 7) or (3, 7)
+        b: End-effector points of shape (3, 7) or (N, 3, 7)
+        q: Poses of shape (N, 6)
+        R, S: Output of rotation_and_s_matrices(q)
+
+    Returns:
+        L_with_norm: Array of shape (N, 6, 7)
+        L_wo_norm: Array of shape (N, 6, 7)
+        cable_length: Array of shape (N, 7)
+    """
+    displacement = -q[:, :3, None] - R @ b + a
+    cable_length = np.linalg.norm(displacement, axis=1)
+    L_top = (np.swapaxes(R, 1, 2) @ displacement) / cable_length[:, None, :]
+    L_bottom = np.cross(-L_top, np.broadcast_to(b, L_top.shape), axis=1)
+    L = np.concatenate((L_top, L_bottom), axis=1)
+    L_with_norm = -np.swapaxes(S, 1, 2) @ L
+    L_wo_norm = L_with_norm * cable_length[:, None, :]
+    return L_with_norm, L_wo_norm, cable_length
+
+def spatial_model_sampling_rref_last_column_3_variables_batched(Base_Points_, End_Effector_Attachment_Points_, q):
+    """
+    Batched version of spatial_model_sampling_rref_last_column_3_variables.
+
+    Evaluates N poses (each with its own, possibly perturbed, set of base
+    points) in one pass using broadcasting instead of Python loops.
+
+    Args:
+        Base_Points_: Base points of shape (N, 3, 7), or (3, 7) shared by all poses
+        End_Effector_Attachment_Points_: End-effector points of shape (3, 7) or (N, 3, 7)
+        q: Poses of shape (N, 6), or (6,) shared by all base point sets
+
+    Returns:
+        L_with_norm: Array of shape (N, 6, 7)
+        L_wo_norm: Array of shape (N, 6, 7)
+        cable_length: Array of shape (N, 7)
+        last_column_with_norm_remove_determinant: Array of shape (N, 6)
+        determinant: Array of shape (N,)
+    """
+    a = np.asarray(Base_Points_, dtype=float)
+    b = np.asarray(End_Effector_Attachment_Points_, dtype=float)
+    q = np.atleast_2d(np.asarray(q, dtype=float))
+    n = max(q.shape[0], a.shape[0] if a.ndim == 3 else 1)
+    q = np.broadcast_to(q, (n, 6))
+
+    R, S = rotation_and_s_matrices(q)
+    L_with_norm, L_wo_norm, cable_length = wrench_matrices(a, b, q, R, S)
+
+    A6 = L_wo_norm[:, :6, :6]
+    b6 = L_wo_norm[:, :, 6]
+    last_column_with_norm_remove_determinant, determinant = adjugate_solve(A6, b6)
+    return L_with_norm, L_wo_norm, cable_length, last_column_with_norm_remove_determinant, determinant
@@ -0,0 +1,37 @@
+import contextlib
+import io
+import numpy as np
+from main_workspace_gui import FIELD_DEFAULTS, FIELD_LABELS, POSITION_LABELS, SPATIAL_LABELS, parse_spatial_bounds
+from workspace_analyzer import WorkspaceAnalyzer
+
+def test_default_gui_run_has_valid_points():
+    """A run with the GUI's default fields keeps the per-cable anchor grids and matches the original loop."""
+    values = dict(zip(FIELD_LABELS, FIELD_DEFAULTS))
+    spatial_bounds = parse_spatial_bounds([''] * len(SPATIAL_LABELS))
+    assert spatial_bounds is None
+
+    analyzer = WorkspaceAnalyzer(spatial_bounds=spatial_bounds)
+    angles = [float(values[label]) for label in FIELD_LABELS[6:]]
+    position_bounds = tuple(float(values[label]) for label in POSITION_LABELS)
+    with contextlib.redirect_stdout(io.StringIO()):
+        intersection_points_sets, _ = analyzer.run_full_analysis(*angles, 0.02, use_optimized=True,
+                                                                 incremental=True, position_bounds=position_bounds)
+    assert all(len(points) > 0 for points in intersection_points_sets)
+
+    # Reference: the original per-pose 'loop' path on the same grids and poses. Its
+    # coefficients differ by rounding, which flips boundary voxels whose polynomial
+    # values are within noise of zero, so up to 0.1% of the valid voxels may differ
+    reference = WorkspaceAnalyzer(valid_region_mode='loop')
+    with contextlib.redirect_stdout(io.StringIO()):
+        reference.run_full_analysis(*angles, 0.02, use_optimized=False)
+    for cable_index in range(analyzer.num_cables):
+        mask = analyzer.workspace_masks[cable_index].to_bool()
+        expected = reference.workspace_masks[cable_index].to_bool()
+        assert (mask ^ expected).sum() <= 1e-3 * expected.sum(), cable_index
+
+def test_position_bounds_move_the_fixed_positions():
+    """The x/y/z fields bound the sampled positions; 'fixed' samples the corners of the bounds."""
+    analyzer = WorkspaceAnalyzer(position_bounds=(0.45, 0.55, 0.4, 0.6, 0.5, 0.5))
+    positions = analyzer.pose_grid_axes(0, 0, 0, 0, 0, 0, 0.02)[0]
+    assert positions.min(axis=0).tolist() == [0.45, 0.4, 0.5]
+    assert positions.max(axis=0).tolist() == [0.55, 0.6, 0.5]
@@ -0,0 +1,53 @@
+import contextlib
+import io
+import numpy as np
+from numpy.linalg import det
+from cable_robot_config import get_cable_robot_config
+from spatial_model_sampling_rref_last_column_3_variables import (adjugate, adjugate_solve, verify_adjugate_solve,
+                                                                 rotation_and_s_matrices, wrench_matrices)
+
+def robot_systems(base_points, ee_points, num_poses=50, seed=0):
+    """A6 and b6 of the wrench matrix for random poses of the robot."""
+    rng = np.random.default_rng(seed)
+    q = np.column_stack((rng.uniform(0.4, 0.6, (num_poses, 3)), rng.uniform(-0.3, 0.3, (num_poses, 3))))
+    R, S = rotation_and_s_matrices(q)
+    _, L_wo_norm, _ = wrench_matrices(base_points, ee_points, q, R, S)
+    return L_wo_norm[:, :6, :6], L_wo_norm[:, :, 6]
+
+def max_deviation(adj_b, determinant, A, b):
+    """Largest deviation from the cofactor reference, relative to a Hadamard bound of the determinants."""
+    errors = []
+    for m in range(len(A)):
+        scale = np.prod(np.linalg.norm(A[m], axis=0)) * max(1.0, np.linalg.norm(b[m]))
+        errors.append(max(np.abs(adj_b[m] - adjugate(A[m]) @ b[m]).max(), abs(determinant[m] - det(A[m]))) / scale)
+    return max(errors)
+
+def test_verify_adjugate_solve_within_tolerance():
+    """The built-in check passes on well-conditioned, rank-deficient and near-singular matrices."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert verify_adjugate_solve(num_samples=100, rtol=1e-9) <= 1e-9
+
+def test_lu_matches_cramer_on_robot_poses():
+    """The LU path and the forced Cramer fallback agree on regular poses of the robot."""
+    A, b = robot_systems(*get_cable_robot_config())
+    lu_adj_b, lu_det = adjugate_solve(A, b, rcond=0.0)
+    cramer_adj_b, cramer_det = adjugate_solve(A, b, rcond=np.inf)
+    scale = np.prod(np.linalg.norm(A, axis=1), axis=1) * np.maximum(1.0, np.linalg.norm(b, axis=1))
+    assert (np.abs(lu_adj_b - cramer_adj_b).max(axis=1) / scale).max() <= 1e-9
+    assert (np.abs(lu_det - cramer_det) / scale).max() <= 1e-9
+    assert max_deviation(lu_adj_b, lu_det, A, b) <= 1e-9
+
+def test_singular_and_near_singular_robot_poses():
+    """Poses whose wrench matrix is (nearly) rank deficient still match the cofactor reference."""
+    base_points, ee_points = get_cable_robot_config()
+    for offset in (0.0, 1e-10):
+        # Cable 6 attached like cable 1: two equal (or almost equal) wrench columns
+        base = base_points.astype(float)
+        ee = ee_points.astype(float)
+        base[:, 5] = base[:, 0] + offset
+        ee[:, 5] = ee[:, 0]
+        A, b = robot_systems(base, ee)
+        adj_b, determinant = adjugate_solve(A, b)
+        assert max_deviation(adj_b, determinant, A, b) <= 1e-9, offset
+        if offset == 0.0:
+            assert np.abs(determinant).max() <= 1e-12
@@ -1,15 +1,225 @@
 import numpy as np
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from cable_robot_config import get_cable_robot_config
-from compute_h_i_u_coefficients import compute_h_i_u_coefficients
-from workspace_utils import eval_poly, create_parameter_grid, create_position_grid, compute_intersection_points
+from compute_h_i_u_coefficients import (compute_h_i_u_coefficients, compute_h_i_u_coefficients_batched,
+                                        compute_h_i_u_coefficients_analytic_batched)
+from adaptive_orientation import compute_valid_region_adaptive_orientation
+from coefficient_cache import CoefficientCache, config_digest
+from column_intervals import solve_column_intervals
+from octree_workspace import compute_valid_region_octree
+from orientation_surrogate import OrientationSurrogate
+from pose_kernels import PoseKernelCache
+from position_sampling import POSITION_SAMPLERS, VolumeConvergenceMonitor, sample_positions
+from progressive_workspace import compute_valid_region_progressive
+from sign_kernel import KERNEL_BACKENDS, fused_valid_region, resolve_backend
+from workspace_mask import WorkspaceMask, intersect_masks
+from workspace_symmetry import find_symmetries, map_mask, plan_derivations
+from workspace_utils import (eval_poly, compute_valid_region_slab, monomial_basis, compute_valid_mask, compute_valid_mask_active_set,
+                             compute_valid_mask_mixed, compute_valid_points,
+                             rank_coefficient_sets, create_parameter_grid,
+                             create_pose_axes, count_poses, iter_pose_batches, pose_grid_difference)
+
+COEFFICIENT_MODES = ('regression', 'analytic', 'validate', 'surrogate')
+VALID_REGION_MODES = ('loop', 'gemm', 'active_set', 'scheduled', 'threaded', 'octree', 'raycast', 'progressive', 'fused', 'mixed')
+# Options that change the mask computed by a valid-region or coefficient mode
+MODE_OPTIONS = {
+    'scheduled': ('coarse_stride', 'patience'),
+    'octree': ('leaf_size',),
+    'progressive': ('progressive_levels', 'band', 'verify'),
+    'surrogate': ('surrogate_tol', 'surrogate_max_nodes'),
+}
+
+# Valid region modes that evaluate the polynomials through a cached monomial basis
+BASIS_MODES = ('gemm', 'active_set', 'scheduled', 'mixed')
+
+ORIENTATION_SAMPLING_MODES = ('grid', 'adaptive')
 
 class WorkspaceAnalyzer:
-    def __init__(self):
+    def __init__(self, pose_batch_size=512, coefficient_mode='regression', valid_region_mode='loop',
+                 memory_budget_mb=16, coarse_stride=4, patience=None, threads=None, slab_kb=256,
+                 leaf_size=4, cache_entries=0, cache_dir=None, cache_disk_entries=10000000,
+                 progressive_levels=3, band=1, verify=False, kernel_backend='auto', spatial_bounds=None,
+                 pose_kernels=True, pose_kernel_poses=50000, surrogate_tol=1e-9, surrogate_max_nodes=33,
+                 orientation_step=None, orientation_sampling='grid', orientation_levels=3,
+                 orientation_verify=False, position_sampling='fixed', position_bounds=None, position_samples=8,
+                 position_seed=None, position_tol=None, position_round=8, position_patience=2, symmetry=False,
+                 symmetry_samples=1000, symmetry_tolerance=0.0):
+        """
+        Args:
+            pose_batch_size: Number of poses per batched coefficient computation
+            coefficient_mode: 'regression' (27-sample quadratic fit), 'analytic'
+                (exact affine coefficients from 4 samples), 'validate'
+                (regression results, reporting the max deviation of the analytic path) or
+                'surrogate' (regression at adaptive orientation nodes, interpolated
+                to the orientation grid)
+            valid_region_mode: 'loop' (eval_poly per coefficient set), 'gemm'
+                (cached monomial basis, chunked matrix products), 'active_set'
+                (each set evaluated only on the voxels that are still valid),
+                'scheduled' (active set, most restrictive coefficient sets first),
+                'threaded' (cache-sized x slabs evaluated on a thread pool),
+                'octree' (adaptive refinement with interval bounds, sampling only uncertain cells),
+                'raycast' (exact z-intervals per (x, y) column from the roots of the quadrics),
+                'progressive' (coarse-to-fine, refining only a band around the coarse boundary),
+                'fused' (single-pass sign-test kernel without temporaries, NumPy or Numba) or
+                'mixed' (float32 matrix products, float64 re-check of values near zero)
+            memory_budget_mb: Memory budget for one block of polynomial values
+            coarse_stride: Subsampling stride of the coarse grid used to rank poses ('scheduled')
+            patience: Stop after this many consecutive poses that leave the region
+                unchanged ('scheduled'); None keeps the result exact
+            threads: Number of threads for 'threaded' mode (default: CPU count)
+            slab_kb: Target size in KB of one scratch buffer of a slab ('threaded', 'fused')
+            leaf_size: Largest octree cell edge, in voxels, that is sampled directly ('octree')
+            cache_entries: Capacity of the in-process coefficient LRU cache (0 disables it)
+            cache_dir: Directory of the persistent coefficient cache (None disables it)
+            cache_disk_entries: Capacity of the persistent coefficient cache
+            progressive_levels: Number of refinement levels; the coarse stride is 2**levels ('progressive')
+            band: Width in coarse voxels of the refined band around the boundary ('progressive')
+            verify: Evaluate every inherited voxel after the finest level ('progressive')
+            kernel_backend: 'auto' (Numba when installed), 'numpy' or 'numba' ('fused')
+            spatial_bounds: (x_min, x_max, y_min, y_max, z_min, z_max) of one global grid
+                shared by all cables; None uses a +-0.5 cube around each cable's base point
+            pose_kernels: Compute the anchor perturbation samples as column-replacement
+                updates of per-pose kernels instead of full model evaluations
+            pose_kernel_poses: Capacity, in poses, of the kernel cache shared by all cables
+            surrogate_tol: Target relative interpolation error of the orientation surrogate ('surrogate')
+            surrogate_max_nodes: Largest number of orientation nodes per axis ('surrogate')
+            orientation_step: Angular step of the orientation grid; None uses the spatial step
+            orientation_sampling: 'grid' (every orientation of the grid) or 'adaptive'
+                (coarse orientation lattice, bisecting only cells whose corner poses
+                eliminate different voxels; serial optimized analysis)
+            orientation_levels: Number of bisection levels below the coarse lattice,
+                whose stride is 2**levels grid steps ('adaptive')
+            orientation_verify: Stream all grid poses after adaptive orientation sampling and
+                report the voxels they correct ('adaptive')
+            position_sampling: 'fixed' (the 8 corners of create_position_grid()), 'lattice',
+                'sobol' or 'halton' end-effector positions (see position_sampling.sample_positions)
+            position_bounds: (x_min, x_max, y_min, y_max, z_min, z_max) of the sampled
+                positions; None uses 0.4...0.6 on every axis
+            position_samples: Number of sampled positions (upper bound with position_tol)
+            position_seed: Scrambling seed of the 'sobol' and 'halton' sequences (None: unscrambled)
+            position_tol: Stop adding positions once the workspace volume changes by at most this
+                fraction per round (serial optimized analysis); None applies all positions
+            position_round: Number of positions per round of the convergence monitor
+            position_patience: Number of consecutive converged rounds required
+            symmetry: Derive the masks of cables that a rigid symmetry of the robot and pose
+                grid maps onto an earlier cable (serial optimized analysis with grid
+                orientations and all positions)
+            symmetry_samples: Number of voxels of a derived mask checked against the exact test
+            symmetry_tolerance: Largest fraction of checked voxels that may disagree before the
+                cable is computed instead
+        """
+        if coefficient_mode not in COEFFICIENT_MODES:
+            raise ValueError(f"coefficient_mode must be one of {COEFFICIENT_MODES}, got {coefficient_mode!r}")
+        if valid_region_mode not in VALID_REGION_MODES:
+            raise ValueError(f"valid_region_mode must be one of {VALID_REGION_MODES}, got {valid_region_mode!r}")
+        if kernel_backend not in KERNEL_BACKENDS:
+            raise ValueError(f"kernel_backend must be one of {KERNEL_BACKENDS}, got {kernel_backend!r}")
+        if orientation_sampling not in ORIENTATION_SAMPLING_MODES:
+            raise ValueError(f"orientation_sampling must be one of {ORIENTATION_SAMPLING_MODES}, "
+                             f"got {orientation_sampling!r}")
+        if position_sampling not in POSITION_SAMPLERS:
+            raise ValueError(f"position_sampling must be one of {POSITION_SAMPLERS}, got {position_sampling!r}")
         self.base_points = None
         self.ee_points = None
         self.num_cables = 0
+        self.pose_batch_size = pose_batch_size
+        self.coefficient_mode = coefficient_mode
+        self.valid_region_mode = valid_region_mode
+        self.memory_budget_mb = memory_budget_mb
+        self.coarse_stride = coarse_stride
+        self.patience = patience
+        self.threads = threads or os.cpu_count() or 1
+        self.slab_kb = slab_kb
+        self.leaf_size = leaf_size
+        self.max_coefficient_deviation = 0.0
+        self.last_column_intervals = None
+        self.unchanged_sets = 0
+        self.column_intervals = {}
+        self.workspace_masks = {}
+        self.incremental_state = {}
+        self.cache_entries = cache_entries
+        self.cache_dir = cache_dir
+        self.cache_disk_entries = cache_disk_entries
+        self.coefficient_cache = None
+        self.progressive_levels = progressive_levels
+        self.band = band
+        self.verify = verify
+        self.preview_callback = None
+        self.kernel_backend = kernel_backend
+        self.spatial_bounds = None if spatial_bounds is None else tuple(float(b) for b in spatial_bounds)
+        self.global_grid = None
+        self.pose_kernels = pose_kernels
+        self.pose_kernel_poses = pose_kernel_poses
+        self.pose_kernel_cache = PoseKernelCache(pose_kernel_poses) if pose_kernels else None
+        self.surrogate_tol = surrogate_tol
+        self.surrogate_max_nodes = surrogate_max_nodes
+        self.orientation_surrogates = {}
+        self.orientation_step = orientation_step
+        self.orientation_sampling = orientation_sampling
+        self.orientation_levels = orientation_levels
+        self.orientation_verify = orientation_verify
+        self.position_sampling = position_sampling
+        self.position_bounds = None if position_bounds is None else tuple(float(b) for b in position_bounds)
+        self.position_samples = position_samples
+        self.position_seed = position_seed
+        self.position_tol = position_tol
+        self.position_round = position_round
+        self.position_patience = position_patience
+        self.position_history = {}
+        self.symmetry = symmetry
+        self.symmetry_samples = symmetry_samples
+        self.symmetry_tolerance = symmetry_tolerance
+        if cache_entries > 0 or cache_dir is not None:
+            self.coefficient_cache = CoefficientCache(cache_entries, cache_dir, cache_disk_entries)
         
+    def get_options(self):
+        """Return the constructor options of this analyzer (used to configure worker processes)."""
+        return {
+            'pose_batch_size': self.pose_batch_size,
+            'coefficient_mode': self.coefficient_mode,
+            'valid_region_mode': self.valid_region_mode,
+            'memory_budget_mb': self.memory_budget_mb,
+            'coarse_stride': self.coarse_stride,
+            'patience': self.patience,
+            'threads': self.threads,
+            'slab_kb': self.slab_kb,
+            'leaf_size': self.leaf_size,
+            'cache_entries': self.cache_entries,
+            'cache_dir': self.cache_dir,
+            'cache_disk_entries': self.cache_disk_entries,
+            'progressive_levels': self.progressive_levels,
+            'band': self.band,
+            'verify': self.verify,
+            'kernel_backend': self.kernel_backend,
+            'spatial_bounds': self.spatial_bounds,
+            'pose_kernels': self.pose_kernels,
+            'pose_kernel_poses': self.pose_kernel_poses,
+            'surrogate_tol': self.surrogate_tol,
+            'surrogate_max_nodes': self.surrogate_max_nodes,
+            'orientation_step': self.orientation_step,
+            'orientation_sampling': self.orientation_sampling,
+            'orientation_levels': self.orientation_levels,
+            'orientation_verify': self.orientation_verify,
+            'position_sampling': self.position_sampling,
+            'position_bounds': self.position_bounds,
+            'position_samples': self.position_samples,
+            'position_seed': self.position_seed,
+            'position_tol': self.position_tol,
+            'position_round': self.position_round,
+            'position_patience': self.position_patience,
+            'symmetry': self.symmetry,
+            'symmetry_samples': self.symmetry_samples,
+            'symmetry_tolerance': self.symmetry_tolerance,
+        }
+    
+    def mask_settings(self):
+        """Valid-region mode, coefficient mode and the tuning options of both that change a computed mask."""
+        modes = (self.valid_region_mode, self.coefficient_mode)
+        return modes + tuple((name, getattr(self, name)) for mode in modes for name in MODE_OPTIONS.get(mode, ()))
+    
     def initialize_robot_config(self):
         """Initialize cable robot configuration."""
         self.base_points, self.ee_points = get_cable_robot_config()
@@ -33,45 +243,540 @@ class WorkspaceAnalyzer:
         xGrid, yGrid, zGrid = np.meshgrid(x, y, z, indexing='ij')
         return xGrid, yGrid, zGrid
     
-    def compute_valid_region_optimized(self, all_coeffs, xGrid, yGrid, zGrid):
+    def create_global_grid(self, bounds, step):
+        """
+        Create the spatial grid spanning user-specified bounds.
+        
+        Args:
+            bounds: (x_min, x_max, y_min, y_max, z_min, z_max)
+            step: Grid step size
+            
+        Returns:
+            xGrid, yGrid, zGrid: 3D grid arrays (the max bounds are included when on the grid)
+        """
+        x_min, x_max, y_min, y_max, z_min, z_max = bounds
+        x = np.arange(x_min, x_max + step / 2, step)
+        y = np.arange(y_min, y_max + step / 2, step)
+        z = np.arange(z_min, z_max + step / 2, step)
+        xGrid, yGrid, zGrid = np.meshgrid(x, y, z, indexing='ij')
+        return xGrid, yGrid, zGrid
+    
+    def spatial_grid(self, cable_index, step):
+        """
+        Spatial grid on which a cable is analyzed.
+        
+        With spatial_bounds set, every cable uses the same global grid; it is
+        built once per (bounds, step) and returned as the same arrays, so
+        build_basis() can reuse its monomial basis for all cables and poses and
+        the cable masks share one index space. Otherwise the grid is the
+        +-0.5 cube around the cable's base point.
+        
+        Args:
+            cable_index: Index of the cable
+            step: Grid step size
+            
+        Returns:
+            xGrid, yGrid, zGrid: 3D grid arrays
+        """
+        if self.spatial_bounds is None:
+            return self.create_spatial_grid(self.base_points[:, cable_index], step)
+        key = (self.spatial_bounds, float(step))
+        if self.global_grid is None or self.global_grid['key'] != key:
+            grid = self.create_global_grid(self.spatial_bounds, step)
+            self.global_grid = {'key': key, 'grid': grid, 'basis': None}
+            print(f"[DEBUG] Built global grid {grid[0].shape} for bounds {self.spatial_bounds}")
+        return self.global_grid['grid']
+    
+    def pose_grid_axes(self, alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max, step):
+        """
+        Pose grid axes of an analysis.
+        
+        The positions come from the configured position sampler and the
+        orientation step is decoupled from the spatial step.
+        
+        Args:
+            alpha_min, alpha_max: Alpha angle range
+            beta_min, beta_max: Beta angle range
+            gamma_min, gamma_max: Gamma angle range
+            step: Spatial grid step, used as angular step when orientation_step is None
+            
+        Returns:
+            Tuple (positions, alphas, betas, gammas) as returned by create_pose_axes()
+        """
+        angle_step = step if self.orientation_step is None else self.orientation_step
+        positions = sample_positions(self.position_sampling, self.position_bounds, self.position_samples,
+                                     self.position_seed)
+        return create_pose_axes(positions, alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max,
+                                angle_step)
+    
+    def build_basis(self, xGrid, yGrid, zGrid):
+        """
+        Build the monomial basis of a grid if the valid region mode uses one.
+        
+        Args:
+            xGrid, yGrid, zGrid: 3D grid arrays
+            
+        Returns:
+            basis: Array of shape (Ngrid, 10) (float32 for 'mixed'), or None
+                for modes that do not use a basis
+        """
+        if self.valid_region_mode not in BASIS_MODES:
+            return None
+        if self.global_grid is not None and xGrid is self.global_grid['grid'][0]:
+            # Shared global grid: the basis is built once for all cables
+            if self.global_grid['basis'] is None:
+                self.global_grid['basis'] = self._monomial_basis(xGrid, yGrid, zGrid)
+            return self.global_grid['basis']
+        return self._monomial_basis(xGrid, yGrid, zGrid)
+    
+    def _monomial_basis(self, xGrid, yGrid, zGrid):
+        """Monomial basis in the precision of the valid region mode."""
+        if self.valid_region_mode == 'mixed':
+            return monomial_basis(xGrid, yGrid, zGrid).astype(np.float32)
+        return monomial_basis(xGrid, yGrid, zGrid)
+    
+    def compute_coefficient_batch(self, batch, cable_index):
+        """
+        Compute the coefficient matrices of one batch of poses in the configured coefficient mode.
+        
+        With a coefficient cache, only the poses that are not cached are
+        computed; the key is the robot configuration, the cable and the pose
+        (never the spatial grid step).
+        
+        Args:
+            batch: Array of shape (B, 6)
+            cable_index: Index of the cable to analyze
+            
+        Returns:
+            coeffs: Array of shape (B, 10, 7)
+        """
+        if self.coefficient_cache is None:
+            return self._compute_coefficient_batch(batch, cable_index)
+        
+        namespace = f"{config_digest(self.base_points, self.ee_points, self.coefficient_mode)}:{cable_index}"
+        coeffs, found, keys = self.coefficient_cache.lookup(namespace, batch)
+        missing = np.flatnonzero(~found)
+        if len(missing):
+            coeffs[missing] = self._compute_coefficient_batch(batch[missing], cable_index)
+            self.coefficient_cache.store(namespace, [keys[i] for i in missing], coeffs[missing])
+        return coeffs
+    
+    def _compute_coefficient_batch(self, batch, cable_index):
+        """Compute the coefficient matrices of one batch of poses without the cache."""
+        kernels = self.get_pose_kernels(batch)
+        if self.coefficient_mode == 'analytic':
+            return compute_h_i_u_coefficients_analytic_batched(self.base_points, self.ee_points, batch, cable_index,
+                                                               kernels)
+        coeffs = compute_h_i_u_coefficients_batched(self.base_points, self.ee_points, batch, cable_index, kernels)
+        if self.coefficient_mode == 'validate':
+            self.validate_coefficients(coeffs, batch, cable_index, kernels)
+        return coeffs
+    
+    def get_orientation_surrogate(self, cable_index, pose_axes):
+        """
+        Orientation surrogate of a cable over a pose grid.
+        
+        Exact regression coefficients are computed only at the adaptively
+        chosen orientation nodes of the positions that are reached (through
+        compute_coefficient_batch, so the coefficient cache and pose kernels
+        apply); the coefficients of the grid orientations are interpolated.
+        The surrogate of a cable is kept while the orientation axes are
+        unchanged, so every position is fitted once and its interpolant is
+        reused by all batches, position rounds and later runs.
+        
+        Args:
+            cable_index: Index of the cable to analyze
+            pose_axes: Pose grid axes from create_pose_axes()
+            
+        Returns:
+            OrientationSurrogate
+        """
+        surrogate = self.orientation_surrogates.get(cable_index)
+        if surrogate is not None and all(np.array_equal(a, b) for a, b in zip(surrogate.axes, pose_axes[1:])):
+            return surrogate
+        
+        def exact_coefficients(poses):
+            coeffs = np.empty((len(poses), 10, 7))
+            for start in range(0, len(poses), self.pose_batch_size):
+                stop = min(start + self.pose_batch_size, len(poses))
+                coeffs[start:stop] = self.compute_coefficient_batch(poses[start:stop], cable_index)
+            return coeffs
+        
+        surrogate = OrientationSurrogate(exact_coefficients, pose_axes, tol=self.surrogate_tol,
+                                         max_nodes=self.surrogate_max_nodes)
+        self.orientation_surrogates[cable_index] = surrogate
+        return surrogate
+    
+    def get_pose_kernels(self, batch):
+        """
+        Pose kernels of a batch from the kernel cache shared by all cables.
+        
+        Args:
+            batch: Array of shape (B, 6)
+            
+        Returns:
+            PoseKernels, or None when pose kernels are disabled
+        """
+        if self.pose_kernel_cache is None:
+            return None
+        return self.pose_kernel_cache.get(self.base_points, self.ee_points, batch)
+    
+    def validate_coefficients(self, regression_coeffs, poses, cable_index, kernels=None):
+        """
+        Compare regression coefficients with the analytic path and record the max deviation.
+        
+        Args:
+            regression_coeffs: Regression coefficients of shape (N, 10, 7)
+            poses: Array of shape (N, 6)
+            cable_index: Index of the cable to analyze
+            kernels: Optional PoseKernels of the poses
+            
+        Returns:
+            deviation: Max absolute deviation relative to the largest coefficient of each pose
+        """
+        analytic_coeffs = compute_h_i_u_coefficients_analytic_batched(
+            self.base_points, self.ee_points, poses, cable_index, kernels
+        )
+        scale = np.abs(regression_coeffs).max(axis=(1, 2))
+        scale[scale == 0] = 1.0
+        deviation = (np.abs(analytic_coeffs - regression_coeffs).max(axis=(1, 2)) / scale).max()
+        self.max_coefficient_deviation = max(self.max_coefficient_deviation, deviation)
+        print(f"[VALIDATE] Cable {cable_index+1}: analytic vs regression max relative deviation: {deviation:.3e}")
+        return deviation
+    
+    def compute_valid_region_optimized(self, all_coeffs, xGrid, yGrid, zGrid, basis=None, validRegion=None):
         """
         Compute valid region for all coefficient sets at once.
         
         Args:
             all_coeffs: List of coefficient matrices for all parameter combinations
             xGrid, yGrid, zGrid: 3D grid arrays
+            basis: Precomputed monomial basis of the grid (optional, used by the basis modes)
+            validRegion: Running valid region, updated in place; only its valid voxels are
+                tested by the point-wise modes (default: all points valid)
             
         Returns:
             validRegion: Boolean mask of valid points (intersection of all valid regions)
         """
-        if not all_coeffs:
+        if len(all_coeffs) == 0:
             return np.zeros(xGrid.shape, dtype=bool)
+        if validRegion is None:
+            validRegion = np.ones(xGrid.shape, dtype=bool)
+            self.unchanged_sets = 0
         
-        # Initialize valid region as True (all points valid initially)
-        validRegion = np.ones(xGrid.shape, dtype=bool)
+        if self.valid_region_mode == 'gemm':
+            return self.compute_valid_region_gemm(all_coeffs, xGrid, yGrid, zGrid, basis, validRegion)
+        if self.valid_region_mode == 'active_set':
+            return self.compute_valid_region_active_set(all_coeffs, xGrid, yGrid, zGrid, basis, validRegion)
+        if self.valid_region_mode == 'scheduled':
+            return self.compute_valid_region_scheduled(all_coeffs, xGrid, yGrid, zGrid, basis, validRegion)
+        if self.valid_region_mode == 'threaded':
+            return self.compute_valid_region_threaded(all_coeffs, xGrid, yGrid, zGrid, validRegion)
+        if self.valid_region_mode == 'octree':
+            validRegion &= self.compute_valid_region_octree(all_coeffs, xGrid, yGrid, zGrid)
+            return validRegion
+        if self.valid_region_mode == 'raycast':
+            validRegion &= self.compute_valid_region_raycast(all_coeffs, xGrid, yGrid, zGrid)
+            return validRegion
+        if self.valid_region_mode == 'progressive':
+            validRegion[...] = self.compute_valid_region_progressive(all_coeffs, xGrid, yGrid, zGrid, validRegion)
+            return validRegion
+        if self.valid_region_mode == 'fused':
+            return self.compute_valid_region_fused(all_coeffs, xGrid, yGrid, zGrid, validRegion)
+        if self.valid_region_mode == 'mixed':
+            return self.compute_valid_region_mixed(all_coeffs, xGrid, yGrid, zGrid, basis, validRegion)
         
-        print(f"[DEBUG] Computing valid region for {len(all_coeffs)} coefficient sets...")
+        # Only the points that are still valid are evaluated
+        xs, ys, zs = xGrid[validRegion], yGrid[validRegion], zGrid[validRegion]
+        live_valid = np.ones(len(xs), dtype=bool)
+        
+        print(f"[DEBUG] Computing valid region for {len(all_coeffs)} coefficient sets on {len(xs)} points...")
         
         for i, coeffs in enumerate(all_coeffs):
             # Compute valid region for this coefficient set
             coeff_det = coeffs[:, -1]
-            polyValues_det = eval_poly(coeff_det, xGrid, yGrid, zGrid)
-            current_valid = np.ones(xGrid.shape, dtype=bool)
+            polyValues_det = eval_poly(coeff_det, xs, ys, zs)
             
             for j in range(6):
                 coeff = coeffs[:, j]
-                polyValues = eval_poly(coeff, xGrid, yGrid, zGrid)
+                polyValues = eval_poly(coeff, xs, ys, zs)
                 polyValues = np.sign(polyValues_det) * polyValues
-                current_valid &= (polyValues < 0)
-            
-            # Intersection with overall valid region (AND operation)
-            validRegion &= current_valid
+                # Intersection with overall valid region (AND operation)
+                live_valid &= (polyValues < 0)
             
             if (i + 1) % 100 == 0:
                 print(f"[DEBUG] Processed {i + 1}/{len(all_coeffs)} coefficient sets")
         
+        validRegion[validRegion] = live_valid
+        return validRegion
+    
+    def _live_rows(self, basis, validRegion):
+        """Flat indices of the valid voxels and the matching rows of the basis."""
+        live = np.flatnonzero(validRegion)
+        return live, basis if len(live) == basis.shape[0] else basis[live]
+    
+    def compute_valid_region_gemm(self, all_coeffs, xGrid, yGrid, zGrid, basis=None, validRegion=None):
+        """
+        Compute valid region by evaluating all polynomials as chunked matrix products.
+        
+        Args:
+            all_coeffs: List or array of coefficient matrices (M, 10, 7)
+            xGrid, yGrid, zGrid: 3D grid arrays
+            basis: Precomputed monomial basis of the grid (built if not given)
+            validRegion: Running valid region, updated in place; only its valid voxels are
+                evaluated (default: all points valid)
+            
+        Returns:
+            validRegion: Boolean mask of valid points (intersection of all valid regions)
+        """
+        if basis is None:
+            basis = monomial_basis(xGrid, yGrid, zGrid)
+        if validRegion is None:
+            validRegion = np.ones(xGrid.shape, dtype=bool)
+        live, live_basis = self._live_rows(basis, validRegion)
+        print(f"[DEBUG] Computing valid region for {len(all_coeffs)} coefficient sets on {len(live)} points (GEMM)...")
+        validRegion.flat[live] = compute_valid_mask(live_basis, all_coeffs, self.memory_budget_mb)
+        return validRegion
+    
+    def compute_valid_region_mixed(self, all_coeffs, xGrid, yGrid, zGrid, basis=None, validRegion=None):
+        """
+        Compute valid region with float32 matrix products and float64 re-checks near zero.
+        
+        Args:
+            all_coeffs: List or array of coefficient matrices (M, 10, 7)
+            xGrid, yGrid, zGrid: 3D grid arrays
+            basis: Precomputed float32 monomial basis of the grid (built if not given)
+            validRegion: Running valid region, updated in place; only its valid voxels are
+                evaluated (default: all points valid)
+            
+        Returns:
+            validRegion: Boolean mask of valid points (identical to the float64 'loop' mode)
+        """
+        if basis is None or basis.dtype != np.float32:
+            basis = monomial_basis(xGrid, yGrid, zGrid).astype(np.float32)
+        if validRegion is None:
+            validRegion = np.ones(xGrid.shape, dtype=bool)
+        live, live_basis = self._live_rows(basis, validRegion)
+        print(f"[DEBUG] Computing valid region for {len(all_coeffs)} coefficient sets on {len(live)} points "
+              f"(mixed precision)...")
+        valid, num_rechecked = compute_valid_mask_mixed(live_basis, all_coeffs, np.ravel(xGrid)[live],
+                                                        np.ravel(yGrid)[live], np.ravel(zGrid)[live],
+                                                        self.memory_budget_mb)
+        print(f"[DEBUG] Mixed precision: {num_rechecked} point/set pairs re-checked in float64")
+        validRegion.flat[live] = valid
+        return validRegion
+    
+    def compute_valid_region_active_set(self, all_coeffs, xGrid, yGrid, zGrid, basis=None, validRegion=None):
+        """
+        Compute valid region keeping only the flat indices of voxels that are still valid.
+        
+        Args:
+            all_coeffs: List or array of coefficient matrices (M, 10, 7)
+            xGrid, yGrid, zGrid: 3D grid arrays
+            basis: Precomputed monomial basis of the grid (built if not given)
+            validRegion: Running valid region, updated in place; the active set starts
+                from its valid voxels (default: all points valid)
+            
+        Returns:
+            validRegion: Boolean mask of valid points (intersection of all valid regions)
+        """
+        if basis is None:
+            basis = monomial_basis(xGrid, yGrid, zGrid)
+        if validRegion is None:
+            validRegion = np.ones(xGrid.shape, dtype=bool)
+        live, live_basis = self._live_rows(basis, validRegion)
+        print(f"[DEBUG] Computing valid region for {len(all_coeffs)} coefficient sets on {len(live)} points "
+              f"(active set)...")
+        valid, num_evaluated, _ = compute_valid_mask_active_set(live_basis, all_coeffs)
+        if num_evaluated < len(all_coeffs):
+            print(f"[DEBUG] Active set empty after {num_evaluated}/{len(all_coeffs)} coefficient sets")
+        validRegion.flat[live] = valid
+        return validRegion
+    
+    def compute_valid_region_scheduled(self, all_coeffs, xGrid, yGrid, zGrid, basis=None, validRegion=None):
+        """
+        Compute valid region processing the most restrictive coefficient sets first.
+        
+        All sets are ranked by how many voxels they eliminate on the valid
+        voxels of a coarse subgrid (every coarse_stride-th voxel), then
+        evaluated on the valid dense voxels in that order with active-set
+        compaction. Evaluation stops when the region is empty or, if patience
+        is set, when it has not changed for that many consecutive sets. The
+        count of unchanged sets is kept in self.unchanged_sets, so it carries
+        over from the previous call on the same running region.
+        
+        Args:
+            all_coeffs: List or array of coefficient matrices (M, 10, 7)
+            xGrid, yGrid, zGrid: 3D grid arrays
+            basis: Precomputed monomial basis of the grid (built if not given)
+            validRegion: Running valid region, updated in place (default: all points valid)
+            
+        Returns:
+            validRegion: Boolean mask of valid points (intersection of all valid regions)
+        """
+        if basis is None:
+            basis = monomial_basis(xGrid, yGrid, zGrid)
+        if validRegion is None:
+            validRegion = np.ones(xGrid.shape, dtype=bool)
+            self.unchanged_sets = 0
+        coeff_stack = np.asarray(all_coeffs, dtype=float).reshape(-1, 10, 7)
+        
+        s = self.coarse_stride
+        coarse = np.arange(validRegion.size).reshape(xGrid.shape)[::s, ::s, ::s].ravel()
+        coarse = coarse[validRegion.flat[coarse]]
+        order, eliminated = rank_coefficient_sets(basis[coarse], coeff_stack, self.memory_budget_mb)
+        print(f"[DEBUG] Ranked {len(coeff_stack)} coefficient sets on {len(coarse)} valid coarse voxels "
+              f"(eliminated {eliminated.max()} max, {eliminated.min()} min)")
+        
+        live, live_basis = self._live_rows(basis, validRegion)
+        valid, num_evaluated, self.unchanged_sets = compute_valid_mask_active_set(
+            live_basis, coeff_stack[order], self.patience, self.unchanged_sets
+        )
+        if num_evaluated < len(coeff_stack):
+            print(f"[DEBUG] Stopped after {num_evaluated}/{len(coeff_stack)} coefficient sets")
+        validRegion.flat[live] = valid
         return validRegion
     
+    def compute_valid_region_threaded(self, all_coeffs, xGrid, yGrid, zGrid, validRegion=None):
+        """
+        Compute valid region on a thread pool, one cache-sized slab of x-planes at a time.
+        
+        Each slab is evaluated for all coefficient sets while it is hot in
+        cache, using per-thread preallocated scratch buffers; NumPy releases
+        the GIL inside the elementwise kernels so slabs run concurrently.
+        
+        Args:
+            all_coeffs: List or array of coefficient matrices (M, 10, 7)
+            xGrid, yGrid, zGrid: 3D grid arrays
+            validRegion: Running valid region, updated in place; slabs without valid
+                voxels are skipped (default: all points valid)
+            
+        Returns:
+            validRegion: Boolean mask of valid points (intersection of all valid regions)
+        """
+        coeff_stack = np.asarray(all_coeffs, dtype=float).reshape(-1, 10, 7)
+        if validRegion is None:
+            validRegion = np.ones(xGrid.shape, dtype=bool)
+        plane_size = max(1, int(np.prod(xGrid.shape[1:])))
+        planes_per_slab = max(1, (self.slab_kb * 1024) // (8 * plane_size))
+        slabs = [(i, min(i + planes_per_slab, xGrid.shape[0])) for i in range(0, xGrid.shape[0], planes_per_slab)]
+        print(f"[DEBUG] Computing valid region for {len(coeff_stack)} coefficient sets "
+              f"({len(slabs)} slabs on {self.threads} threads)...")
+        
+        local = threading.local()
+        slab_shape = (planes_per_slab,) + xGrid.shape[1:]
+        
+        def run_slab(bounds):
+            if not hasattr(local, 'scratch'):
+                local.scratch = (np.empty(slab_shape), np.empty(slab_shape), np.empty(slab_shape),
+                                 np.empty(slab_shape, dtype=bool))
+            i0, i1 = bounds
+            if not validRegion[i0:i1].any():
+                return
+            compute_valid_region_slab(coeff_stack, xGrid[i0:i1], yGrid[i0:i1], zGrid[i0:i1],
+                                      validRegion[i0:i1], local.scratch)
+        
+        with ThreadPoolExecutor(max_workers=self.threads) as pool:
+            list(pool.map(run_slab, slabs))
+        return validRegion
+    
+    def compute_valid_region_octree(self, all_coeffs, xGrid, yGrid, zGrid):
+        """
+        Compute valid region with octree refinement instead of sampling the dense grid.
+        
+        Args:
+            all_coeffs: List or array of coefficient matrices (M, 10, 7)
+            xGrid, yGrid, zGrid: 3D grid arrays (only their axes are used)
+            
+        Returns:
+            validRegion: Boolean mask of valid points (intersection of all valid regions)
+        """
+        print(f"[DEBUG] Computing valid region for {len(all_coeffs)} coefficient sets (octree)...")
+        validRegion, stats = compute_valid_region_octree(
+            all_coeffs, xGrid[:, 0, 0], yGrid[0, :, 0], zGrid[0, 0, :], self.leaf_size, self.memory_budget_mb
+        )
+        print(f"[DEBUG] Octree: {stats['levels']} levels, {stats['inside_cells']} inside / "
+              f"{stats['outside_cells']} outside cells, {stats['sampled_voxels']}/{xGrid.size} voxels sampled")
+        return validRegion
+    
+    def compute_valid_region_raycast(self, all_coeffs, xGrid, yGrid, zGrid):
+        """
+        Compute valid region by solving the quadrics along every z-column.
+        
+        The exact intervals are kept in self.last_column_intervals so that the
+        boundary can be plotted without grid quantization.
+        
+        Args:
+            all_coeffs: List or array of coefficient matrices (M, 10, 7)
+            xGrid, yGrid, zGrid: 3D grid arrays (only their axes are used)
+            
+        Returns:
+            validRegion: Boolean mask of valid points (the intervals sampled at the grid)
+        """
+        print(f"[DEBUG] Computing valid region for {len(all_coeffs)} coefficient sets (raycast)...")
+        intervals = solve_column_intervals(
+            all_coeffs, xGrid[:, 0, 0], yGrid[0, :, 0], zGrid[0, 0, :], self.memory_budget_mb
+        )
+        print(f"[DEBUG] Raycast: {intervals.num_runs} intervals over {xGrid.shape[0] * xGrid.shape[1]} columns")
+        self.last_column_intervals = intervals
+        return intervals.rasterize()
+    
+    def compute_valid_region_progressive(self, all_coeffs, xGrid, yGrid, zGrid, validRegion=None,
+                                         point_test=None):
+        """
+        Compute valid region coarse-to-fine, evaluating only a band around the boundary.
+        
+        Every refinement level, ANDed with the running region, is passed to
+        self.preview_callback(stride, labels, level_axes) when it is set: one
+        preview per level, from the coarse stride down to the full grid.
+        
+        Args:
+            all_coeffs: List or array of coefficient matrices (M, 10, 7), or None with point_test
+            xGrid, yGrid, zGrid: 3D grid arrays (only their axes are used)
+            validRegion: Running valid region; voxels outside it are not evaluated
+                (default: all points valid)
+            point_test: Optional callable (xs, ys, zs) -> boolean array replacing the sign
+                test of all_coeffs
+            
+        Returns:
+            validRegion: Boolean mask of valid points (intersection of all valid regions)
+        """
+        if point_test is None:
+            print(f"[DEBUG] Computing valid region for {len(all_coeffs)} coefficient sets (progressive)...")
+        
+        def on_level(stride, labels, level_axes):
+            print(f"[DEBUG] Progressive level stride {stride}: {labels.sum()}/{labels.size} voxels valid")
+            if self.preview_callback is not None:
+                self.preview_callback(stride, labels, level_axes)
+        
+        validRegion, stats = compute_valid_region_progressive(
+            all_coeffs, xGrid[:, 0, 0], yGrid[0, :, 0], zGrid[0, 0, :], self.progressive_levels,
+            self.band, self.verify, on_level, self.memory_budget_mb, validRegion, point_test
+        )
+        print(f"[DEBUG] Progressive: {sum(stats['evaluated_voxels'])}/{xGrid.size} voxels evaluated "
+              f"(per level: {stats['evaluated_voxels']})")
+        if self.verify:
+            print(f"[DEBUG] Progressive verification corrected {stats['corrected_voxels']} voxels")
+        return validRegion
+    
+    def compute_valid_region_fused(self, all_coeffs, xGrid, yGrid, zGrid, validRegion=None):
+        """
+        Compute valid region with the fused sign-test kernel.
+        
+        Args:
+            all_coeffs: List or array of coefficient matrices (M, 10, 7)
+            xGrid, yGrid, zGrid: 3D grid arrays
+            validRegion: Running valid region, updated in place; blocks without valid
+                voxels are skipped (default: all points valid)
+            
+        Returns:
+            validRegion: Boolean mask of valid points (intersection of all valid regions)
+        """
+        backend = resolve_backend(self.kernel_backend)
+        print(f"[DEBUG] Computing valid region for {len(all_coeffs)} coefficient sets (fused, {backend})...")
+        return fused_valid_region(all_coeffs, xGrid, yGrid, zGrid, validRegion, backend=backend,
+                                  block_kb=self.slab_kb)
+    
     def compute_valid_region(self, coeffs, xGrid, yGrid, zGrid):
         """
         Compute valid region based on polynomial coefficients.
@@ -83,6 +788,12 @@ class WorkspaceAnalyzer:
         Returns:
             validRegion: Boolean mask of valid points
         """
+        if self.valid_region_mode == 'threaded':
+            return self.compute_valid_region_threaded([coeffs], xGrid, yGrid, zGrid)
+        if self.valid_region_mode == 'fused':
+            return fused_valid_region([coeffs], xGrid, yGrid, zGrid, backend=resolve_backend(self.kernel_backend),
+                                      block_kb=self.slab_kb)
+        
         coeff_det = coeffs[:, -1]
         polyValues_det = eval_poly(coeff_det, xGrid, yGrid, zGrid)
         validRegion = np.ones(xGrid.shape, dtype=bool)
@@ -95,6 +806,263 @@ class WorkspaceAnalyzer:
         
         return validRegion
     
+    def compute_valid_region_streaming(self, cable_index, pose_axes, xGrid, yGrid, zGrid, basis=None,
+                                       start=0, stop=None, validRegion=None):
+        """
+        Stream pose batches through the coefficient and valid-region stages.
+        
+        Each batch of pose_batch_size poses is generated, turned into
+        coefficients and immediately ANDed into the running valid region, so
+        memory is bounded by one batch plus the grid buffers regardless of the
+        number of poses. The valid-region engine receives the running region,
+        so the point-wise modes only test voxels that are still valid and the
+        'scheduled' patience counts unchanged poses across batches. Streaming
+        stops early once the region is empty or the patience is exhausted.
+        The 'progressive' mode instead refines the grid once over the whole
+        pose range (see compute_valid_region_progressive_streaming).
+        
+        Args:
+            cable_index: Index of the cable to analyze
+            pose_axes: Pose grid axes from create_pose_axes()
+            xGrid, yGrid, zGrid: 3D grid arrays
+            basis: Precomputed monomial basis of the grid (optional, used by the basis modes)
+            start, stop: Flat pose index range (default: all poses)
+            validRegion: Running valid region to AND the poses into (default: all points valid)
+            
+        Returns:
+            validRegion: Boolean mask of valid points (intersection of all valid regions)
+            coeff_time: Time spent computing coefficients
+            valid_time: Time spent in the valid-region stage
+        """
+        if stop is None:
+            stop = count_poses(pose_axes)
+        if validRegion is None:
+            validRegion = np.ones(xGrid.shape, dtype=bool) if stop > start else np.zeros(xGrid.shape, dtype=bool)
+        intervals = None
+        coeff_time = valid_time = 0.0
+        processed = 0
+        self.unchanged_sets = 0
+        if not validRegion.any():
+            return validRegion, coeff_time, valid_time
+        
+        surrogate = None
+        if self.coefficient_mode == 'surrogate':
+            surrogate = self.get_orientation_surrogate(cable_index, pose_axes)
+        
+        if self.valid_region_mode == 'progressive':
+            validRegion, coeff_time, valid_time = self.compute_valid_region_progressive_streaming(
+                cable_index, pose_axes, xGrid, yGrid, zGrid, start, stop, validRegion, surrogate
+            )
+        else:
+            for batch in iter_pose_batches(pose_axes, self.pose_batch_size, start, stop):
+                t0 = time.time()
+                if surrogate is not None:
+                    coeffs = surrogate.evaluate(batch)
+                else:
+                    coeffs = self.compute_coefficient_batch(batch, cable_index)
+                t1 = time.time()
+                validRegion = self.compute_valid_region_optimized(coeffs, xGrid, yGrid, zGrid, basis, validRegion)
+                if self.valid_region_mode == 'raycast':
+                    intervals = (self.last_column_intervals if intervals is None
+                                 else intervals.intersect(self.last_column_intervals))
+                valid_time += time.time() - t1
+                coeff_time += t1 - t0
+                processed += len(batch)
+                print(f"[DEBUG] Streamed {processed}/{stop - start} poses")
+                if not validRegion.any():
+                    print(f"[DEBUG] Valid region empty after {processed}/{stop - start} poses")
+                    break
+                if self.valid_region_mode == 'scheduled' and self.patience is not None and \
+                        self.unchanged_sets >= self.patience:
+                    print(f"[DEBUG] Valid region unchanged for {self.unchanged_sets} poses, "
+                          f"stopped after {processed}/{stop - start} poses")
+                    break
+        
+        if intervals is not None:
+            self.last_column_intervals = intervals
+        if surrogate is not None:
+            print(f"[DEBUG] Cable {cable_index+1}: orientation surrogate fitted {len(surrogate.fits)} positions "
+                  f"with {surrogate.num_exact} exact poses, estimated error {surrogate.max_error:.1e}")
+        return validRegion, coeff_time, valid_time
+    
+    def compute_valid_region_progressive_streaming(self, cable_index, pose_axes, xGrid, yGrid, zGrid, start, stop,
+                                                   validRegion, surrogate=None):
+        """
+        Coarse-to-fine valid region of a pose range, streaming the poses at every level.
+        
+        The progressive refinement runs once on the combined pose set: the
+        voxels of a level are tested against every pose batch in turn (only
+        the voxels that are still valid go on to the next batch), so the
+        refined band follows the boundary of the cable's workspace and each
+        preview is a level of the running intersection. The coefficients are
+        recomputed for every level, which keeps memory bounded by one batch.
+        
+        Args:
+            cable_index: Index of the cable to analyze
+            pose_axes: Pose grid axes from create_pose_axes()
+            xGrid, yGrid, zGrid: 3D grid arrays
+            start, stop: Flat pose index range
+            validRegion: Running valid region to AND the poses into
+            surrogate: Optional OrientationSurrogate providing the coefficients
+            
+        Returns:
+            validRegion: Boolean mask of valid points
+            coeff_time: Time spent computing coefficients
+            valid_time: Time spent in the valid-region stage
+        """
+        coeff_time = 0.0
+        
+        def point_test(xs, ys, zs):
+            nonlocal coeff_time
+            valid = np.ones(len(xs), dtype=bool)
+            for batch in iter_pose_batches(pose_axes, self.pose_batch_size, start, stop):
+                t0 = time.time()
+                if surrogate is not None:
+                    coeffs = surrogate.evaluate(batch)
+                else:
+                    coeffs = self.compute_coefficient_batch(batch, cable_index)
+                coeff_time += time.time() - t0
+                live = np.flatnonzero(valid)
+                valid[live] = compute_valid_points(coeffs, xs[live], ys[live], zs[live], self.memory_budget_mb)
+                if not valid.any():
+                    break
+            return valid
+        
+        print(f"[DEBUG] Computing valid region for {stop - start} streamed poses (progressive)...")
+        t_start = time.time()
+        validRegion[...] = self.compute_valid_region_progressive(None, xGrid, yGrid, zGrid, validRegion, point_test)
+        return validRegion, coeff_time, time.time() - t_start - coeff_time
+    
+    def compute_valid_region_poses(self, cable_index, pose_axes, xGrid, yGrid, zGrid, basis=None,
+                                   validRegion=None):
+        """
+        AND the poses of a pose grid into the running valid region.
+        
+        The orientations are streamed ('grid') or sampled adaptively ('adaptive')
+        as selected by orientation_sampling.
+        
+        Args:
+            cable_index: Index of the cable to analyze
+            pose_axes: Pose grid axes from create_pose_axes()
+            xGrid, yGrid, zGrid: 3D grid arrays
+            basis: Precomputed monomial basis of the grid (optional, used by the basis modes)
+            validRegion: Running valid region to AND the poses into (default: all points valid)
+            
+        Returns:
+            validRegion: Boolean mask of valid points
+            coeff_time: Time spent computing coefficients
+            valid_time: Time spent in the valid-region stage
+        """
+        if self.orientation_sampling == 'adaptive':
+            return self.compute_valid_region_adaptive_orientation(
+                cable_index, pose_axes, xGrid, yGrid, zGrid, validRegion
+            )
+        # Stream coefficient batches into the running valid region
+        print(f"[DEBUG] Streaming coefficients in batches of {self.pose_batch_size} poses...")
+        return self.compute_valid_region_streaming(
+            cable_index, pose_axes, xGrid, yGrid, zGrid, basis, validRegion=validRegion
+        )
+    
+    def compute_valid_region_converged(self, cable_index, pose_axes, xGrid, yGrid, zGrid, basis=None):
+        """
+        Add positions in rounds until the workspace volume stabilizes.
+        
+        Rounds of position_round positions (in sampler order) are ANDed into
+        the running valid region until a VolumeConvergenceMonitor with
+        position_tol and position_patience reports convergence or all
+        positions are applied. The volume history is kept in
+        self.position_history[cable_index].
+        
+        Args:
+            cable_index: Index of the cable to analyze
+            pose_axes: Pose grid axes from create_pose_axes()
+            xGrid, yGrid, zGrid: 3D grid arrays
+            basis: Precomputed monomial basis of the grid (optional, used by the basis modes)
+            
+        Returns:
+            validRegion: Boolean mask of valid points
+            coeff_time: Time spent computing coefficients
+            valid_time: Time spent in the valid-region stage
+        """
+        positions = pose_axes[0]
+        step = xGrid[1, 0, 0] - xGrid[0, 0, 0] if xGrid.shape[0] > 1 else 1.0
+        monitor = VolumeConvergenceMonitor(self.position_tol, self.position_patience, step ** 3)
+        validRegion = None
+        intervals = None
+        coeff_time = valid_time = 0.0
+        for start in range(0, len(positions), max(1, self.position_round)):
+            stop = min(start + max(1, self.position_round), len(positions))
+            self.last_column_intervals = None
+            validRegion, round_coeff_time, round_valid_time = self.compute_valid_region_poses(
+                cable_index, (positions[start:stop],) + tuple(pose_axes[1:]), xGrid, yGrid, zGrid, basis,
+                validRegion
+            )
+            coeff_time += round_coeff_time
+            valid_time += round_valid_time
+            if self.last_column_intervals is not None:
+                intervals = (self.last_column_intervals if intervals is None
+                             else intervals.intersect(self.last_column_intervals))
+            if monitor.update(validRegion, stop):
+                break
+        self.last_column_intervals = intervals
+        self.position_history[cable_index] = monitor
+        print(f"[DEBUG] Cable {cable_index+1}: {monitor.samples[-1]}/{len(positions)} positions applied, "
+              f"volume {monitor.volumes[-1]:.6g} (per round: {[f'{v:.6g}' for v in monitor.volumes]})")
+        return validRegion, coeff_time, valid_time
+    
+    def compute_valid_region_adaptive_orientation(self, cable_index, pose_axes, xGrid, yGrid, zGrid,
+                                                  validRegion=None):
+        """
+        Intersect the valid regions of adaptively sampled orientations.
+        
+        Only the poses of a coarse orientation lattice and of the cells whose
+        corner poses eliminate different voxels are evaluated (see
+        adaptive_orientation). With orientation_verify=True all grid poses are streamed
+        afterwards and the voxels they remove are reported.
+        
+        Args:
+            cable_index: Index of the cable to analyze
+            pose_axes: Pose grid axes from create_pose_axes()
+            xGrid, yGrid, zGrid: 3D grid arrays
+            validRegion: Running valid region to AND the poses into (default: all points valid)
+            
+        Returns:
+            validRegion: Boolean mask of valid points
+            coeff_time: Time spent computing coefficients
+            valid_time: Time spent in the valid-region stage
+        """
+        coeff_time = 0.0
+        
+        def coefficients(poses):
+            nonlocal coeff_time
+            t0 = time.time()
+            coeffs = np.empty((len(poses), 10, 7))
+            for start in range(0, len(poses), self.pose_batch_size):
+                stop = min(start + self.pose_batch_size, len(poses))
+                coeffs[start:stop] = self.compute_coefficient_batch(poses[start:stop], cable_index)
+            coeff_time += time.time() - t0
+            return coeffs
+        
+        t_start = time.time()
+        validRegion, stats = compute_valid_region_adaptive_orientation(
+            coefficients, pose_axes, xGrid, yGrid, zGrid, validRegion, levels=self.orientation_levels,
+            memory_budget_mb=self.memory_budget_mb
+        )
+        valid_time = time.time() - t_start - coeff_time
+        print(f"[DEBUG] Cable {cable_index+1}: adaptive orientation sampling evaluated "
+              f"{stats['evaluated_poses']}/{stats['total_poses']} poses (per level: {stats['poses_per_level']})")
+        
+        if self.orientation_verify:
+            checked, verify_coeff_time, verify_valid_time = self.compute_valid_region_streaming(
+                cable_index, pose_axes, xGrid, yGrid, zGrid, self.build_basis(xGrid, yGrid, zGrid),
+                validRegion=validRegion.copy()
+            )
+            print(f"[DEBUG] Adaptive orientation verification corrected {int((checked != validRegion).sum())} voxels")
+            validRegion = checked
+            coeff_time += verify_coeff_time
+            valid_time += verify_valid_time
+        return validRegion, coeff_time, valid_time
+    
     def extract_valid_points(self, xGrid, yGrid, zGrid, validRegion):
         """
         Extract valid points from grid based on valid region mask.
@@ -130,56 +1098,39 @@ class WorkspaceAnalyzer:
         """
         print(f"[DEBUG] Processing cable {cable_index+1}/{self.num_cables} (optimized)")
         
-        reference_point = self.base_points[:, cable_index]
-        xGrid, yGrid, zGrid = self.create_spatial_grid(reference_point, step)
+        xGrid, yGrid, zGrid = self.spatial_grid(cable_index, step)
         
         # Start timing
         t_start = time.time()
         
-        # Get parameter combinations
-        position_combinations = create_position_grid()
-        orientation_combinations = create_parameter_grid(
-            alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max, step
-        )
+        # Monomial basis is built once per grid and shared by all coefficient sets
+        basis = self.build_basis(xGrid, yGrid, zGrid)
         
-        total_combinations = len(position_combinations) * len(orientation_combinations)
+        # Pose grid axes; the combinations are generated batch by batch
+        pose_axes = self.pose_grid_axes(alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max, step)
+        total_combinations = count_poses(pose_axes)
         print(f"[DEBUG] Total parameter combinations: {total_combinations}")
         
-        # Pre-compute all coefficients
-        print("[DEBUG] Pre-computing all coefficients...")
-        t_coeff_start = time.time()
-        all_coeffs = []
-        q = np.zeros(6)
-        
-        for i, (q1, q2, q3) in enumerate(position_combinations):
-            for alpha, beta, gamma in orientation_combinations:
-                q[0] = q1
-                q[1] = q2
-                q[2] = q3
-                q[3] = alpha
-                q[4] = beta
-                q[5] = gamma
-                
-                coeffs = compute_h_i_u_coefficients(self.base_points, self.ee_points, q, cable_index)
-                all_coeffs.append(coeffs)
-                
-                if (i * len(orientation_combinations) + len(all_coeffs)) % 100 == 0:
-                    print(f"[DEBUG] Computed {len(all_coeffs)}/{total_combinations} coefficient sets")
-        
-        t_coeff_end = time.time()
-        coeff_time = t_coeff_end - t_coeff_start
+        if self.position_tol is not None:
+            validRegion, coeff_time, valid_time = self.compute_valid_region_converged(
+                cable_index, pose_axes, xGrid, yGrid, zGrid, basis
+            )
+        else:
+            validRegion, coeff_time, valid_time = self.compute_valid_region_poses(
+                cable_index, pose_axes, xGrid, yGrid, zGrid, basis
+            )
+        if self.valid_region_mode == 'raycast':
+            self.column_intervals[cable_index] = self.last_column_intervals
         print(f"[TIME] Cable {cable_index+1}: coefficient computation time: {coeff_time:.3f}s")
-        
-        # Compute valid region once for all coefficients
-        print("[DEBUG] Computing valid region for all coefficients...")
-        t_valid_start = time.time()
-        validRegion = self.compute_valid_region_optimized(all_coeffs, xGrid, yGrid, zGrid)
-        t_valid_end = time.time()
-        valid_time = t_valid_end - t_valid_start
         print(f"[TIME] Cable {cable_index+1}: valid region computation time: {valid_time:.3f}s")
+        if self.coefficient_cache is not None:
+            stats = self.coefficient_cache.stats()
+            print(f"[CACHE] hits: {stats['hits_memory']} memory / {stats['hits_disk']} disk, "
+                  f"misses: {stats['misses']}, hit rate: {stats['hit_rate']:.1%}")
         
         # Extract valid points
         t_extract_start = time.time()
+        self.workspace_masks[cable_index] = WorkspaceMask.from_grid(validRegion, xGrid, yGrid, zGrid, step)
         intersection_points = self.extract_valid_points(xGrid, yGrid, zGrid, validRegion)
         t_extract_end = time.time()
         extract_time = t_extract_end - t_extract_start
@@ -195,6 +1146,225 @@ class WorkspaceAnalyzer:
         
         return intersection_points, computation_time
     
+    def analyze_single_cable_incremental(self, cable_index, alpha_min, alpha_max, beta_min, beta_max,
+                                         gamma_min, gamma_max, step):
+        """
+        Analyze workspace for a single cable, reusing the previous incremental run.
+        
+        The mask of the last run is kept with the pose grid it was computed
+        for. When the robot geometry, spatial grid, valid-region and
+        coefficient modes and their tuning options (mask_settings) are
+        unchanged and the new pose grid contains every old pose, only the
+        additional poses are ANDed into the kept mask; otherwise the cable is
+        recomputed from scratch.
+        
+        Args:
+            cable_index: Index of the cable to analyze
+            alpha_min, alpha_max: Alpha angle range
+            beta_min, beta_max: Beta angle range
+            gamma_min, gamma_max: Gamma angle range
+            step: Grid step size
+            
+        Returns:
+            intersection_points: Array of intersection points
+            computation_time: Time taken for computation
+            
+        Raises:
+            ValueError: For options of the full serial optimized analysis only
+                (orientation_sampling='adaptive', position_tol, symmetry)
+        """
+        if self.orientation_sampling != 'grid':
+            raise ValueError("orientation_sampling='adaptive' is not supported with incremental analysis")
+        if self.position_tol is not None:
+            raise ValueError("position_tol is not supported with incremental analysis")
+        if self.symmetry:
+            raise ValueError("symmetry is not supported with incremental analysis")
+        
+        print(f"[DEBUG] Processing cable {cable_index+1}/{self.num_cables} (incremental)")
+        
+        xGrid, yGrid, zGrid = self.spatial_grid(cable_index, step)
+        
+        # Start timing
+        t_start = time.time()
+        
+        pose_axes = self.pose_grid_axes(alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max, step)
+        signature = (config_digest(self.base_points, self.ee_points, self.coefficient_mode), float(step),
+                     xGrid.shape, (xGrid[0, 0, 0], yGrid[0, 0, 0], zGrid[0, 0, 0]), self.mask_settings())
+        state = self.incremental_state.get(cable_index)
+        pending = None
+        if state is not None and state['signature'] == signature:
+            pending = pose_grid_difference(pose_axes, state['pose_axes'])
+        
+        if pending is None:
+            print(f"[DEBUG] Cable {cable_index+1}: no reusable result, computing {count_poses(pose_axes)} poses")
+            pending = [pose_axes]
+            validRegion = np.ones(xGrid.shape, dtype=bool) if count_poses(pose_axes) else np.zeros(xGrid.shape, dtype=bool)
+            intervals = None
+        else:
+            print(f"[DEBUG] Cable {cable_index+1}: applying {sum(count_poses(p) for p in pending)} "
+                  f"additional poses of {count_poses(pose_axes)}")
+            validRegion = state['mask'].to_bool()
+            intervals = state['intervals']
+        
+        basis = self.build_basis(xGrid, yGrid, zGrid) if pending else None
+        for axes in pending:
+            self.last_column_intervals = None
+            validRegion, _, _ = self.compute_valid_region_streaming(
+                cable_index, axes, xGrid, yGrid, zGrid, basis, validRegion=validRegion
+            )
+            if self.last_column_intervals is not None:
+                intervals = (self.last_column_intervals if intervals is None
+                             else intervals.intersect(self.last_column_intervals))
+        
+        mask = WorkspaceMask.from_grid(validRegion, xGrid, yGrid, zGrid, step)
+        self.incremental_state[cable_index] = {
+            'signature': signature, 'pose_axes': pose_axes, 'mask': mask, 'intervals': intervals
+        }
+        self.workspace_masks[cable_index] = mask
+        if intervals is not None:
+            self.column_intervals[cable_index] = intervals
+        intersection_points = self.extract_valid_points(xGrid, yGrid, zGrid, validRegion)
+        
+        # End timing
+        computation_time = time.time() - t_start
+        
+        print(f"[DEBUG] Cable {cable_index+1}: {len(intersection_points)} intersection points")
+        print(f"[TIME] Cable {cable_index+1}: total calculation time: {computation_time:.3f}s")
+        
+        return intersection_points, computation_time
+    
+    def plan_symmetric_cables(self, pose_axes):
+        """
+        Cables whose masks can be derived by symmetry from an earlier cable.
+        
+        Args:
+            pose_axes: Pose grid axes of the analysis
+            
+        Returns:
+            Dict target cable -> (source cable, symmetry) (see workspace_symmetry)
+        """
+        if self.orientation_sampling != 'grid' or self.position_tol is not None:
+            print("[DEBUG] Symmetry derivation needs grid orientations and all positions; computing every cable")
+            return {}
+        symmetries = find_symmetries(self.base_points, self.ee_points, pose_axes)
+        derivations = plan_derivations(symmetries, self.num_cables)
+        print(f"[DEBUG] Found {len(symmetries)} symmetries; derived cables: "
+              f"{ {t + 1: s + 1 for t, (s, _) in derivations.items()} }")
+        return derivations
+    
+    def verify_derived_mask(self, cable_index, pose_axes, xGrid, yGrid, zGrid, validRegion):
+        """
+        Check a derived mask against the exact test on a sample of voxels.
+        
+        Half of the symmetry_samples voxels are drawn from the valid and half
+        from the invalid voxels. Every pose is applied to them with the slab
+        kernel, and their labels are replaced by the exact ones in place.
+        
+        Args:
+            cable_index: Index of the cable of the mask
+            pose_axes: Pose grid axes of the analysis
+            xGrid, yGrid, zGrid: 3D grid arrays
+            validRegion: Derived mask, corrected in place
+            
+        Returns:
+            mismatches: Number of checked voxels whose label was wrong
+            checked: Number of checked voxels
+        """
+        rng = np.random.default_rng(cable_index)
+        flat = validRegion.reshape(-1)
+        valid_voxels = np.flatnonzero(flat)
+        invalid_voxels = np.flatnonzero(~flat)
+        num_valid = min(self.symmetry_samples // 2, len(valid_voxels))
+        num_invalid = min(self.symmetry_samples - num_valid, len(invalid_voxels))
+        sample = np.concatenate((rng.choice(valid_voxels, num_valid, replace=False),
+                                 rng.choice(invalid_voxels, num_invalid, replace=False)))
+        xs, ys, zs = xGrid.reshape(-1)[sample], yGrid.reshape(-1)[sample], zGrid.reshape(-1)[sample]
+        
+        exact = np.ones(len(sample), dtype=bool)
+        for batch in iter_pose_batches(pose_axes, self.pose_batch_size):
+            live = np.flatnonzero(exact)
+            if not len(live):
+                break
+            coeffs = self.compute_coefficient_batch(batch, cable_index)
+            exact[live] = compute_valid_points(coeffs, xs[live], ys[live], zs[live], self.memory_budget_mb)
+        mismatches = int((exact != flat[sample]).sum())
+        flat[sample] = exact
+        return mismatches, len(sample)
+    
+    def analyze_single_cable_symmetric(self, cable_index, source_index, symmetry, pose_axes, step):
+        """
+        Derive the workspace of a cable from the computed mask of a symmetric cable.
+        
+        The source mask is reflected/permuted onto the cable's grid and
+        verified on a sample of voxels (verify_derived_mask).
+        
+        Args:
+            cable_index: Index of the cable to derive
+            source_index: Index of the computed cable it is the image of
+            symmetry: Symmetry from find_symmetries() taking the source onto the cable
+            pose_axes: Pose grid axes of the analysis
+            step: Grid step size
+            
+        Returns:
+            (intersection_points, computation_time), or None when the mask cannot be
+            derived or fails the verification
+        """
+        t_start = time.time()
+        source_grid = self.spatial_grid(source_index, step)
+        xGrid, yGrid, zGrid = self.spatial_grid(cable_index, step)
+        source_axes = (source_grid[0][:, 0, 0], source_grid[1][0, :, 0], source_grid[2][0, 0, :])
+        validRegion = map_mask(self.workspace_masks[source_index].to_bool(), source_axes,
+                               (xGrid[:, 0, 0], yGrid[0, :, 0], zGrid[0, 0, :]), symmetry)
+        if validRegion is None:
+            print(f"[DEBUG] Cable {cable_index+1}: the grid of cable {source_index+1} does not map onto its grid")
+            return None
+        
+        mismatches, checked = self.verify_derived_mask(cable_index, pose_axes, xGrid, yGrid, zGrid, validRegion)
+        print(f"[VERIFY] Cable {cable_index+1} derived from cable {source_index+1}: "
+              f"{mismatches}/{checked} sampled voxels disagree")
+        if mismatches > self.symmetry_tolerance * checked:
+            print(f"[WARNING] Cable {cable_index+1}: derived mask rejected, computing the cable")
+            return None
+        
+        self.workspace_masks[cable_index] = WorkspaceMask.from_grid(validRegion, xGrid, yGrid, zGrid, step)
+        intersection_points = self.extract_valid_points(xGrid, yGrid, zGrid, validRegion)
+        computation_time = time.time() - t_start
+        print(f"[DEBUG] Cable {cable_index+1}: {len(intersection_points)} intersection points")
+        print(f"[TIME] Cable {cable_index+1}: total calculation time: {computation_time:.3f}s")
+        return intersection_points, computation_time
+    
+    def analyze_single_cable_sharded(self, cable_index, alpha_min, alpha_max, beta_min, beta_max,
+                                     gamma_min, gamma_max, step, workers, shards=None):
+        """
+        Analyze workspace for a single cable with its poses sharded across worker processes.
+        
+        Args:
+            cable_index: Index of the cable to analyze
+            alpha_min, alpha_max: Alpha angle range
+            beta_min, beta_max: Beta angle range
+            gamma_min, gamma_max: Gamma angle range
+            step: Grid step size
+            workers: Number of worker processes
+            shards: Number of pose shards (default: workers)
+            
+        Returns:
+            intersection_points: Array of intersection points
+            computation_time: Time taken for computation
+        """
+        from workspace_parallel import analyze_single_cable_sharded
+        
+        if self.base_points is None:
+            self.initialize_robot_config()
+        print(f"[DEBUG] Processing cable {cable_index+1}/{self.num_cables} (sharded)")
+        validRegion, grid, computation_time = analyze_single_cable_sharded(
+            self, cable_index, alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max, step,
+            workers, shards
+        )
+        intersection_points = self.extract_valid_points(*grid, validRegion)
+        print(f"[DEBUG] Cable {cable_index+1}: {len(intersection_points)} intersection points")
+        print(f"[TIME] Cable {cable_index+1}: total calculation time: {computation_time:.3f}s")
+        return intersection_points, computation_time
+    
     def analyze_single_cable(self, cable_index, alpha_min, alpha_max, beta_min, beta_max,
                            gamma_min, gamma_max, step):
         """
@@ -213,20 +1383,22 @@ class WorkspaceAnalyzer:
         """
         print(f"[DEBUG] Processing cable {cable_index+1}/{self.num_cables}")
         
-        reference_point = self.base_points[:, cable_index]
-        xGrid, yGrid, zGrid = self.create_spatial_grid(reference_point, step)
+        xGrid, yGrid, zGrid = self.spatial_grid(cable_index, step)
         grid_shape = xGrid.shape
         
-        all_points = []
+        # Bit-packed running intersection of the per-pose valid regions
+        workspace = WorkspaceMask.full(grid_shape, (xGrid[0, 0, 0], yGrid[0, 0, 0], zGrid[0, 0, 0]), step)
         q = np.zeros(6)
         
         # Start timing
         t_start = time.time()
         
-        # Get parameter combinations
-        position_combinations = create_position_grid()
+        # Get parameter combinations (positions from the configured sampler)
+        position_combinations = sample_positions(self.position_sampling, self.position_bounds,
+                                                 self.position_samples, self.position_seed)
         orientation_combinations = create_parameter_grid(
-            alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max, step
+            alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max,
+            step if self.orientation_step is None else self.orientation_step
         )
         
         # Process all combinations
@@ -241,11 +1413,11 @@ class WorkspaceAnalyzer:
                 
                 coeffs = compute_h_i_u_coefficients(self.base_points, self.ee_points, q, cable_index)
                 validRegion = self.compute_valid_region(coeffs, xGrid, yGrid, zGrid)
-                points = self.extract_valid_points(xGrid, yGrid, zGrid, validRegion)
-                all_points.append(points)
+                workspace &= WorkspaceMask.from_grid(validRegion, xGrid, yGrid, zGrid, step)
         
-        # Compute intersection
-        intersection_points = compute_intersection_points(all_points)
+        # Points of the intersection
+        self.workspace_masks[cable_index] = workspace
+        intersection_points = workspace.to_points()
         
         # End timing
         t_end = time.time()
@@ -257,7 +1429,8 @@ class WorkspaceAnalyzer:
         return intersection_points, computation_time
     
     def run_full_analysis(self, alpha_min, alpha_max, beta_min, beta_max,
-                         gamma_min, gamma_max, step, use_optimized=True):
+                         gamma_min, gamma_max, step, use_optimized=True, workers=None, pose_chunks=1,
+                         incremental=False, spatial_bounds=None, position_bounds=None):
         """
         Run full workspace analysis for all cables.
         
@@ -267,6 +1440,17 @@ class WorkspaceAnalyzer:
             gamma_min, gamma_max: Gamma angle range
             step: Grid step size
             use_optimized: Whether to use the optimized version
+            workers: Number of worker processes; cables (and pose chunks) are
+                analyzed in parallel when greater than 1 (optimized version only, see
+                run_parallel_analysis)
+            pose_chunks: Number of pose chunks per cable when running in parallel
+            incremental: Reuse the masks of the previous incremental run when only
+                poses were added (serial optimized version; see
+                analyze_single_cable_incremental for the options it rejects)
+            spatial_bounds: (x_min, x_max, y_min, y_max, z_min, z_max) of the global grid
+                shared by all cables; replaces the analyzer's spatial_bounds when given
+            position_bounds: (x_min, x_max, y_min, y_max, z_min, z_max) of the sampled
+                end-effector positions; replaces the analyzer's position_bounds when given
             
         Returns:
             intersection_points_sets: List of intersection points for each cable
@@ -274,6 +1458,10 @@ class WorkspaceAnalyzer:
         """
         if self.base_points is None:
             self.initialize_robot_config()
+        if spatial_bounds is not None:
+            self.spatial_bounds = tuple(float(b) for b in spatial_bounds)
+        if position_bounds is not None:
+            self.position_bounds = tuple(float(b) for b in position_bounds)
         
         print(f"[DEBUG] Input Ranges: alpha=({alpha_min},{alpha_max}), beta=({beta_min},{beta_max}), gamma=({gamma_min},{gamma_max}), step={step}")
         print(f"[DEBUG] Using {'optimized' if use_optimized else 'original'} algorithm")
@@ -281,8 +1469,27 @@ class WorkspaceAnalyzer:
         intersection_points_sets = [None] * self.num_cables
         total_time = 0
         
+        if use_optimized and workers is not None and workers > 1:
+            return self.run_parallel_analysis(alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max,
+                                              step, workers, pose_chunks, incremental)
+        
+        derivations = {}
+        if use_optimized and not incremental and self.symmetry:
+            pose_axes = self.pose_grid_axes(alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max, step)
+            derivations = self.plan_symmetric_cables(pose_axes)
+        
         for cable_index in range(self.num_cables):
-            if use_optimized:
+            derived = None
+            if cable_index in derivations:
+                derived = self.analyze_single_cable_symmetric(cable_index, *derivations[cable_index], pose_axes, step)
+            if derived is not None:
+                intersection_points, cable_time = derived
+            elif use_optimized and incremental:
+                intersection_points, cable_time = self.analyze_single_cable_incremental(
+                    cable_index, alpha_min, alpha_max, beta_min, beta_max, 
+                    gamma_min, gamma_max, step
+                )
+            elif use_optimized:
                 intersection_points, cable_time = self.analyze_single_cable_optimized(
                     cable_index, alpha_min, alpha_max, beta_min, beta_max, 
                     gamma_min, gamma_max, step
@@ -296,4 +1503,96 @@ class WorkspaceAnalyzer:
             total_time += cable_time
         
         print(f"[TIME] Total analysis time: {total_time:.3f}s")
-        return intersection_points_sets, total_time 
\ No newline at end of file
+        return intersection_points_sets, total_time
+    
+    def run_parallel_analysis(self, alpha_min, alpha_max, beta_min, beta_max,
+                              gamma_min, gamma_max, step, workers, pose_chunks=1, incremental=False):
+        """
+        Run the optimized analysis of all cables on a process pool.
+        
+        With symmetry=True only the source cables are computed in parallel;
+        the other cables are derived from them, and cables whose derived mask
+        is rejected are computed in a second parallel run.
+        
+        Args:
+            alpha_min, alpha_max: Alpha angle range
+            beta_min, beta_max: Beta angle range
+            gamma_min, gamma_max: Gamma angle range
+            step: Grid step size
+            workers: Number of worker processes
+            pose_chunks: Number of pose chunks per cable
+            incremental: Must be False (the parallel path has no incremental reuse)
+            
+        Returns:
+            intersection_points_sets: List of intersection points for each cable
+            total_time: Total computation time
+            
+        Raises:
+            ValueError: For options of the serial optimized analysis only (incremental,
+                orientation_sampling='adaptive', position_tol)
+        """
+        from workspace_parallel import analyze_cables_parallel
+        
+        if incremental:
+            raise ValueError("incremental analysis is not supported with workers > 1")
+        if self.orientation_sampling != 'grid':
+            raise ValueError("orientation_sampling='adaptive' is not supported with workers > 1")
+        if self.position_tol is not None:
+            raise ValueError("position_tol is not supported with workers > 1")
+        
+        intersection_points_sets = [None] * self.num_cables
+        pose_axes = self.pose_grid_axes(alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max, step)
+        derivations = self.plan_symmetric_cables(pose_axes) if self.symmetry else {}
+        pending = [c for c in range(self.num_cables) if c not in derivations]
+        total_time = 0
+        while pending:
+            valid_regions, grids, intervals, wall_time = analyze_cables_parallel(
+                self, alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max, step,
+                workers, pose_chunks, cable_indices=pending
+            )
+            total_time += wall_time
+            for cable_index, validRegion in valid_regions.items():
+                self.workspace_masks[cable_index] = WorkspaceMask.from_grid(validRegion, *grids[cable_index], step)
+                if cable_index in intervals:
+                    self.column_intervals[cable_index] = intervals[cable_index]
+                intersection_points_sets[cable_index] = self.extract_valid_points(*grids[cable_index], validRegion)
+                print(f"[DEBUG] Cable {cable_index+1}: {len(intersection_points_sets[cable_index])} intersection points")
+            
+            # Derive the symmetric cables once their sources are computed
+            pending = []
+            for cable_index, (source_index, symmetry) in list(derivations.items()):
+                if intersection_points_sets[source_index] is None:
+                    continue
+                del derivations[cable_index]
+                derived = self.analyze_single_cable_symmetric(cable_index, source_index, symmetry, pose_axes, step)
+                if derived is None:
+                    pending.append(cable_index)
+                    continue
+                intersection_points_sets[cable_index], cable_time = derived
+                total_time += cable_time
+        
+        print(f"[TIME] Total analysis time: {total_time:.3f}s")
+        return intersection_points_sets, total_time
+    
+    def intersect_cable_workspaces(self, cable_indices=None):
+        """
+        Intersect the workspace masks of several analyzed cables.
+        
+        The masks are aligned on their common grid (all cable grids share the
+        step, so only an integer voxel offset is needed) and combined with a
+        bitwise AND. With spatial_bounds set, all masks are on the same global
+        grid and the AND needs no alignment.
+        
+        Args:
+            cable_indices: Cables to intersect (default: all analyzed cables)
+            
+        Returns:
+            WorkspaceMask of the voxels valid for every cable (None if none analyzed)
+            
+        Raises:
+            ValueError: If the cable grids are not aligned (step does not divide their offsets)
+        """
+        if cable_indices is None:
+            cable_indices = sorted(self.workspace_masks)
+        masks = [self.workspace_masks[c] for c in cable_indices]
+        return intersect_masks(masks)
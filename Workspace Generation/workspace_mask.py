@@ -0,0 +1,217 @@
+import numpy as np
+
+# Number of set bits of every byte value
+POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+class WorkspaceMask:
+    """
+    Bit-packed boolean voxel grid with origin/step metadata.
+
+    Voxel (i, j, k) is the point origin + (i, j, k) * step (see axes()). One bit per voxel
+    replaces the three float64 coordinates of a point cloud, and set operations
+    are bitwise operations on the packed words instead of sorted intersections
+    of float points.
+    """
+
+    def __init__(self, bits, shape, origin, step):
+        """
+        Args:
+            bits: Packed voxel bits (np.packbits of the C-ordered boolean grid)
+            shape: Grid shape (Nx, Ny, Nz)
+            origin: Coordinates of voxel (0, 0, 0)
+            step: Grid step size
+        """
+        self.shape = tuple(int(n) for n in shape)
+        self.origin = np.asarray(origin, dtype=float)
+        self.step = float(step)
+        self.bits = np.asarray(bits, dtype=np.uint8)
+        if self.bits.size != (self.size + 7) // 8:
+            raise ValueError(f"Expected {(self.size + 7) // 8} packed bytes for shape {self.shape}, got {self.bits.size}")
+
+    @classmethod
+    def from_bool(cls, valid, origin, step):
+        """Pack a boolean grid."""
+        valid = np.asarray(valid, dtype=bool)
+        return cls(np.packbits(valid.ravel()), valid.shape, origin, step)
+
+    @classmethod
+    def from_grid(cls, validRegion, xGrid, yGrid, zGrid, step):
+        """Pack a valid-region mask defined on meshgrid arrays (indexing='ij')."""
+        origin = (xGrid[0, 0, 0], yGrid[0, 0, 0], zGrid[0, 0, 0])
+        return cls.from_bool(validRegion, origin, step)
+
+    @classmethod
+    def full(cls, shape, origin, step, value=True):
+        """Mask with every voxel set to value."""
+        size = int(np.prod(shape))
+        bits = np.full((size + 7) // 8, 0xFF if value else 0, dtype=np.uint8)
+        if value and size % 8:
+            bits[-1] = (0xFF << (8 - size % 8)) & 0xFF
+        return cls(bits, shape, origin, step)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    @property
+    def nbytes(self):
+        return self.bits.nbytes
+
+    def copy(self):
+        return WorkspaceMask(self.bits.copy(), self.shape, self.origin.copy(), self.step)
+
+    def count(self):
+        """Number of set voxels."""
+        return int(POPCOUNT[self.bits].sum(dtype=np.int64))
+
+    def __len__(self):
+        return self.count()
+
+    def to_bool(self):
+        """Unpack to a boolean grid of the mask's shape."""
+        return np.unpackbits(self.bits, count=self.size).astype(bool).reshape(self.shape)
+
+    def axes(self):
+        """
+        Grid axes x, y, z of the mask.
+
+        Computed like np.arange(origin, ..., step) (origin + k * ((origin + step) - origin)),
+        so the coordinates equal those of the grids built by create_spatial_grid.
+        """
+        return tuple(o + np.arange(n) * ((o + self.step) - o) for o, n in zip(self.origin, self.shape))
+
+    def to_points(self):
+        """
+        Coordinates of the set voxels, in (x, y, z) lexicographic order.
+
+        Returns:
+            points: Array of shape (count, 3)
+        """
+        index = np.argwhere(self.to_bool())
+        return np.column_stack([axis[index[:, d]] for d, axis in enumerate(self.axes())])
+
+    def offset_to(self, other):
+        """
+        Integer voxel offset of other's origin relative to this origin.
+
+        Raises:
+            ValueError: If the grids have different steps or are not aligned
+        """
+        if not np.isclose(self.step, other.step, rtol=1e-9, atol=0):
+            raise ValueError(f"Cannot combine masks with steps {self.step} and {other.step}")
+        offset = (other.origin - self.origin) / self.step
+        rounded = np.round(offset)
+        if not np.allclose(offset, rounded, rtol=0, atol=1e-6):
+            raise ValueError(f"Mask grids are not aligned (offset {offset} voxels)")
+        return rounded.astype(np.int64)
+
+    def reindex(self, origin, shape):
+        """
+        Copy of the mask on another aligned grid; voxels outside this mask are unset.
+
+        Args:
+            origin: Origin of the target grid (aligned with this grid)
+            shape: Shape of the target grid
+
+        Returns:
+            WorkspaceMask on the target grid
+        """
+        target = WorkspaceMask.full(shape, origin, self.step, value=False)
+        start = target.offset_to(self)
+        src, dst = [], []
+        for d in range(3):
+            lo = max(0, -start[d])
+            hi = min(self.shape[d], shape[d] - start[d])
+            if hi <= lo:
+                return target
+            src.append(slice(lo, hi))
+            dst.append(slice(lo + start[d], hi + start[d]))
+        valid = np.zeros(target.shape, dtype=bool)
+        valid[tuple(dst)] = self.to_bool()[tuple(src)]
+        return WorkspaceMask.from_bool(valid, target.origin, self.step)
+
+    def _aligned_bits(self, other, union):
+        """Packed bits of both masks on a common grid (bounding box of both or of the overlap)."""
+        if self.shape == other.shape and np.array_equal(self.origin, other.origin):
+            return self.bits, other.bits, self.origin, self.shape
+        start = self.offset_to(other)
+        stop = start + np.array(other.shape)
+        if union:
+            lo, hi = np.minimum(0, start), np.maximum(self.shape, stop)
+        else:
+            lo, hi = np.maximum(0, start), np.maximum(np.minimum(self.shape, stop), np.maximum(0, start))
+        origin = self.origin + lo * self.step
+        shape = tuple(int(n) for n in hi - lo)
+        return self.reindex(origin, shape).bits, other.reindex(origin, shape).bits, origin, shape
+
+    def __and__(self, other):
+        a, b, origin, shape = self._aligned_bits(other, union=False)
+        return WorkspaceMask(a & b, shape, origin, self.step)
+
+    def __or__(self, other):
+        a, b, origin, shape = self._aligned_bits(other, union=True)
+        return WorkspaceMask(a | b, shape, origin, self.step)
+
+    def __sub__(self, other):
+        """Voxels of this mask that are not in other, on this mask's grid."""
+        if not (self.shape == other.shape and np.array_equal(self.origin, other.origin)):
+            other = other.reindex(self.origin, self.shape)
+        return WorkspaceMask(self.bits & ~other.bits, self.shape, self.origin, self.step)
+
+    def __iand__(self, other):
+        """In-place AND for masks on the same grid (e.g. accumulating poses)."""
+        if self.shape != other.shape or not np.array_equal(self.origin, other.origin):
+            return self & other
+        self.bits &= other.bits
+        return self
+
+    def __ior__(self, other):
+        """In-place OR for masks on the same grid."""
+        if self.shape != other.shape or not np.array_equal(self.origin, other.origin):
+            return self | other
+        self.bits |= other.bits
+        return self
+
+    def __eq__(self, other):
+        if not isinstance(other, WorkspaceMask):
+            return NotImplemented
+        return (self.shape == other.shape and np.array_equal(self.origin, other.origin)
+                and self.step == other.step and np.array_equal(self.bits, other.bits))
+
+    def __repr__(self):
+        return (f"WorkspaceMask(shape={self.shape}, origin={self.origin.tolist()}, "
+                f"step={self.step}, count={self.count()})")
+
+def intersect_masks(masks):
+    """
+    Intersection of several workspace masks.
+
+    Args:
+        masks: List of WorkspaceMask
+
+    Returns:
+        WorkspaceMask (None for an empty list)
+    """
+    if not masks:
+        return None
+    result = masks[0].copy()
+    for mask in masks[1:]:
+        result &= mask
+    return result
+
+def union_masks(masks):
+    """
+    Union of several workspace masks on the bounding grid of all of them.
+
+    Args:
+        masks: List of WorkspaceMask
+
+    Returns:
+        WorkspaceMask (None for an empty list)
+    """
+    if not masks:
+        return None
+    result = masks[0].copy()
+    for mask in masks[1:]:
+        result |= mask
+    return result
@@ -0,0 +1,171 @@
+import numpy as np
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from workspace_analyzer import WorkspaceAnalyzer
+from workspace_utils import count_poses
+
+# Per-process state, set once by the pool initializer
+_worker_analyzer = None
+_worker_axes = None
+_worker_pose_axes = None
+_worker_grid = None
+
+def _init_worker(base_points, ee_points, options, axes, pose_axes):
+    """Receive robot configuration, grid axes and pose grid axes once per worker process."""
+    global _worker_analyzer, _worker_axes, _worker_pose_axes
+    _worker_analyzer = WorkspaceAnalyzer(**options)
+    _worker_analyzer.base_points = base_points
+    _worker_analyzer.ee_points = ee_points
+    _worker_analyzer.num_cables = base_points.shape[1]
+    _worker_axes = axes
+    _worker_pose_axes = pose_axes
+
+def _analyze_task(cable_index, pose_start, pose_stop, shm_name):
+    """
+    Compute the valid region of one cable for a slice of the poses.
+
+    The poses of the slice are streamed through the coefficient and
+    valid-region stages in batches. The mask is bit-packed and written into the shared memory block created
+    by the parent instead of being pickled back. In 'raycast' mode the
+    column intervals of the slice are returned with it.
+
+    Returns:
+        cable_index, pose_start, column intervals (None unless 'raycast'), computation time
+    """
+    global _worker_grid
+    t_start = time.time()
+    axes = _worker_axes[cable_index]
+    # Tasks on the same axes (pose chunks of a cable, or all cables on the
+    # shared global grid) reuse the grid and basis of the previous task
+    if _worker_grid is None or _worker_grid[0] is not axes:
+        xGrid, yGrid, zGrid = np.meshgrid(*axes, indexing='ij')
+        _worker_grid = (axes, (xGrid, yGrid, zGrid), _worker_analyzer.build_basis(xGrid, yGrid, zGrid))
+    (xGrid, yGrid, zGrid), basis = _worker_grid[1], _worker_grid[2]
+    _worker_analyzer.last_column_intervals = None
+    valid, _, _ = _worker_analyzer.compute_valid_region_streaming(
+        cable_index, _worker_pose_axes, xGrid, yGrid, zGrid, basis, pose_start, pose_stop
+    )
+
+    packed = np.packbits(valid.ravel())
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        np.ndarray(packed.shape, dtype=np.uint8, buffer=shm.buf)[...] = packed
+    finally:
+        shm.close()
+    return cable_index, pose_start, _worker_analyzer.last_column_intervals, time.time() - t_start
+
+def split_range(n, num_chunks):
+    """Split range(n) into at most num_chunks contiguous, non-empty (start, stop) pairs."""
+    bounds = np.linspace(0, n, max(1, num_chunks) + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+def analyze_cables_parallel(analyzer, alpha_min, alpha_max, beta_min, beta_max,
+                            gamma_min, gamma_max, step, workers, pose_chunks=1,
+                            cable_indices=None):
+    """
+    Run the optimized analysis of several cables on a process pool.
+
+    Every (cable, pose chunk) pair is one task. The robot configuration, grid
+    axes and pose array are sent to each worker once through the pool
+    initializer; the poses themselves are generated in the workers, batch by
+    batch, from the pose grid axes. Each task returns a bit-packed partial mask in shared memory
+    and the partial masks of a cable are reduced with bitwise AND, which
+    makes the result identical to the serial path (the AND over poses does
+    not depend on how the poses are sharded). The column intervals of the
+    chunks ('raycast' mode) are intersected in the same way.
+
+    Args:
+        analyzer: Configured WorkspaceAnalyzer (robot config initialized)
+        alpha_min, alpha_max: Alpha angle range
+        beta_min, beta_max: Beta angle range
+        gamma_min, gamma_max: Gamma angle range
+        step: Grid step size
+        workers: Number of worker processes
+        pose_chunks: Number of pose chunks per cable
+        cable_indices: Cables to analyze (default: all)
+
+    Returns:
+        valid_regions: Dict cable_index -> boolean mask on the cable's grid
+        grids: Dict cable_index -> (xGrid, yGrid, zGrid)
+        intervals: Dict cable_index -> ColumnIntervals ('raycast' mode, otherwise empty)
+        wall_time: Elapsed wall-clock time
+    """
+    t_start = time.time()
+    if cable_indices is None:
+        cable_indices = range(analyzer.num_cables)
+
+    pose_axes = analyzer.pose_grid_axes(alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max, step)
+    grids = {c: analyzer.spatial_grid(c, step) for c in cable_indices}
+    axes = {}
+    for c, g in grids.items():
+        # Cables on the shared global grid reference the same axes objects
+        shared = next((axes[d] for d in axes if grids[d] is g), None)
+        axes[c] = shared if shared is not None else (g[0][:, 0, 0], g[1][0, :, 0], g[2][0, 0, :])
+    chunks = split_range(count_poses(pose_axes), pose_chunks)
+    print(f"[DEBUG] Parallel analysis: {len(grids)} cables x {len(chunks)} pose chunks on {workers} workers")
+
+    blocks = {}
+    intervals = {}
+    try:
+        for c, g in grids.items():
+            for pose_start, _ in chunks:
+                blocks[(c, pose_start)] = shared_memory.SharedMemory(create=True, size=max(1, (g[0].size + 7) // 8))
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(analyzer.base_points, analyzer.ee_points,
+                                           analyzer.get_options(), axes, pose_axes)) as pool:
+            futures = [pool.submit(_analyze_task, c, pose_start, pose_stop, blocks[(c, pose_start)].name)
+                       for c in grids for pose_start, pose_stop in chunks]
+            for future in as_completed(futures):
+                cable_index, pose_start, chunk_intervals, task_time = future.result()
+                if chunk_intervals is not None:
+                    intervals[cable_index] = (chunk_intervals if cable_index not in intervals
+                                              else intervals[cable_index].intersect(chunk_intervals))
+                print(f"[TIME] Cable {cable_index+1}: poses from {pose_start} done in {task_time:.3f}s")
+
+        valid_regions = {}
+        for c, g in grids.items():
+            num_voxels = g[0].size
+            if not chunks:
+                valid_regions[c] = np.zeros(g[0].shape, dtype=bool)
+                continue
+            packed = np.full((num_voxels + 7) // 8, 0xFF, dtype=np.uint8)
+            for pose_start, _ in chunks:
+                packed &= np.ndarray(packed.shape, dtype=np.uint8, buffer=blocks[(c, pose_start)].buf)
+            valid_regions[c] = np.unpackbits(packed, count=num_voxels).astype(bool).reshape(g[0].shape)
+    finally:
+        for shm in blocks.values():
+            shm.close()
+            shm.unlink()
+
+    return valid_regions, grids, intervals, time.time() - t_start
+
+def analyze_single_cable_sharded(analyzer, cable_index, alpha_min, alpha_max, beta_min, beta_max,
+                                 gamma_min, gamma_max, step, workers, shards=None):
+    """
+    Analyze one cable by sharding its poses across a process pool.
+
+    Each worker computes the coefficients and the partial mask of one shard;
+    the partial masks are reduced with bitwise AND.
+
+    Args:
+        analyzer: Configured WorkspaceAnalyzer (robot config initialized)
+        cable_index: Index of the cable to analyze
+        alpha_min, alpha_max: Alpha angle range
+        beta_min, beta_max: Beta angle range
+        gamma_min, gamma_max: Gamma angle range
+        step: Grid step size
+        workers: Number of worker processes
+        shards: Number of pose shards (default: workers)
+
+    Returns:
+        validRegion: Boolean mask on the cable's grid
+        grid: (xGrid, yGrid, zGrid)
+        wall_time: Elapsed wall-clock time
+    """
+    valid_regions, grids, _, wall_time = analyze_cables_parallel(
+        analyzer, alpha_min, alpha_max, beta_min, beta_max, gamma_min, gamma_max, step,
+        workers, pose_chunks=shards or workers, cable_indices=[cable_index]
+    )
+    return valid_regions[cable_index], grids[cable_index], wall_time
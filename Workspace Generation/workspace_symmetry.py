@@ -0,0 +1,137 @@
+import itertools
+import numpy as np
+from spatial_model_sampling_rref_last_column_3_variables import rotation_and_s_matrices
+
+# Coordinates and rotation entries are compared after rounding to this quantum
+SYMMETRY_QUANTUM = 1e-9
+
+def signed_permutation_matrices():
+    """The 47 non-identity 3x3 signed permutation matrices (rotations and reflections of a cube)."""
+    matrices = []
+    for perm in itertools.permutations(range(3)):
+        for signs in itertools.product((1, -1), repeat=3):
+            L = np.zeros((3, 3))
+            L[range(3), perm] = signs
+            if not np.array_equal(L, np.eye(3)):
+                matrices.append(L)
+    return matrices
+
+def _key_set(values, quantum=SYMMETRY_QUANTUM):
+    """Set of quantized row keys of a 2D array."""
+    return {row.tobytes() for row in np.round(np.asarray(values, dtype=float) / quantum).astype(np.int64)}
+
+def match_points(points, mapped, tol=SYMMETRY_QUANTUM):
+    """
+    Permutation taking a point set onto its image.
+
+    Args:
+        points: Points (3, N)
+        mapped: Images of the points (3, N)
+        tol: Largest coordinate deviation of a match
+
+    Returns:
+        perm: Integer array with mapped[:, i] == points[:, perm[i]], or None
+              when the image is not a permutation of the points
+    """
+    distance = np.abs(mapped[:, :, None] - points[:, None, :]).max(axis=0)
+    perm = distance.argmin(axis=1)
+    if not (distance[np.arange(len(perm)), perm] <= tol).all() or len(set(perm)) != len(perm):
+        return None
+    return perm
+
+def find_symmetries(base_points, ee_points, pose_axes, tol=SYMMETRY_QUANTUM):
+    """
+    Rigid symmetries of the robot and its pose grid.
+
+    A candidate maps world points by x -> L x + t, with L a signed
+    permutation matrix and t chosen so that the base centroid is fixed. It
+    is a symmetry when it permutes the base points, the same permutation
+    relates the end-effector points (L b_i = b_perm[i], in the end-effector
+    frame), the grid positions map onto grid positions and every grid
+    orientation R maps onto a grid orientation L R L^T. The wrench
+    condition is invariant under such a map, so anchor a of cable i is
+    valid exactly when anchor L a + t of cable perm[i] is.
+
+    Args:
+        base_points: Base attachment points (3, num_cables)
+        ee_points: End-effector attachment points (3, num_cables)
+        pose_axes: Pose grid axes from create_pose_axes()
+        tol: Matching tolerance of points and rotation entries
+
+    Returns:
+        List of dicts with 'matrix' (L), 'offset' (t) and 'permutation' (perm)
+    """
+    base_points = np.asarray(base_points, dtype=float)
+    ee_points = np.asarray(ee_points, dtype=float)
+    positions, alphas, betas, gammas = pose_axes
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    orientations = np.stack(np.meshgrid(alphas, betas, gammas, indexing='ij'), axis=-1).reshape(-1, 3)
+    R, _ = rotation_and_s_matrices(np.column_stack((np.zeros((len(orientations), 3)), orientations)))
+    position_keys = _key_set(positions, tol)
+    rotation_keys = _key_set(R.reshape(-1, 9), tol)
+    centroid = base_points.mean(axis=1)
+
+    symmetries = []
+    for L in signed_permutation_matrices():
+        t = centroid - L @ centroid
+        perm = match_points(base_points, L @ base_points + t[:, None], tol)
+        if perm is None or not np.allclose(L @ ee_points, ee_points[:, perm], rtol=0, atol=tol):
+            continue
+        if not _key_set(positions @ L.T + t, tol) <= position_keys:
+            continue
+        if not _key_set((L @ R @ L.T).reshape(-1, 9), tol) <= rotation_keys:
+            continue
+        symmetries.append({'matrix': L, 'offset': t, 'permutation': perm})
+    return symmetries
+
+def plan_derivations(symmetries, num_cables):
+    """
+    Cables whose masks can be derived from an earlier, computed cable.
+
+    Args:
+        symmetries: Symmetries from find_symmetries()
+        num_cables: Number of cables
+
+    Returns:
+        Dict target cable -> (source cable, symmetry); the sources are computed
+    """
+    derived = {}
+    for target in range(num_cables):
+        for symmetry in symmetries:
+            source = int(np.flatnonzero(symmetry['permutation'] == target)[0])
+            if source < target and source not in derived:
+                derived[target] = (source, symmetry)
+                break
+    return derived
+
+def map_mask(mask, source_axes, target_axes, symmetry, tol=1e-6):
+    """
+    Mask of a target cable derived from the mask of its symmetric source cable.
+
+    Target voxel y is valid exactly when source voxel L^T (y - t) is. For a
+    signed permutation this is a transpose, flips and an index lookup per axis.
+
+    Args:
+        mask: Boolean source mask on source_axes
+        source_axes: Grid axes (x, y, z) of the source mask
+        target_axes: Grid axes (x, y, z) of the target grid
+        symmetry: Symmetry from find_symmetries() taking the source onto the target
+        tol: Largest deviation, in grid steps, of a preimage from a source voxel
+
+    Returns:
+        Boolean mask on target_axes, or None when a target voxel has no source voxel
+    """
+    L, t = symmetry['matrix'], symmetry['offset']
+    order = []
+    index = []
+    for d in range(3):
+        k = int(np.flatnonzero(L[d])[0])
+        axis = np.asarray(source_axes[k], dtype=float)
+        step = axis[1] - axis[0] if len(axis) > 1 else 1.0
+        position = (L[d, k] * (np.asarray(target_axes[d], dtype=float) - t[d]) - axis[0]) / step
+        nearest = np.round(position).astype(np.int64)
+        if (np.abs(position - nearest) > tol).any() or (nearest < 0).any() or (nearest >= len(axis)).any():
+            return None
+        order.append(k)
+        index.append(nearest)
+    return np.transpose(mask, order)[np.ix_(*index)]
@@ -15,6 +15,310 @@ def eval_poly(coeff, x, y, z):
             coeff[4]*x**2 + coeff[5]*y**2 + coeff[6]*z**2 +
             coeff[7]*x*y + coeff[8]*y*z + coeff[9]*z*x)
 
+def eval_poly_inplace(coeff, x, y, z, out, tmp):
+    """
+    Evaluate quadratic polynomial into a preallocated buffer.
+    
+    Performs the same operations in the same order as eval_poly (so results
+    are bit-identical) without allocating full-size temporaries.
+    
+    Args:
+        coeff: Coefficient array [a0, a1, a2, a3, a4, a5, a6, a7, a8, a9]
+        x, y, z: Grid coordinates
+        out: Output buffer with the shape of x
+        tmp: Scratch buffer with the shape of x
+    
+    Returns:
+        out
+    """
+    np.multiply(x, coeff[1], out=out)
+    out += coeff[0]
+    np.multiply(y, coeff[2], out=tmp)
+    out += tmp
+    np.multiply(z, coeff[3], out=tmp)
+    out += tmp
+    np.multiply(x, x, out=tmp)
+    tmp *= coeff[4]
+    out += tmp
+    np.multiply(y, y, out=tmp)
+    tmp *= coeff[5]
+    out += tmp
+    np.multiply(z, z, out=tmp)
+    tmp *= coeff[6]
+    out += tmp
+    np.multiply(x, coeff[7], out=tmp)
+    tmp *= y
+    out += tmp
+    np.multiply(y, coeff[8], out=tmp)
+    tmp *= z
+    out += tmp
+    np.multiply(z, coeff[9], out=tmp)
+    tmp *= x
+    out += tmp
+    return out
+
+def compute_valid_region_slab(coeff_stack, x, y, z, valid, scratch):
+    """
+    AND the sign test of every coefficient set into a slab of the valid region.
+    
+    All work happens in the caller's scratch buffers; results are identical to
+    the eval_poly based loop.
+    
+    Args:
+        coeff_stack: Coefficient matrices of shape (M, 10, 7)
+        x, y, z: Coordinates of the slab
+        valid: Boolean slab of the valid region, updated in place
+        scratch: Tuple (det, values, tmp, test) of buffers at least as large as the slab
+    """
+    det_buf, val_buf, tmp_buf, test_buf = (buf.reshape(-1)[:x.size].reshape(x.shape) for buf in scratch)
+    for coeffs in coeff_stack:
+        eval_poly_inplace(coeffs[:, -1], x, y, z, det_buf, tmp_buf)
+        np.sign(det_buf, out=det_buf)
+        for j in range(6):
+            eval_poly_inplace(coeffs[:, j], x, y, z, val_buf, tmp_buf)
+            val_buf *= det_buf
+            np.less(val_buf, 0, out=test_buf)
+            valid &= test_buf
+        if not valid.any():
+            break
+
+def compute_valid_points(coeff_stack, xs, ys, zs, memory_budget_mb=16):
+    """
+    Sign test of every coefficient set at scattered points.
+    
+    Points are processed in chunks with the slab kernel, so the results
+    equal those of the dense eval_poly loop at the same coordinates.
+    
+    Args:
+        coeff_stack: Coefficient matrices of shape (M, 10, 7)
+        xs, ys, zs: Point coordinates of shape (P,)
+        memory_budget_mb: Approximate memory limit for the scratch buffers
+    
+    Returns:
+        valid: Boolean array of shape (P,)
+    """
+    valid = np.ones(len(xs), dtype=bool)
+    points_per_chunk = max(1, int(memory_budget_mb * 2**20) // (8 * 6))
+    scratch = None
+    for p0 in range(0, len(xs), points_per_chunk):
+        p1 = min(p0 + points_per_chunk, len(xs))
+        if scratch is None:
+            n = p1 - p0
+            scratch = (np.empty(n), np.empty(n), np.empty(n), np.empty(n, dtype=bool))
+        compute_valid_region_slab(coeff_stack, xs[p0:p1], ys[p0:p1], zs[p0:p1], valid[p0:p1], scratch)
+    return valid
+
+def monomial_basis(x, y, z):
+    """
+    Build the quadratic monomial basis of a set of points.
+    
+    Args:
+        x, y, z: Point coordinates (any shape, flattened in C order)
+    
+    Returns:
+        basis: Array of shape (Npoints, 10) with columns
+               [1, x, y, z, x^2, y^2, z^2, xy, yz, zx] matching eval_poly
+    """
+    x, y, z = np.ravel(x), np.ravel(y), np.ravel(z)
+    return np.column_stack([
+        np.ones_like(x), x, y, z,
+        x**2, y**2, z**2,
+        x*y, y*z, z*x
+    ])
+
+def compute_valid_mask(basis, coeff_stack, memory_budget_mb=256):
+    """
+    Evaluate the sign test of many coefficient sets as chunked matrix products.
+    
+    A point is valid for a coefficient set when sign(det) * h_j < 0 for all six
+    constraint polynomials h_j; the result is the AND over all coefficient sets.
+    The basis rows and coefficient sets are processed in chunks so that the
+    (rows, sets, 7) block of polynomial values stays within the memory budget.
+    
+    Args:
+        basis: Monomial basis of shape (Npoints, 10)
+        coeff_stack: Coefficient matrices of shape (M, 10, 7)
+        memory_budget_mb: Approximate memory limit for one block of values
+    
+    Returns:
+        valid: Boolean array of shape (Npoints,)
+    """
+    coeff_stack = np.asarray(coeff_stack, dtype=float).reshape(-1, 10, 7)
+    num_points, num_sets = basis.shape[0], coeff_stack.shape[0]
+    valid = np.ones(num_points, dtype=bool)
+    if num_sets == 0 or num_points == 0:
+        return valid
+    
+    # All polynomials of all sets side by side: column 7*m + j is polynomial j of set m
+    C = coeff_stack.transpose(1, 0, 2).reshape(10, 7 * num_sets)
+    
+    # Values plus the sign-product temporary, 8 bytes each
+    budget_values = max(1, int(memory_budget_mb * 2**20) // 16)
+    sets_per_chunk = int(min(num_sets, max(1, budget_values // (7 * min(num_points, 4096)))))
+    rows_per_chunk = int(max(1, budget_values // (7 * sets_per_chunk)))
+    
+    for r0 in range(0, num_points, rows_per_chunk):
+        r1 = min(r0 + rows_per_chunk, num_points)
+        chunk_valid = valid[r0:r1]
+        for s0 in range(0, num_sets, sets_per_chunk):
+            s1 = min(s0 + sets_per_chunk, num_sets)
+            values = (basis[r0:r1] @ C[:, 7*s0:7*s1]).reshape(r1 - r0, s1 - s0, 7)
+            signed = np.sign(values[:, :, 6:]) * values[:, :, :6]
+            chunk_valid &= (signed < 0).all(axis=(1, 2))
+            if not chunk_valid.any():
+                break
+    
+    return valid
+
+def compute_valid_mask_mixed(basis32, coeff_stack, x, y, z, memory_budget_mb=16):
+    """
+    Evaluate the sign test in float32 and re-check only near-zero values in float64.
+    
+    The float32 values differ from the float64 eval_poly values by at most
+    bound_j = (32 u32 + 64 u64) * sum_k |c_kj| max|m_k| (u = unit roundoff,
+    m_k the monomials over the grid). Signs of values outside that band are
+    therefore the float64 signs; a (point, set) pair is re-evaluated with
+    eval_poly in float64 only when its decision depends on a value inside the
+    band, so the mask equals the full float64 loop.
+    
+    Args:
+        basis32: float32 monomial basis of shape (Npoints, 10)
+        coeff_stack: Coefficient matrices of shape (M, 10, 7)
+        x, y, z: float64 point coordinates (flattened in the basis row order)
+        memory_budget_mb: Approximate memory limit for one block of values
+    
+    Returns:
+        valid: Boolean array of shape (Npoints,)
+        num_rechecked: Number of (point, set) pairs re-evaluated in float64
+    """
+    coeff_stack = np.asarray(coeff_stack, dtype=float).reshape(-1, 10, 7)
+    x, y, z = np.ravel(x), np.ravel(y), np.ravel(z)
+    num_points, num_sets = basis32.shape[0], coeff_stack.shape[0]
+    valid = np.ones(num_points, dtype=bool)
+    num_rechecked = 0
+    if num_sets == 0 or num_points == 0:
+        return valid, num_rechecked
+    
+    C = coeff_stack.transpose(1, 0, 2).reshape(10, 7 * num_sets)
+    C32 = C.astype(np.float32)
+    gamma = 32 * np.finfo(np.float32).eps / 2 + 64 * np.finfo(float).eps / 2
+    max_monomial = np.abs(basis32).max(axis=0).astype(float) * (1 + np.finfo(np.float32).eps)
+    bound = (gamma * (max_monomial @ np.abs(C))).reshape(num_sets, 7)
+    # Rounded up when converted, so the float32 band contains the exact band
+    bound32 = np.nextafter(bound.astype(np.float32), np.float32(np.inf))
+    
+    # float32 values plus a few boolean temporaries
+    budget_values = max(1, int(memory_budget_mb * 2**20) // 8)
+    sets_per_chunk = int(min(num_sets, max(1, budget_values // (7 * min(num_points, 4096)))))
+    rows_per_chunk = int(max(1, budget_values // (7 * sets_per_chunk)))
+    
+    for r0 in range(0, num_points, rows_per_chunk):
+        r1 = min(r0 + rows_per_chunk, num_points)
+        chunk_valid = valid[r0:r1]
+        for s0 in range(0, num_sets, sets_per_chunk):
+            s1 = min(s0 + sets_per_chunk, num_sets)
+            values = (basis32[r0:r1] @ C32[:, 7*s0:7*s1]).reshape(r1 - r0, s1 - s0, 7)
+            # A pair is certainly invalid when |det| > bound_det and sign(det) * h_j > bound_j
+            # for some j, and certainly valid when sign(det) * h_j < -bound_j for all j
+            det_certain = np.abs(values[:, :, 6]) > bound32[s0:s1, 6]
+            signed = np.sign(values[:, :, 6:]) * values[:, :, :6]
+            invalid = signed > bound32[s0:s1, :6]
+            invalid &= det_certain[:, :, None]
+            chunk_valid &= ~invalid.any(axis=(1, 2))
+            
+            # float64 re-check of the undecided pairs of points that are still valid
+            live = np.flatnonzero(chunk_valid)
+            certain = (signed[live] < -bound32[s0:s1, :6]).all(axis=2) & det_certain[live]
+            rows, sets = np.nonzero(~certain)
+            if len(rows):
+                rows = live[rows]
+                num_rechecked += len(rows)
+                coeffs = coeff_stack[s0 + sets].transpose(1, 2, 0)
+                px, py, pz = x[r0 + rows], y[r0 + rows], z[r0 + rows]
+                det_sign = np.sign(eval_poly(coeffs[:, 6], px, py, pz))
+                ok = np.ones(len(rows), dtype=bool)
+                for j in range(6):
+                    ok &= (det_sign * eval_poly(coeffs[:, j], px, py, pz) < 0)
+                chunk_valid[rows[~ok]] = False
+            if not chunk_valid.any():
+                break
+    
+    return valid, num_rechecked
+
+def compute_valid_mask_active_set(basis, coeff_stack, patience=None, unchanged=0):
+    """
+    Evaluate the sign test only on points that are still valid.
+    
+    The basis rows of the surviving points are compacted after every
+    coefficient set, so later sets are evaluated on a shrinking active set;
+    the loop stops as soon as no point survives.
+    
+    Args:
+        basis: Monomial basis of shape (Npoints, 10)
+        coeff_stack: Coefficient matrices of shape (M, 10, 7)
+        patience: Stop after this many consecutive sets that remove no point
+                  (None evaluates every set, which keeps the result exact)
+        unchanged: Number of consecutive sets without removals before this call
+                   (continues the patience count of a previous call)
+    
+    Returns:
+        valid: Boolean array of shape (Npoints,)
+        num_evaluated: Number of coefficient sets evaluated before termination
+        unchanged: Number of consecutive sets without removals at termination
+    """
+    coeff_stack = np.asarray(coeff_stack, dtype=float).reshape(-1, 10, 7)
+    active = np.arange(basis.shape[0])
+    active_basis = basis
+    num_evaluated = 0
+    
+    for coeffs in coeff_stack:
+        if active.size == 0 or (patience is not None and unchanged >= patience):
+            break
+        values = active_basis @ coeffs
+        keep = (np.sign(values[:, 6:]) * values[:, :6] < 0).all(axis=1)
+        num_evaluated += 1
+        if keep.all():
+            unchanged += 1
+        else:
+            unchanged = 0
+            active = active[keep]
+            active_basis = active_basis[keep]
+    
+    valid = np.zeros(basis.shape[0], dtype=bool)
+    valid[active] = True
+    return valid, num_evaluated, unchanged
+
+def rank_coefficient_sets(basis, coeff_stack, memory_budget_mb=16):
+    """
+    Order coefficient sets from most to least restrictive.
+    
+    Each set is evaluated independently on the given (typically coarse) basis
+    and the sets are sorted by the number of points they eliminate.
+    
+    Args:
+        basis: Monomial basis of shape (Npoints, 10)
+        coeff_stack: Coefficient matrices of shape (M, 10, 7)
+        memory_budget_mb: Approximate memory limit for one block of values
+    
+    Returns:
+        order: Indices of the coefficient sets, most restrictive first
+        eliminated: Number of eliminated points for each set (in original order)
+    """
+    coeff_stack = np.asarray(coeff_stack, dtype=float).reshape(-1, 10, 7)
+    num_points, num_sets = basis.shape[0], coeff_stack.shape[0]
+    eliminated = np.zeros(num_sets, dtype=np.int64)
+    sets_per_chunk = int(max(1, (memory_budget_mb * 2**20) // (16 * 7 * max(num_points, 1))))
+    
+    for s0 in range(0, num_sets, sets_per_chunk):
+        s1 = min(s0 + sets_per_chunk, num_sets)
+        C = coeff_stack[s0:s1].transpose(1, 0, 2).reshape(10, 7 * (s1 - s0))
+        values = (basis @ C).reshape(num_points, s1 - s0, 7)
+        valid = (np.sign(values[:, :, 6:]) * values[:, :, :6] < 0).all(axis=2)
+        eliminated[s0:s1] = num_points - valid.sum(axis=0)
+    
+    order = np.argsort(-eliminated, kind='stable')
+    return order, eliminated
+
 def create_parameter_grid(alpha_min, alpha_max, beta_min, beta_max, 
                          gamma_min, gamma_max, step):
     """
@@ -33,14 +337,8 @@ def create_parameter_grid(alpha_min, alpha_max, beta_min, beta_max,
     betas = np.arange(beta_min, beta_max + step, step)
     gammas = np.arange(gamma_min, gamma_max + step, step)
     
-    # Create all combinations
-    param_combinations = []
-    for alpha in alphas:
-        for beta in betas:
-            for gamma in gammas:
-                param_combinations.append([alpha, beta, gamma])
-    
-    return param_combinations
+    # All combinations, gamma fastest
+    return np.stack(np.meshgrid(alphas, betas, gammas, indexing='ij'), axis=-1).reshape(-1, 3).tolist()
 
 def create_position_grid():
     """
@@ -53,36 +351,105 @@ def create_position_grid():
     q2_values = np.arange(0.4, 0.6 + 0.01, 0.2)
     q3_values = np.arange(0.4, 0.6 + 0.01, 0.2)
     
-    position_combinations = []
-    for q1 in q1_values:
-        for q2 in q2_values:
-            for q3 in q3_values:
-                position_combinations.append([q1, q2, q3])
+    # All combinations, q3 fastest
+    return np.stack(np.meshgrid(q1_values, q2_values, q3_values, indexing='ij'), axis=-1).reshape(-1, 3).tolist()
+
+def create_pose_axes(positions, alpha_min, alpha_max, beta_min, beta_max,
+                     gamma_min, gamma_max, step):
+    """
+    Axes of the pose grid without enumerating the combinations.
     
-    return position_combinations
+    Args:
+        positions: End-effector positions, e.g. from create_position_grid()
+        alpha_min, alpha_max: Alpha angle range
+        beta_min, beta_max: Beta angle range
+        gamma_min, gamma_max: Gamma angle range
+        step: Step size for grid
+    
+    Returns:
+        Tuple (positions, alphas, betas, gammas); positions has shape (P, 3),
+        the angle axes are those of create_parameter_grid()
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    alphas = np.arange(alpha_min, alpha_max + step, step)
+    betas = np.arange(beta_min, beta_max + step, step)
+    gammas = np.arange(gamma_min, gamma_max + step, step)
+    return positions, alphas, betas, gammas
+
+def count_poses(pose_axes):
+    """Number of poses of the grid described by create_pose_axes()."""
+    positions, alphas, betas, gammas = pose_axes
+    return len(positions) * len(alphas) * len(betas) * len(gammas)
 
-def compute_intersection_points(all_points):
+def pose_batch(pose_axes, start, stop):
     """
-    Compute intersection of multiple point sets.
+    Poses with flat indices [start, stop) of the pose grid.
+    
+    The flat order matches stacking the positions (outermost) with
+    create_parameter_grid(), so any range can be generated independently.
     
     Args:
-        all_points: List of point arrays
+        pose_axes: Tuple returned by create_pose_axes()
+        start, stop: Flat pose index range
     
     Returns:
-        Intersection points array
+        poses: Array of shape (stop - start, 6)
+    """
+    positions, alphas, betas, gammas = pose_axes
+    p, a, b, g = np.unravel_index(np.arange(start, stop),
+                                  (len(positions), len(alphas), len(betas), len(gammas)))
+    return np.column_stack((positions[p], alphas[a], betas[b], gammas[g]))
+
+def iter_pose_batches(pose_axes, batch_size, start=0, stop=None):
     """
-    if not all_points:
-        return np.empty((0, 3))
+    Yield the poses of the grid in vectorized batches.
     
-    intersection = all_points[0]
-    for pts in all_points[1:]:
-        if len(intersection) == 0 or len(pts) == 0:
-            intersection = np.empty((0, 3))
-            break
-        
-        dtype = [('x', float), ('y', float), ('z', float)]
-        intersection_view = intersection.view(dtype)
-        pts_view = pts.view(dtype)
-        intersection = np.intersect1d(intersection_view, pts_view).view(float).reshape(-1, 3)
+    Only one batch is held in memory at a time, however fine the orientation step.
+    
+    Args:
+        pose_axes: Tuple returned by create_pose_axes()
+        batch_size: Maximum number of poses per batch
+        start, stop: Flat pose index range (default: all poses)
+    
+    Yields:
+        poses: Arrays of shape (B, 6) with B <= batch_size
+    """
+    if stop is None:
+        stop = count_poses(pose_axes)
+    for batch_start in range(start, stop, batch_size):
+        yield pose_batch(pose_axes, batch_start, min(batch_start + batch_size, stop))
+
+def pose_grid_difference(new_axes, old_axes, quantum=1e-9):
+    """
+    Poses of a pose grid that are missing from a previous pose grid.
+    
+    The difference of two product grids is split into disjoint product
+    grids: new positions with all new angles, then old positions with new
+    alphas, and so on down to new gammas.
+    
+    Args:
+        new_axes: Pose grid axes from create_pose_axes()
+        old_axes: Pose grid axes of the previous run
+        quantum: Resolution used to compare axis values
+    
+    Returns:
+        List of pose grid axes covering the additional poses (empty when the
+        grids are equal), or None when the new grid does not contain every
+        old pose
+    """
+    inside = []
+    for new, old in zip(new_axes, old_axes):
+        new_keys = np.round(np.asarray(new, dtype=float).reshape(len(new), -1) / quantum).astype(np.int64)
+        old_keys = np.round(np.asarray(old, dtype=float).reshape(len(old), -1) / quantum).astype(np.int64)
+        in_old = (new_keys[:, None, :] == old_keys[None, :, :]).all(axis=2).any(axis=1)
+        if in_old.sum() != len(old_keys):
+            return None
+        inside.append(in_old)
     
-    return intersection 
\ No newline at end of file
+    pieces = []
+    for d in range(len(new_axes)):
+        piece = tuple(axis[inside[k]] if k < d else axis[~inside[k]] if k == d else axis
+                      for k, axis in enumerate(new_axes))
+        if count_poses(piece):
+            pieces.append(piece)
+    return pieces
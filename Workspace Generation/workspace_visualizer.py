@@ -135,6 +135,44 @@ class WorkspaceVisualizer:
         plt.tight_layout()
         return fig, ax
     
+    def plot_interval_boundaries(self, column_intervals, title="Workspace Boundary (Exact Column Intervals)"):
+        """
+        Plot the exact boundary points of the column intervals of each cable.
+        
+        Args:
+            column_intervals: Dict or list of ColumnIntervals per cable
+                (e.g. WorkspaceAnalyzer.column_intervals after a 'raycast' run)
+            title: Plot title
+        """
+        if isinstance(column_intervals, dict):
+            items = sorted(column_intervals.items())
+        else:
+            items = list(enumerate(column_intervals))
+        if not items:
+            print("[WARNING] No column intervals to plot")
+            return None
+        
+        if self.colors is None:
+            self.setup_colors(max(index for index, _ in items) + 1)
+        
+        fig = plt.figure(figsize=(10, 8))
+        ax = fig.add_subplot(111, projection='3d')
+        
+        for i, intervals in items:
+            if intervals is not None and intervals.num_runs > 0:
+                pts = intervals.boundary_points()
+                ax.scatter(pts[:,0], pts[:,1], pts[:,2], 
+                          c=[self.colors[i]], alpha=0.6, s=1, label=f'Cable {i+1}')
+        
+        ax.set_xlabel('X')
+        ax.set_ylabel('Y')
+        ax.set_zlabel('Z')
+        ax.set_title(title)
+        ax.legend()
+        
+        plt.tight_layout()
+        return fig, ax
+    
     def show_plot(self):
         """Display the current plot."""
         plt.show() 
\ No newline at end of file